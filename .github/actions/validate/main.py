@@ -1,18 +1,135 @@
 """Validate schema files against OWASP JSON schema."""
 
+import os
+import subprocess
 import sys
-from pathlib import Path
+from pathlib import Path, PurePosixPath
 
-import yaml
-
-from owasp_schema import get_schema
-from owasp_schema.utils.schema_validators import validate_data
+from owasp_schema import get_schema, list_schemas
 
+BASE_REF_ENV = "INPUT_BASE_REF"
+DELETED_STATUS = "D"
+# Number of worker processes for changed files validation, all cores if None.
+JOBS = None
+SCHEMA_DIRECTORY_ENV = "INPUT_SCHEMA_DIRECTORY"
 WORKSPACE_PATH = Path("/github/workspace")
 
 
+def get_changed_files(base_ref):
+    """List files changed since the merge base of base ref and HEAD.
+
+    Args:
+        base_ref: Git ref to compare against, e.g. `origin/main`
+
+    Returns:
+        List of (status, path) tuples, renamed and copied files are
+        reported with their new path
+
+    Raises:
+        subprocess.CalledProcessError: If git fails, e.g. on an unknown ref
+
+    """
+    output = subprocess.run(  # noqa: S603
+        [  # noqa: S607
+            "git",
+            "-c",
+            "safe.directory=*",
+            "diff",
+            "--name-status",
+            "-z",
+            f"{base_ref}...HEAD",
+        ],
+        capture_output=True,
+        check=True,
+        cwd=WORKSPACE_PATH,
+        text=True,
+    ).stdout
+
+    changed_files = []
+    fields = iter(output.split("\0"))
+    for status in fields:
+        if not status:
+            continue
+        path = next(fields)
+        if status[0] in "CR":
+            path = next(fields)
+        changed_files.append((status[0], path))
+
+    return changed_files
+
+
+def is_schema_file(path, schema_directory=""):
+    """Check whether the path is an OWASP schema file in the schema directory.
+
+    Args:
+        path: Path relative to the workspace, e.g. `schema/project.json`
+        schema_directory: Schema files directory relative to the workspace, the
+            workspace root if empty
+
+    Returns:
+        True if the path is a schema file, e.g. not `docs/project.json`
+
+    """
+    path = PurePosixPath(path)
+    return path.parent == PurePosixPath(schema_directory) and path.name in {
+        f"{schema_name}.json" for schema_name in list_schemas()
+    }
+
+
+def validate_changed_files(base_ref):
+    """Validate OWASP metadata files changed since the base ref."""
+    from owasp_schema.utils.bulk_validation import (  # noqa: PLC0415
+        METADATA_FILE_GLOB,
+        validate_files,
+    )
+
+    sys.stdout.write(f"INFO: Checking OWASP metadata files changed since '{base_ref}'.\n")
+
+    try:
+        changed_files = get_changed_files(base_ref)
+    except subprocess.CalledProcessError as e:
+        sys.stderr.write(f"ERROR: Could not list changed files. {e.stderr.strip()}\n")
+        sys.exit(1)
+
+    schema_directory = os.environ.get(SCHEMA_DIRECTORY_ENV, "").strip()
+    if any(is_schema_file(path, schema_directory) for _, path in changed_files):
+        sys.stdout.write("INFO: Schema files changed. Validating all OWASP metadata files.\n")
+        paths = [WORKSPACE_PATH]
+    else:
+        paths = [
+            WORKSPACE_PATH / path
+            for status, path in changed_files
+            if status != DELETED_STATUS and Path(path).match(METADATA_FILE_GLOB)
+        ]
+
+    if not paths:
+        sys.stdout.write("INFO: No changed OWASP metadata files found.\n")
+        sys.exit(0)
+
+    failed = False
+    for result in validate_files(paths, jobs=JOBS):
+        file_path = Path(result.path).relative_to(WORKSPACE_PATH)
+        if result.is_valid:
+            sys.stdout.write(f"SUCCESS: Validation passed for '{file_path}'!\n")
+        else:
+            failed = True
+            sys.stderr.write(f"ERROR: Validation failed for '{file_path}'! {result.error}\n")
+
+    sys.exit(1 if failed else 0)
+
+
 def main():
-    """Automatically finds and validates an OWASP metadata file."""
+    """Automatically finds and validates an OWASP metadata file.
+
+    If the `base_ref` input is set only metadata files changed since the base
+    ref are validated.
+
+    YAML and validation are imported once a metadata file is found, runs
+    exiting early don't pay for them.
+    """
+    if base_ref := os.environ.get(BASE_REF_ENV, "").strip():
+        validate_changed_files(base_ref)
+
     sys.stdout.write("INFO: Checking for OWASP metadata file.\n")
 
     metadata_files = list(WORKSPACE_PATH.glob("*.owasp.yaml"))
@@ -33,6 +150,10 @@ def main():
         f"INFO: Found '{file_name}'. Validating against the '{schema_name}' schema.\n",
     )
 
+    import yaml  # noqa: PLC0415
+
+    from owasp_schema.utils.schema_validators import validate_data  # noqa: PLC0415
+
     try:
         with file_path.open("r") as f:
             data = yaml.safe_load(f)
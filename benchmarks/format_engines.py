@@ -0,0 +1,56 @@
+"""Benchmark format check engines.
+
+Times every format profile on the `uri` and `email` values found in the test
+fixtures. Run with `python -m benchmarks.format_engines`.
+"""
+
+import argparse
+import re
+import sys
+import timeit
+from pathlib import Path
+
+from owasp_schema.utils.format_engines import get_format_checker, list_format_profiles
+
+TESTS_DATA_DIR = Path(__file__).resolve().parent.parent / "tests/data"
+
+EMAIL_CANDIDATE_REGEX = re.compile(r"[^\s'\"]+@[^\s'\"]+")
+URI_CANDIDATE_REGEX = re.compile(r"(?:https?|ftp)://[^\s'\"]*")
+
+
+def collect_values() -> dict[str, list[str]]:
+    """Collect distinct email and URI values from the test fixtures."""
+    values: dict[str, set[str]] = {"email": set(), "uri": set()}
+    for path in TESTS_DATA_DIR.rglob("*.yaml"):
+        text = path.read_text()
+        values["email"].update(EMAIL_CANDIDATE_REGEX.findall(text))
+        values["uri"].update(URI_CANDIDATE_REGEX.findall(text))
+    return {format_name: sorted(found) for format_name, found in values.items()}
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--number", default=200, help="Passes over the values.", type=int)
+    args = parser.parse_args(argv)
+
+    values = collect_values()
+    sys.stdout.write(f"{'profile':<10}{'format':<8}{'checks':>8}{'us/check':>12}\n")
+    for profile in list_format_profiles():
+        format_checker = get_format_checker(profile)
+        for format_name, format_values in values.items():
+
+            def run(format_checker=format_checker, format_name=format_name, values=format_values):
+                for value in values:
+                    format_checker.conforms(value, format_name)
+
+            checks = len(format_values) * args.number
+            elapsed = timeit.timeit(run, number=args.number)
+            sys.stdout.write(
+                f"{profile:<10}{format_name:<8}{checks:>8}{elapsed / checks * 1e6:>12.2f}\n",
+            )
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,209 @@
+"""Measure memory use of validation.
+
+Reports peak and retained traced memory for importing the package, loading
+schemas, validating single documents and bulk validation at several document
+sizes, along with the top allocating packages. YAML documents are measured
+both loaded then validated and validated from the parse event stream. Run with
+`python -m benchmarks.memory`.
+"""
+
+import argparse
+import gc
+import json
+import subprocess
+import sys
+import tempfile
+import tracemalloc
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+
+import yaml
+
+from owasp_schema import get_schema
+from owasp_schema.utils.bulk_validation import validate_files, warm_validators
+from owasp_schema.utils.schema_validators import validate_data
+from owasp_schema.utils.stream_validation import validate_stream
+
+DOCUMENT_SIZES = (10, 100, 1000)
+TOP_PACKAGES = 8
+
+# Cold start scenarios run in a fresh interpreter, the import system and caches
+# would otherwise be already populated.
+IMPORT_CODE = "import owasp_schema"
+SCHEMA_LOADING_CODE = (
+    "from owasp_schema.utils.bulk_validation import warm_validators; warm_validators()"
+)
+SUBPROCESS_CODE = """
+import json, tracemalloc
+tracemalloc.start()
+{code}
+current, peak = tracemalloc.get_traced_memory()
+print(json.dumps({{"peak": peak, "retained": current}}))
+"""
+
+
+@dataclass(frozen=True)
+class MemoryUsage:
+    """Traced memory of a measured call, in bytes."""
+
+    peak: int
+    retained: int
+    top: tuple[tuple[str, int], ...] = ()
+
+
+def _package(filename: str) -> str:
+    parts = Path(filename).parts
+    for marker in ("site-packages", "owasp_schema"):
+        if marker in parts:
+            index = parts.index(marker)
+            return parts[index] if marker == "owasp_schema" else parts[index + 1]
+    return Path(filename).stem
+
+
+def measure(function: Callable[[], object], *, top: bool = False) -> MemoryUsage:
+    """Measure peak and retained memory of a call.
+
+    Retained memory is what is still allocated after the result is discarded
+    and garbage is collected, e.g. caches populated or leaked objects.
+
+    Args:
+        function: Function to call without arguments
+        top: Whether to attribute retained memory to top level packages
+
+    Returns:
+        The memory usage
+
+    """
+    gc.collect()
+    was_tracing = tracemalloc.is_tracing()
+    if was_tracing:
+        tracemalloc.stop()
+    tracemalloc.start()
+    try:
+        function()
+        gc.collect()
+        retained, peak = tracemalloc.get_traced_memory()
+        snapshot = tracemalloc.take_snapshot() if top else None
+    finally:
+        tracemalloc.stop()
+        if was_tracing:
+            tracemalloc.start()
+
+    packages: dict[str, int] = {}
+    if snapshot is not None:
+        for statistic in snapshot.statistics("filename"):
+            package = _package(statistic.traceback[0].filename)
+            packages[package] = packages.get(package, 0) + statistic.size
+
+    return MemoryUsage(
+        peak=peak,
+        retained=retained,
+        top=tuple(sorted(packages.items(), key=lambda item: -item[1])[:TOP_PACKAGES]),
+    )
+
+
+def measure_cold(code: str) -> MemoryUsage:
+    """Measure memory of code run in a fresh interpreter."""
+    output = subprocess.run(  # noqa: S603
+        [sys.executable, "-c", SUBPROCESS_CODE.format(code=code)],
+        capture_output=True,
+        check=True,
+        text=True,
+    ).stdout
+    return MemoryUsage(**json.loads(output))
+
+
+def make_project(size: int) -> dict:
+    """Make a valid project document with `size` entries per list property."""
+    return {
+        "audience": ["breaker", "builder", "defender"],
+        "leaders": [{"github": f"leader-{index}", "name": "Leader"} for index in range(size)],
+        "level": 3,
+        "name": "Memory benchmark project",
+        "pitch": "A project measuring validation memory use.",
+        "repositories": [
+            {"url": f"https://github.com/owasp/repository-{index}"} for index in range(size)
+        ],
+        "tags": [f"tag-{index}" for index in range(max(size, 3))],
+        "type": "tool",
+    }
+
+
+def write_corpus(directory: Path, files: int, size: int) -> Path:
+    """Write `files` project metadata files with `size` entries per list."""
+    content = yaml.safe_dump(make_project(size))
+    for index in range(files):
+        path = directory / f"project-{index}" / "project.owasp.yaml"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content)
+    return directory
+
+
+def measure_validation(size: int, *, top: bool = False) -> MemoryUsage:
+    """Measure validating a single project document of the size."""
+    warm_validators()
+    schema = get_schema("project")
+    data = make_project(size)
+    return measure(lambda: validate_data(schema, data), top=top)
+
+
+def measure_yaml_validation(size: int, *, stream: bool = False, top: bool = False) -> MemoryUsage:
+    """Measure validating a project YAML document of the size.
+
+    The document is either loaded then validated or validated while parsed.
+    """
+    warm_validators()
+    schema = get_schema("project")
+    content = yaml.safe_dump(make_project(size))
+    if stream:
+        return measure(lambda: validate_stream(schema, content), top=top)
+    return measure(lambda: validate_data(schema, yaml.safe_load(content)), top=top)
+
+
+def measure_bulk_validation(directory: Path, *, top: bool = False) -> MemoryUsage:
+    """Measure sequential bulk validation of a directory."""
+    warm_validators()
+
+    def run() -> None:
+        for result in validate_files([directory]):
+            assert result.is_valid, result.error
+
+    return measure(run, top=top)
+
+
+def _format(name: str, usage: MemoryUsage) -> str:
+    line = f"{name:<28}{usage.peak / 1024:>12.1f}{usage.retained / 1024:>14.1f}\n"
+    for package, size in usage.top:
+        line += f"{'':<4}{package:<24}{'':>12}{size / 1024:>14.1f}\n"
+    return line
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--files", default=100, help="Files per bulk validation.", type=int)
+    parser.add_argument("--top", action="store_true", help="Show top allocating packages.")
+    args = parser.parse_args(argv)
+
+    sys.stdout.write(f"{'scenario':<28}{'peak KiB':>12}{'retained KiB':>14}\n")
+    sys.stdout.write(_format("import", measure_cold(IMPORT_CODE)))
+    sys.stdout.write(_format("schema loading", measure_cold(SCHEMA_LOADING_CODE)))
+    for size in DOCUMENT_SIZES:
+        sys.stdout.write(_format(f"validate size={size}", measure_validation(size, top=args.top)))
+    for size in DOCUMENT_SIZES:
+        usage = measure_yaml_validation(size, top=args.top)
+        sys.stdout.write(_format(f"load+validate size={size}", usage))
+        usage = measure_yaml_validation(size, stream=True, top=args.top)
+        sys.stdout.write(_format(f"stream validate size={size}", usage))
+
+    for size in DOCUMENT_SIZES[:2]:
+        with tempfile.TemporaryDirectory() as directory:
+            corpus = write_corpus(Path(directory), args.files, size)
+            usage = measure_bulk_validation(corpus, top=args.top)
+        sys.stdout.write(_format(f"bulk files={args.files} size={size}", usage))
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
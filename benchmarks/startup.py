@@ -0,0 +1,86 @@
+"""Measure cold start import times.
+
+Runs each scenario in a fresh interpreter with `-X importtime` and reports the
+cumulative import time of the measured module along with the heavy
+dependencies it loaded. Heavy dependencies are meant to load on first use,
+e.g. when the first validator is built. Run with `python -m benchmarks.startup`.
+"""
+
+import argparse
+import subprocess
+import sys
+from dataclasses import dataclass
+
+# Dependencies only loaded when validating, serving metrics or running async.
+HEAVY_MODULES = (
+    "asyncio",
+    "http.server",
+    "jsonschema",
+    "referencing",
+    "sqlite3",
+    "validators",
+    "yaml",
+)
+IMPORTTIME_PREFIX = "import time:"
+# Scenario name to code and measured module.
+SCENARIOS = {
+    "list schemas": ("import owasp_schema; owasp_schema.list_schemas()", "owasp_schema"),
+    "schema validators": (
+        "import owasp_schema.utils.schema_validators",
+        "owasp_schema.utils.schema_validators",
+    ),
+    "action": ("import actions.validate.main", "actions.validate.main"),
+    "cli": ("import owasp_schema.cli", "owasp_schema.cli"),
+}
+
+
+@dataclass(frozen=True)
+class ImportTimes:
+    """Cumulative import time of each module imported by code, in microseconds."""
+
+    modules: dict[str, int]
+
+    def imported(self, module: str) -> bool:
+        """Whether the module was imported."""
+        return module in self.modules
+
+    def heavy_modules(self) -> list[str]:
+        """List the heavy dependencies imported."""
+        return [module for module in HEAVY_MODULES if self.imported(module)]
+
+
+def measure_import_time(code: str) -> ImportTimes:
+    """Measure import times of code run in a fresh interpreter."""
+    output = subprocess.run(  # noqa: S603
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        check=True,
+        text=True,
+    ).stderr
+
+    modules = {}
+    for line in output.splitlines():
+        if not line.startswith(IMPORTTIME_PREFIX):
+            continue
+        _, cumulative, module = line.removeprefix(IMPORTTIME_PREFIX).split("|")
+        if cumulative.strip().isdigit():
+            modules[module.strip()] = int(cumulative)
+    return ImportTimes(modules)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.parse_args(argv)
+
+    sys.stdout.write(f"{'scenario':<20}{'ms':>8}  heavy modules\n")
+    for name, (code, module) in SCENARIOS.items():
+        times = measure_import_time(code)
+        milliseconds = times.modules[module] / 1000
+        heavy_modules = ", ".join(times.heavy_modules()) or "-"
+        sys.stdout.write(f"{name:<20}{milliseconds:>8.1f}  {heavy_modules}\n")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,78 @@
+"""Benchmark multi-threaded validation throughput.
+
+Validates the same set of project documents from an increasing number of
+threads sharing the compiled validators and reports documents per second along
+with the speedup over a single thread. Validation only scales with threads on
+free-threaded CPython builds, e.g. `python3.13t`. Run with
+`python -m benchmarks.threads`.
+"""
+
+import argparse
+import sys
+import sysconfig
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from benchmarks.memory import make_project
+from owasp_schema import get_schema
+from owasp_schema.utils.bulk_validation import warm_validators
+from owasp_schema.utils.format_engines import FAST
+from owasp_schema.utils.schema_validators import validate_data
+
+THREAD_COUNTS = (1, 2, 4, 8)
+
+
+def is_free_threaded() -> bool:
+    """Whether the interpreter runs without the GIL."""
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+    return bool(sysconfig.get_config_var("Py_GIL_DISABLED")) and not (
+        is_gil_enabled and is_gil_enabled()
+    )
+
+
+def measure_throughput(threads: int, documents: int, size: int) -> float:
+    """Measure documents validated per second by the number of threads.
+
+    Each thread validates `documents` project documents of the size.
+    """
+    warm_validators(FAST)
+    schema = get_schema("project")
+    data = [make_project(size) for _ in range(threads)]
+    barrier = threading.Barrier(threads + 1)
+
+    def run(index: int) -> None:
+        barrier.wait()
+        for _ in range(documents):
+            validate_data(schema, data[index], format_profile=FAST)
+
+    with ThreadPoolExecutor(threads) as executor:
+        futures = [executor.submit(run, index) for index in range(threads)]
+        barrier.wait()
+        start = time.perf_counter()
+        for future in futures:
+            future.result()
+        elapsed = time.perf_counter() - start
+
+    return threads * documents / elapsed
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--documents", default=500, help="Documents per thread.", type=int)
+    parser.add_argument("--size", default=10, help="Entries per list property.", type=int)
+    args = parser.parse_args(argv)
+
+    sys.stdout.write(f"free-threaded: {is_free_threaded()}\n")
+    sys.stdout.write(f"{'threads':<10}{'docs/s':>12}{'speedup':>10}\n")
+    baseline = None
+    for threads in THREAD_COUNTS:
+        throughput = measure_throughput(threads, args.documents, args.size)
+        baseline = baseline or throughput
+        sys.stdout.write(f"{threads:<10}{throughput:>12.0f}{throughput / baseline:>10.2f}\n")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,84 @@
+"""Benchmark worker process startup.
+
+Compares worker pools spawning fresh interpreters, each importing the package
+and compiling validators, with `prefork_pool` forking warmed up workers.
+Reports the time until every worker validated a document and the private
+memory of each worker, i.e. pages not shared with the parent (Linux only). Run
+with `python -m benchmarks.workers`.
+"""
+
+import argparse
+import multiprocessing
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from benchmarks.memory import make_project
+from owasp_schema import get_schema
+from owasp_schema.utils.bulk_validation import warm_validators
+from owasp_schema.utils.format_engines import FAST
+from owasp_schema.utils.schema_validators import validate_data
+from owasp_schema.utils.worker_pool import prefork_pool
+
+KIB = 1024
+PRIVATE_FIELDS = ("Private_Clean:", "Private_Dirty:")
+SMAPS_ROLLUP = Path("/proc/self/smaps_rollup")
+# Seconds each task holds its worker so every worker gets one.
+TASK_SECONDS = 0.2
+
+
+def private_memory() -> int | None:
+    """Get the memory of the process not shared with others, in bytes."""
+    if not SMAPS_ROLLUP.exists():
+        return None
+    return KIB * sum(
+        int(line.split()[1])
+        for line in SMAPS_ROLLUP.read_text().splitlines()
+        if line.startswith(PRIVATE_FIELDS)
+    )
+
+
+def _validate(_index: int) -> tuple[int, int | None]:
+    validate_data(get_schema("project"), make_project(10), format_profile=FAST)
+    time.sleep(TASK_SECONDS)
+    return os.getpid(), private_memory()
+
+
+def measure(executor: ProcessPoolExecutor, workers: int) -> tuple[float, int | None]:
+    """Measure seconds until all workers validated and their mean private memory."""
+    start = time.perf_counter()
+    usage = dict(executor.map(_validate, range(workers)))
+    elapsed = time.perf_counter() - start - TASK_SECONDS
+
+    memory = [value for value in usage.values() if value is not None]
+    return elapsed, sum(memory) // len(memory) if memory else None
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--workers", default=4, help="Number of worker processes.", type=int)
+    args = parser.parse_args(argv)
+
+    spawn = ProcessPoolExecutor(
+        max_workers=args.workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=warm_validators,
+        initargs=(FAST,),
+    )
+    with spawn as executor:
+        results = {"spawn": measure(executor, args.workers)}
+    with prefork_pool(args.workers, warm_validators, (FAST,)) as executor:
+        results["prefork"] = measure(executor, args.workers)
+
+    sys.stdout.write(f"{'pool':<10}{'startup ms':>12}{'private MiB':>14}\n")
+    for name, (elapsed, memory) in results.items():
+        private = "-" if memory is None else f"{memory / KIB / KIB:.1f}"
+        sys.stdout.write(f"{name:<10}{elapsed * 1000:>12.1f}{private:>14}\n")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -3,29 +3,71 @@
 This package provides JSON schemas for OWASP projects.
 """
 
-import importlib.resources
 import json
+import threading
+import time
 from typing import Any
 
 __version__ = "0.1.14"
 __author__ = "Arkadii Yakovets <arkadii.yakovets@owasp.org>"
 __license__ = "MIT"
 
+_SCHEMA_NAMES = ("chapter", "committee", "project", "common")
+
+# Module attributes loaded on first access, see `__getattr__`.
+_LAZY_SCHEMAS = {
+    "chapter_schema": "chapter",
+    "committee_schema": "committee",
+    "common_schema": "common",
+    "project_schema": "project",
+}
+
+_schemas: dict[str, Any] | None = None
+_schemas_lock = threading.Lock()
+
 
 # Load all JSON schemas
 def _load_schemas() -> dict[str, Any]:
     """Load all JSON schema files from the package directory."""
+    # Imported on first use, `import owasp_schema` stays cheap.
+    import importlib.resources  # noqa: PLC0415
+
+    from owasp_schema.utils.metrics import metrics  # noqa: PLC0415
+
+    start = time.perf_counter()
     schemas: dict[str, Any] = {}
-    for schema_name in ("chapter", "committee", "project", "common"):
+    for schema_name in _SCHEMA_NAMES:
         schema_path = importlib.resources.files(__package__).joinpath(f"{schema_name}.json")
         with schema_path.open(encoding="utf-8") as f:
             schemas[schema_name] = json.load(f)
 
+    metrics.observe_schema_load("schemas", time.perf_counter() - start)
     return schemas
 
 
-# Load schemas at module import time
-SCHEMAS: dict[str, Any] = _load_schemas()
+def _get_schemas() -> dict[str, Any]:
+    """Get the schemas, loading them once on first use.
+
+    Validators are cached by schema identity, concurrent first calls must get
+    the same schema objects.
+    """
+    global _schemas  # noqa: PLW0603
+    if _schemas is None:
+        with _schemas_lock:
+            if _schemas is None:
+                _schemas = _load_schemas()
+    return _schemas
+
+
+def __getattr__(name: str) -> Any:
+    """Load `SCHEMAS` and the `<name>_schema` attributes on first access."""
+    if name == "SCHEMAS":
+        return _get_schemas()
+    if name in _LAZY_SCHEMAS:
+        return _get_schemas()[_LAZY_SCHEMAS[name]]
+
+    error_message = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(error_message)
 
 
 def get_schema(schema_name: str) -> dict[str, Any]:
@@ -41,21 +83,24 @@ def get_schema(schema_name: str) -> dict[str, Any]:
         KeyError: If the schema doesn't exist
 
     """
-    if schema_name not in SCHEMAS:
-        available_schemas = list(SCHEMAS.keys())
+    schemas = _get_schemas()
+    if schema_name not in schemas:
+        available_schemas = list(schemas.keys())
         error_message = f"Schema '{schema_name}' not found. Available schemas: {available_schemas}"
         raise KeyError(error_message)
-    return SCHEMAS[schema_name]
+    return schemas[schema_name]
 
 
 def list_schemas() -> list[str]:
     """List all available schema names.
 
+    The schemas aren't loaded.
+
     Returns:
         List of available schema names
 
     """
-    return list(SCHEMAS.keys())
+    return list(_SCHEMA_NAMES)
 
 
 def get_all_schemas() -> dict[str, dict[str, Any]]:
@@ -65,13 +110,8 @@ def get_all_schemas() -> dict[str, dict[str, Any]]:
         Dictionary mapping schema names to their content
 
     """
-    return SCHEMAS.copy()
-
+    return _get_schemas().copy()
 
-chapter_schema = get_schema("chapter")
-committee_schema = get_schema("committee")
-project_schema = get_schema("project")
-common_schema = get_schema("common")
 
 __all__ = [
     "__author__",
@@ -0,0 +1,7 @@
+"""Allow running the command line interface with `python -m owasp_schema`."""
+
+import sys
+
+from owasp_schema.cli import main
+
+sys.exit(main())
@@ -0,0 +1,382 @@
+"""OWASP Schema command line interface.
+
+Subcommand modules are imported by their handlers, `--version` or the language
+server don't pay for YAML and JSON schema validation, validation doesn't pay for
+the language server or SQLite.
+"""
+
+import argparse
+import contextlib
+import json
+import sys
+
+from owasp_schema import __version__
+from owasp_schema.utils.bulk_validation import SCHEMA_NAMES
+from owasp_schema.utils.format_engines import DEFAULT_FORMAT_PROFILE, list_format_profiles
+from owasp_schema.utils.reports import JsonlReport, SarifReport, write_report
+from owasp_schema.utils.watch import DEBOUNCE_SECONDS, POLL_INTERVAL_SECONDS
+
+OUTPUT_FORMATS = ("text", "json", "jsonl", "sarif")
+
+
+def _write_text(results, stream) -> int:
+    failed = 0
+    for result in results:
+        if result.is_valid:
+            stream.write(f"SUCCESS: {result.path}\n")
+        else:
+            failed += 1
+            location = f"{result.path}:{result.line}" if result.line else result.path
+            stream.write(f"ERROR: {location}: {result.error}\n")
+        stream.flush()
+    return failed
+
+
+def _write_json(results, stream) -> int:
+    records = [result.as_dict() for result in results]
+    failed = sum(not record["valid"] for record in records)
+    json.dump(
+        {"failed": failed, "passed": len(records) - failed, "results": records},
+        stream,
+        indent=2,
+    )
+    stream.write("\n")
+    return failed
+
+
+def _write_jsonl(results, stream) -> int:
+    return write_report(results, JsonlReport(stream)).failed
+
+
+def _write_sarif(results, stream) -> int:
+    return write_report(results, SarifReport(stream)).failed
+
+
+WRITERS = {
+    "json": _write_json,
+    "jsonl": _write_jsonl,
+    "sarif": _write_sarif,
+    "text": _write_text,
+}
+
+
+def validate(args) -> int:
+    """Validate metadata files and report results."""
+    from owasp_schema.utils.bulk_validation import validate_files  # noqa: PLC0415
+
+    results = validate_files(
+        args.paths,
+        jobs=args.jobs,
+        schema_name=None if args.schema == "auto" else args.schema,
+        format_profile=args.format_profile,
+        batch_size=args.batch_size,
+    )
+    failed = WRITERS[args.format](results, sys.stdout)
+    return 1 if failed else 0
+
+
+def diff(args) -> int:
+    """Compare two schema sets and list documents affected by the changes."""
+    import yaml  # noqa: PLC0415
+
+    from owasp_schema.utils.bulk_validation import (  # noqa: PLC0415
+        detect_schema_name,
+        iter_metadata_files,
+    )
+    from owasp_schema.utils.schema_diff import (  # noqa: PLC0415
+        FieldPresenceIndex,
+        affected_documents,
+        diff_schema_sets,
+        load_schema_set,
+    )
+
+    old_schemas = load_schema_set(args.old)
+    new_schemas = load_schema_set(args.new)
+    changes = diff_schema_sets(old_schemas, new_schemas)
+
+    affected: list[str] = []
+    if args.affected:
+        index = FieldPresenceIndex()
+        for path in iter_metadata_files(args.affected):
+            try:
+                schema_name = detect_schema_name(path)
+                data = yaml.safe_load(path.read_bytes())
+            except (OSError, ValueError, yaml.YAMLError) as e:
+                # Invalid files are reported by `validate`, they don't stop the diff.
+                sys.stderr.write(f"WARNING: Skipping {path}: {e}\n")
+                continue
+            index.add(str(path), schema_name, data)
+        affected = sorted(affected_documents(changes, index, old_schemas, new_schemas))
+
+    if args.format == "json":
+        json.dump(
+            {"affected": affected, "changes": [change.as_dict() for change in changes]},
+            sys.stdout,
+            indent=2,
+        )
+        sys.stdout.write("\n")
+    else:
+        for change in changes:
+            sys.stdout.write(f"{change.kind.upper()}: {change.schema_name}#{change.pointer}\n")
+        for document in affected:
+            sys.stdout.write(f"AFFECTED: {document}\n")
+
+    return 0
+
+
+def corpus(args) -> int:
+    """Check corpus-wide uniqueness rules across metadata files."""
+    from owasp_schema.utils.corpus_index import build_corpus_index  # noqa: PLC0415
+
+    collisions = build_corpus_index(args.paths).collisions()
+
+    if args.format == "json":
+        json.dump([collision.as_dict() for collision in collisions], sys.stdout, indent=2)
+        sys.stdout.write("\n")
+    else:
+        for collision in collisions:
+            sys.stdout.write(
+                f"ERROR: {collision.message}: {', '.join(collision.documents)}\n",
+            )
+
+    return 1 if collisions else 0
+
+
+def watch(args) -> int:
+    """Revalidate metadata files as they change until interrupted."""
+    from owasp_schema.utils.watch import MetadataWatcher  # noqa: PLC0415
+
+    watcher = MetadataWatcher(
+        args.paths,
+        format_profile=args.format_profile,
+        interval=args.interval,
+        debounce=args.debounce,
+    )
+    with contextlib.suppress(KeyboardInterrupt):
+        WRITERS[args.format](watcher.watch(), sys.stdout)
+    return 0
+
+
+def export(args) -> int:
+    """Export valid metadata files to a SQLite database."""
+    from owasp_schema.utils.sqlite_export import export_to_sqlite  # noqa: PLC0415
+
+    stats = export_to_sqlite(
+        args.database,
+        args.paths,
+        format_profile=args.format_profile,
+        prune=args.prune,
+    )
+
+    if args.format == "json":
+        json.dump(stats.as_dict(), sys.stdout, indent=2)
+        sys.stdout.write("\n")
+    else:
+        sys.stdout.write(
+            ", ".join(f"{count} {name}" for name, count in stats.as_dict().items()) + "\n",
+        )
+
+    return 1 if stats.invalid else 0
+
+
+def lsp(_args) -> int:
+    """Run the language server over stdio."""
+    from owasp_schema.lsp import serve  # noqa: PLC0415
+
+    return serve(sys.stdin.buffer, sys.stdout.buffer)
+
+
+def _int_at_least(value: str, minimum: int) -> int:
+    try:
+        number = int(value)
+    except ValueError:
+        number = minimum - 1
+    if number < minimum:
+        error_message = f"must be an integer of at least {minimum}, got '{value}'"
+        raise argparse.ArgumentTypeError(error_message)
+    return number
+
+
+def _non_negative_int(value: str) -> int:
+    """Parse a non-negative integer argument, e.g. `--jobs`."""
+    return _int_at_least(value, 0)
+
+
+def _positive_int(value: str) -> int:
+    """Parse a positive integer argument, e.g. `--batch-size`."""
+    return _int_at_least(value, 1)
+
+
+def get_parser() -> argparse.ArgumentParser:
+    """Build the command line parser."""
+    parser = argparse.ArgumentParser(
+        prog="owasp-schema",
+        description="OWASP metadata schema tools.",
+    )
+    parser.add_argument("--version", action="version", version=f"%(prog)s {__version__}")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    validate_parser = subparsers.add_parser(
+        "validate",
+        help="Validate OWASP metadata files.",
+    )
+    validate_parser.add_argument(
+        "paths",
+        metavar="PATH",
+        nargs="+",
+        help="Metadata file, archive or directory to search for *.owasp.yaml files.",
+    )
+    validate_parser.add_argument(
+        "-j",
+        "--jobs",
+        default=1,
+        help="Number of worker processes, 0 to use all available cores.",
+        type=_non_negative_int,
+    )
+    validate_parser.add_argument(
+        "--schema",
+        choices=("auto", *SCHEMA_NAMES),
+        default="auto",
+        help="Schema to validate against, detected from the file name by default.",
+    )
+    validate_parser.add_argument(
+        "--format",
+        choices=OUTPUT_FORMATS,
+        default="text",
+        help="Output format.",
+    )
+    validate_parser.add_argument(
+        "--format-profile",
+        choices=list_format_profiles(),
+        default=DEFAULT_FORMAT_PROFILE,
+        help="Format check profile: strict (default), fast or skip.",
+    )
+    validate_parser.add_argument(
+        "--batch-size",
+        help="Validate documents in batches, checking each distinct format value once per batch.",
+        type=_positive_int,
+    )
+    validate_parser.set_defaults(handler=validate)
+
+    diff_parser = subparsers.add_parser(
+        "diff",
+        help="Classify changes between two schema sets.",
+    )
+    diff_parser.add_argument("old", help="Directory with the previous schema JSON files.")
+    diff_parser.add_argument("new", help="Directory with the current schema JSON files.")
+    diff_parser.add_argument(
+        "--affected",
+        default=[],
+        help="Metadata files or directories to check for documents needing revalidation.",
+        metavar="PATH",
+        nargs="+",
+    )
+    diff_parser.add_argument(
+        "--format",
+        choices=("text", "json"),
+        default="text",
+        help="Output format.",
+    )
+    diff_parser.set_defaults(handler=diff)
+
+    corpus_parser = subparsers.add_parser(
+        "corpus",
+        help="Check uniqueness rules across metadata files.",
+    )
+    corpus_parser.add_argument(
+        "paths",
+        metavar="PATH",
+        nargs="+",
+        help="Metadata file or directory to search for *.owasp.yaml files.",
+    )
+    corpus_parser.add_argument(
+        "--format",
+        choices=("text", "json"),
+        default="text",
+        help="Output format.",
+    )
+    corpus_parser.set_defaults(handler=corpus)
+
+    export_parser = subparsers.add_parser(
+        "export",
+        help="Export valid OWASP metadata files to a SQLite database.",
+    )
+    export_parser.add_argument("database", help="SQLite database file, created if missing.")
+    export_parser.add_argument(
+        "paths",
+        metavar="PATH",
+        nargs="+",
+        help="Metadata file or directory to search for *.owasp.yaml files.",
+    )
+    export_parser.add_argument(
+        "--format",
+        choices=("text", "json"),
+        default="text",
+        help="Output format.",
+    )
+    export_parser.add_argument(
+        "--format-profile",
+        choices=list_format_profiles(),
+        default=DEFAULT_FORMAT_PROFILE,
+        help="Format check profile: strict (default), fast or skip.",
+    )
+    export_parser.add_argument(
+        "--prune",
+        action="store_true",
+        help="Delete documents of files no longer present in the paths.",
+    )
+    export_parser.set_defaults(handler=export)
+
+    lsp_parser = subparsers.add_parser(
+        "lsp",
+        help="Run the language server for OWASP metadata files over stdio.",
+    )
+    lsp_parser.set_defaults(handler=lsp)
+
+    watch_parser = subparsers.add_parser(
+        "watch",
+        help="Revalidate OWASP metadata files on save.",
+    )
+    watch_parser.add_argument(
+        "paths",
+        metavar="PATH",
+        nargs="+",
+        help="Metadata file or directory to search for *.owasp.yaml files.",
+    )
+    watch_parser.add_argument(
+        "--debounce",
+        default=DEBOUNCE_SECONDS,
+        help="Seconds a file must stay unchanged before it is revalidated.",
+        type=float,
+    )
+    watch_parser.add_argument(
+        "--format",
+        choices=("text", "jsonl"),
+        default="text",
+        help="Output format.",
+    )
+    watch_parser.add_argument(
+        "--format-profile",
+        choices=list_format_profiles(),
+        default=DEFAULT_FORMAT_PROFILE,
+        help="Format check profile: strict (default), fast or skip.",
+    )
+    watch_parser.add_argument(
+        "--interval",
+        default=POLL_INTERVAL_SECONDS,
+        help="Seconds between polls for changes.",
+        type=float,
+    )
+    watch_parser.set_defaults(handler=watch)
+
+    return parser
+
+
+def main(argv=None) -> int:
+    """Run the command line interface."""
+    args = get_parser().parse_args(argv)
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,475 @@
+"""Language server for OWASP metadata files.
+
+A minimal Language Server Protocol implementation over stdio, standard library
+only. It provides hovers and completions from the schema index and publishes
+diagnostics for `*.owasp.yaml` documents, revalidating only the edited
+document with the cached validator of its schema.
+
+LSP positions count characters in UTF-16 code units, they are converted to and
+from Python string indices at the protocol boundary.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from dataclasses import dataclass
+from pathlib import PurePosixPath
+from typing import TYPE_CHECKING, BinaryIO
+from urllib.parse import unquote, urlparse
+
+import yaml
+
+from owasp_schema import __version__, get_schema
+from owasp_schema.utils.bulk_validation import detect_schema_name
+from owasp_schema.utils.schema_index import ITEMS, get_schema_index
+from owasp_schema.utils.schema_validators import get_validator
+from owasp_schema.utils.yaml_locations import Location, load_with_locations, locate
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from owasp_schema.utils.schema_index import SchemaIndexEntry
+
+COMPLETION_ITEM_KIND_PROPERTY = 10
+COMPLETION_ITEM_KIND_VALUE = 12
+DIAGNOSTIC_SEVERITY_ERROR = 1
+INTERNAL_ERROR = -32603
+MAX_DIAGNOSTICS = 100
+MESSAGE_TYPE_ERROR = 1
+METHOD_NOT_FOUND = -32601
+SERVER_NAME = "owasp-schema"
+TEXT_DOCUMENT_SYNC_INCREMENTAL = 2
+UTF16 = "utf-16-le"
+
+LINE_REGEX = re.compile(
+    r"^(?P<indent> *)(?P<dash>- +)?"
+    r"(?:(?P<key>[^\s#:][^#:]*?)\s*:(?=\s|$)\s*(?P<value>[^#]*))?",
+)
+
+
+@dataclass(frozen=True)
+class _Line:
+    dash: int | None
+    content: int
+    key: str | None
+    key_end: int
+    value: str
+
+    @classmethod
+    def parse(cls, text: str) -> _Line | None:
+        if not (stripped := text.strip()) or stripped.startswith(("#", "---", "...")):
+            return None
+
+        match = LINE_REGEX.match(text)
+        assert match is not None  # Every group is optional, the pattern matches any line.
+        indent = len(match["indent"])
+        dash = match["dash"]
+        content = indent + len(dash or "")
+        key = match["key"]
+        return cls(
+            dash=indent if dash else None,
+            content=content,
+            key=key,
+            key_end=match.end("key"),
+            value=(match["value"] if key else text[content:].partition(" #")[0]).strip(),
+        )
+
+
+def container_path(
+    lines: list[str],
+    line_number: int,
+    text: str | None = None,
+) -> tuple[str, ...]:
+    """Get the path of the mapping or sequence containing a line.
+
+    Block style YAML is inspected textually, so documents being edited don't
+    need to parse.
+
+    Args:
+        lines: Document lines
+        line_number: Zero-based line number
+        text: Line text if different from the document, e.g. a prefix
+
+    Returns:
+        Schema index path, e.g. `("leaders", "*")`
+
+    """
+    if (line := _Line.parse(lines[line_number] if text is None else text)) is None:
+        return ()
+
+    path = []
+    threshold = line.content
+    after_items = False
+    if line.dash is not None:
+        path.append(ITEMS)
+        threshold, after_items = line.dash, True
+
+    for previous_line in reversed(lines[:line_number]):
+        if threshold == 0 and not after_items:
+            break
+        if (parent := _Line.parse(previous_line)) is None:
+            continue
+
+        if parent.dash is not None and parent.dash < threshold <= parent.content:
+            # A key on the first line of the enclosing sequence item.
+            path.append(ITEMS)
+            threshold, after_items = parent.dash, True
+        elif parent.content < threshold or (
+            after_items and parent.content == threshold and parent.dash is None
+        ):
+            if parent.key is None or parent.value:
+                break
+            path.append(parent.key)
+            if parent.dash is not None:
+                path.append(ITEMS)
+                threshold, after_items = parent.dash, True
+            else:
+                threshold, after_items = parent.content, False
+
+    return tuple(reversed(path))
+
+
+def _enum_markdown(entry: SchemaIndexEntry, value: str | None) -> list[str]:
+    return [
+        f"- `{enum_value}`" + (f": {description}" if description else "")
+        for enum_value, description in entry.enum_items()
+        if value is None or str(enum_value) == value
+    ]
+
+
+def hover_markdown(
+    path: tuple[str, ...],
+    entry: SchemaIndexEntry,
+    value: str | None = None,
+) -> str:
+    """Render the hover text of a property, limited to a value if provided."""
+    name = next((part for part in reversed(path) if part != ITEMS), "document")
+    lines = [f"**{name}**" + (f" ({entry.type})" if entry.type else "")]
+    if entry.description:
+        lines.extend(("", entry.description))
+    if enum_lines := _enum_markdown(entry, value):
+        lines.extend(("", *enum_lines))
+    return "\n".join(lines)
+
+
+def read_message(stream: BinaryIO) -> dict | None:
+    """Read a JSON-RPC message, None at the end of the stream.
+
+    Raises:
+        ValueError: If the message has no valid `Content-Length` header or
+            isn't a JSON object
+
+    """
+    headers = {}
+    while True:
+        line = stream.readline()
+        if not line:
+            return None
+        if not (line := line.strip()):
+            break
+        name, _, value = line.decode("ascii").partition(":")
+        headers[name.strip().lower()] = value.strip()
+
+    try:
+        length = int(headers["content-length"])
+    except (KeyError, ValueError) as e:
+        error_message = "Missing or invalid Content-Length header."
+        raise ValueError(error_message) from e
+
+    if not isinstance(message := json.loads(stream.read(length)), dict):
+        error_message = "Message isn't a JSON object."
+        raise ValueError(error_message)  # noqa: TRY004
+    return message
+
+
+def write_message(stream: BinaryIO, message: dict) -> None:
+    """Write a JSON-RPC message."""
+    body = json.dumps(message).encode()
+    stream.write(f"Content-Length: {len(body)}\r\n\r\n".encode() + body)
+    stream.flush()
+
+
+def to_index(line: str, character: int) -> int:
+    """Convert a UTF-16 position character within a line to a string index.
+
+    Characters past the end of the line, excluding its line break, are clamped
+    to it.
+    """
+    encoded = line.rstrip("\r\n").encode(UTF16)[: character * 2]
+    # A character within a surrogate pair points at its start.
+    return len(encoded.decode(UTF16, errors="ignore"))
+
+
+def to_character(line: str, index: int) -> int:
+    """Convert a string index within a line to a UTF-16 position character."""
+    return len(line[:index].encode(UTF16)) // 2
+
+
+def apply_change(text: str, change: dict) -> str:
+    """Apply a full or incremental text document content change."""
+    if "range" not in change:
+        return change["text"]
+
+    lines = text.splitlines(keepends=True)
+
+    def offset(position: dict) -> int:
+        if position["line"] >= len(lines):
+            return len(text)
+        line = lines[position["line"]]
+        return sum(map(len, lines[: position["line"]])) + to_index(line, position["character"])
+
+    start = offset(change["range"]["start"])
+    end = offset(change["range"]["end"])
+    return text[:start] + change["text"] + text[end:]
+
+
+def _diagnostic(location: Location, message: str, lines: list[str]) -> dict:
+    # Multi-line nodes, e.g. a mapping missing a required property, are
+    # highlighted on their first line only.
+    end_line, end_column = location.end_line, location.end_column
+    if end_line != location.line:
+        end_line = location.line
+        end_column = len(lines[end_line]) if end_line < len(lines) else location.column
+
+    line = lines[location.line] if location.line < len(lines) else ""
+    return {
+        "message": message,
+        "range": {
+            "end": {"character": to_character(line, end_column), "line": end_line},
+            "start": {"character": to_character(line, location.column), "line": location.line},
+        },
+        "severity": DIAGNOSTIC_SEVERITY_ERROR,
+        "source": SERVER_NAME,
+    }
+
+
+class LanguageServer:
+    """Language server for OWASP metadata files."""
+
+    def __init__(self, reader: BinaryIO, writer: BinaryIO) -> None:
+        """Initialize the server reading requests from reader, writing to writer."""
+        self.documents: dict[str, str] = {}
+        self.reader = reader
+        self.writer = writer
+
+        self._exited = False
+        self._shutdown = False
+        self._notifications: dict[str, Callable] = {
+            "exit": self.exit,
+            "textDocument/didChange": self.did_change,
+            "textDocument/didClose": self.did_close,
+            "textDocument/didOpen": self.did_open,
+        }
+        self._requests: dict[str, Callable] = {
+            "initialize": self.initialize,
+            "shutdown": self.shutdown,
+            "textDocument/completion": self.completion,
+            "textDocument/hover": self.hover,
+        }
+
+    def serve(self) -> int:
+        """Handle messages until exit.
+
+        Returns:
+            Exit code, 0 if the client requested a shutdown before exit
+
+        """
+        while not self._exited:
+            try:
+                message = read_message(self.reader)
+            except ValueError as e:
+                # Malformed messages are skipped, the client is still served.
+                self._log_error(f"Invalid message: {e}")
+                continue
+            if message is None:
+                break
+            self.handle(message)
+        return 0 if self._shutdown else 1
+
+    def handle(self, message: dict) -> None:
+        """Handle a JSON-RPC request or notification."""
+        method = message.get("method", "")
+        params = message.get("params") or {}
+
+        if "id" not in message:
+            if (notification := self._notifications.get(method)) is None:
+                return
+            try:
+                notification(params)
+            except Exception as e:  # noqa: BLE001
+                # Notifications have no response, the error is logged to the client.
+                self._log_error(f"{method} failed: {e}")
+            return
+
+        if (request := self._requests.get(method)) is None:
+            error = {"code": METHOD_NOT_FOUND, "message": f"Method '{method}' not found."}
+            write_message(self.writer, {"error": error, "id": message["id"], "jsonrpc": "2.0"})
+            return
+
+        try:
+            result = request(params)
+        except Exception as e:  # noqa: BLE001
+            error = {"code": INTERNAL_ERROR, "message": str(e)}
+            write_message(self.writer, {"error": error, "id": message["id"], "jsonrpc": "2.0"})
+            return
+        write_message(self.writer, {"id": message["id"], "jsonrpc": "2.0", "result": result})
+
+    def initialize(self, _params: dict) -> dict:
+        """Advertise the server capabilities."""
+        return {
+            "capabilities": {
+                "completionProvider": {"triggerCharacters": [" ", "-"]},
+                "hoverProvider": True,
+                "textDocumentSync": {
+                    "change": TEXT_DOCUMENT_SYNC_INCREMENTAL,
+                    "openClose": True,
+                },
+            },
+            "serverInfo": {"name": SERVER_NAME, "version": __version__},
+        }
+
+    def shutdown(self, _params: dict) -> None:
+        """Prepare for exit."""
+        self._shutdown = True
+
+    def exit(self, _params: dict) -> None:
+        """Stop serving."""
+        self._exited = True
+
+    def did_open(self, params: dict) -> None:
+        """Track an opened document and publish its diagnostics."""
+        uri = params["textDocument"]["uri"]
+        self.documents[uri] = params["textDocument"]["text"]
+        self.publish_diagnostics(uri)
+
+    def did_change(self, params: dict) -> None:
+        """Apply document changes and revalidate the document."""
+        uri = params["textDocument"]["uri"]
+        text = self.documents.get(uri, "")
+        for change in params["contentChanges"]:
+            text = apply_change(text, change)
+        self.documents[uri] = text
+        self.publish_diagnostics(uri)
+
+    def did_close(self, params: dict) -> None:
+        """Forget a closed document and clear its diagnostics."""
+        uri = params["textDocument"]["uri"]
+        self.documents.pop(uri, None)
+        self._notify("textDocument/publishDiagnostics", {"diagnostics": [], "uri": uri})
+
+    def _log_error(self, message: str) -> None:
+        self._notify("window/logMessage", {"message": message, "type": MESSAGE_TYPE_ERROR})
+
+    def _notify(self, method: str, params: dict) -> None:
+        write_message(self.writer, {"jsonrpc": "2.0", "method": method, "params": params})
+
+    @staticmethod
+    def schema_name(uri: str) -> str | None:
+        """Get the schema name of a document URI, None if not a metadata file."""
+        try:
+            return detect_schema_name(PurePosixPath(unquote(urlparse(uri).path)).name)
+        except ValueError:
+            return None
+
+    def diagnostics(self, uri: str) -> list[dict]:
+        """Validate a document and convert errors to LSP diagnostics."""
+        if (schema_name := self.schema_name(uri)) is None:
+            return []
+
+        text = self.documents[uri]
+        lines = text.splitlines()
+        try:
+            data, locations = load_with_locations(text)
+        except yaml.YAMLError as e:
+            mark = getattr(e, "problem_mark", None) or getattr(e, "context_mark", None)
+            line = mark.line if mark else 0
+            location = Location(line, 0, line + 1, 0)
+            return [_diagnostic(location, f"Invalid YAML: {e}", lines)]
+
+        validator = get_validator(get_schema(schema_name))
+        diagnostics = []
+        for error in validator.iter_errors(data):
+            location = locate(locations, error.absolute_path) or Location(0, 0, 0, 0)
+            diagnostics.append(_diagnostic(location, error.message, lines))
+            if len(diagnostics) == MAX_DIAGNOSTICS:
+                break
+        return diagnostics
+
+    def publish_diagnostics(self, uri: str) -> None:
+        """Publish diagnostics of a document."""
+        self._notify(
+            "textDocument/publishDiagnostics",
+            {"diagnostics": self.diagnostics(uri), "uri": uri},
+        )
+
+    def _cursor(self, params: dict) -> tuple[str | None, list[str], int, int]:
+        uri = params["textDocument"]["uri"]
+        lines = self.documents.get(uri, "").splitlines() or [""]
+        line_number = min(params["position"]["line"], len(lines) - 1)
+        character = to_index(lines[line_number], params["position"]["character"])
+        return self.schema_name(uri), lines, line_number, character
+
+    def hover(self, params: dict) -> dict | None:
+        """Describe the property or value under the cursor."""
+        schema_name, lines, line_number, character = self._cursor(params)
+        if schema_name is None or (line := _Line.parse(lines[line_number])) is None:
+            return None
+
+        path = container_path(lines, line_number)
+        value: str | None = line.value
+        if line.key is not None:
+            path = (*path, line.key)
+            value = line.value if character > line.key_end else None
+
+        if (entry := get_schema_index(schema_name).get(path)) is None:
+            return None
+        return {
+            "contents": {"kind": "markdown", "value": hover_markdown(path, entry, value)},
+        }
+
+    def completion(self, params: dict) -> list[dict]:
+        """Complete property names and allowed values at the cursor."""
+        schema_name, lines, line_number, character = self._cursor(params)
+        if schema_name is None:
+            return []
+
+        # Complete an empty key as if something was typed.
+        prefix = lines[line_number][:character]
+        if (line := _Line.parse(prefix)) is None:
+            prefix = f"{prefix}x"
+            line = _Line.parse(prefix)
+        if line is None:
+            return []
+
+        path = container_path(lines, line_number, prefix)
+        if line.key is not None:
+            path = (*path, line.key)
+        index = get_schema_index(schema_name)
+        if (entry := index.get(path)) is None:
+            return []
+
+        items = [
+            {
+                "detail": description,
+                "kind": COMPLETION_ITEM_KIND_VALUE,
+                "label": str(value),
+            }
+            for value, description in entry.enum_items()
+        ]
+        if line.key is None:
+            items.extend(
+                {
+                    "detail": index[(*path, name)].description,
+                    "insertText": f"{name}: ",
+                    "kind": COMPLETION_ITEM_KIND_PROPERTY,
+                    "label": name,
+                }
+                for name in entry.properties
+            )
+        return items
+
+
+def serve(reader: BinaryIO, writer: BinaryIO) -> int:
+    """Run the language server until the client exits."""
+    return LanguageServer(reader, writer).serve()
@@ -0,0 +1,112 @@
+"""Read metadata documents from archives without extracting them.
+
+Archive modules are imported once an archive is read, checking paths with
+`is_archive` doesn't pay for them.
+"""
+
+from __future__ import annotations
+
+import fnmatch
+from pathlib import Path, PurePosixPath
+from typing import TYPE_CHECKING
+
+from owasp_schema.utils.bulk_validation import METADATA_FILE_GLOB
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+COMPRESSED_TAR_SUFFIXES = (".tar.bz2", ".tar.gz", ".tar.xz", ".tbz2", ".tgz", ".txz")
+MEMBER_NAME_SEPARATOR = "!"
+TAR_SUFFIX = ".tar"
+ZIP_SUFFIX = ".zip"
+
+ARCHIVE_SUFFIXES = (*COMPRESSED_TAR_SUFFIXES, TAR_SUFFIX, ZIP_SUFFIX)
+
+
+def is_archive(path: str | Path) -> bool:
+    """Check whether the path is a supported archive based on its suffix."""
+    return str(path).lower().endswith(ARCHIVE_SUFFIXES)
+
+
+def member_name(archive_path: str | Path, name: str) -> str:
+    """Build a member name used for reporting, e.g. `corpus.tar!a/project.owasp.yaml`."""
+    return f"{archive_path}{MEMBER_NAME_SEPARATOR}{name}"
+
+
+def _matches(name: str, pattern: str) -> bool:
+    return fnmatch.fnmatch(PurePosixPath(name).name, pattern)
+
+
+def _iter_zip(path: Path, pattern: str) -> Iterator[tuple[str, bytes]]:
+    import zipfile  # noqa: PLC0415
+
+    with zipfile.ZipFile(path) as archive:
+        for info in archive.infolist():
+            if not info.is_dir() and _matches(info.filename, pattern):
+                yield member_name(path, info.filename), archive.read(info)
+
+
+def _iter_tar_stream(path: Path, pattern: str) -> Iterator[tuple[str, bytes]]:
+    import tarfile  # noqa: PLC0415
+
+    # Compressed archives can't be seeked efficiently, read them sequentially.
+    with tarfile.open(path, mode="r|*") as archive:
+        for member in archive:
+            if not member.isfile() or not _matches(member.name, pattern):
+                continue
+            if (member_file := archive.extractfile(member)) is not None:
+                yield member_name(path, member.name), member_file.read()
+
+
+def _iter_tar_mmap(path: Path, pattern: str) -> Iterator[tuple[str, bytes]]:
+    import mmap  # noqa: PLC0415
+    import tarfile  # noqa: PLC0415
+
+    # Uncompressed archives are memory-mapped, member data is sliced straight
+    # from the mapping instead of going through per-member reads.
+    with (
+        path.open("rb") as f,
+        mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapping,
+        tarfile.open(fileobj=mapping, mode="r:") as archive,
+    ):
+        for member in archive:
+            if member.isfile() and _matches(member.name, pattern):
+                yield (
+                    member_name(path, member.name),
+                    mapping[member.offset_data : member.offset_data + member.size],
+                )
+
+
+def iter_archive_members(
+    path: str | Path,
+    pattern: str = METADATA_FILE_GLOB,
+) -> Iterator[tuple[str, bytes]]:
+    """Iterate over archive members matching a file name pattern.
+
+    Supports zip and tar archives, including gzip, bzip2 and xz compressed tar
+    archives. Nothing is extracted to disk.
+
+    Args:
+        path: Archive path
+        pattern: Glob pattern matched against member file names
+
+    Yields:
+        Tuples of member name (see `member_name`) and content
+
+    Raises:
+        ValueError: If the archive format isn't supported
+
+    """
+    path = Path(path)
+    name = path.name.lower()
+
+    if name.endswith(ZIP_SUFFIX):
+        yield from _iter_zip(path, pattern)
+    elif name.endswith(COMPRESSED_TAR_SUFFIXES):
+        yield from _iter_tar_stream(path, pattern)
+    elif name.endswith(TAR_SUFFIX):
+        if path.stat().st_size:
+            yield from _iter_tar_mmap(path, pattern)
+    else:
+        error_message = f"Unsupported archive format: '{path}'"
+        raise ValueError(error_message)
@@ -0,0 +1,394 @@
+"""Bulk validation of OWASP metadata files.
+
+YAML, JSON schema and process pool dependencies are imported on first use, the
+command line interface imports this module for every subcommand.
+"""
+
+from __future__ import annotations
+
+import os
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from owasp_schema import get_schema
+from owasp_schema.utils.format_engines import DEFAULT_FORMAT_PROFILE
+from owasp_schema.utils.metrics import metrics
+from owasp_schema.utils.schema_validators import (
+    get_validation_error,
+    get_validator,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+METADATA_FILE_GLOB = "*.owasp.yaml"
+SCHEMA_NAMES = ("chapter", "committee", "project")
+
+# Number of pending tasks per worker, bounds memory on large inputs.
+TASKS_PER_WORKER = 4
+
+
+@dataclass(frozen=True)
+class ValidationResult:
+    """Outcome of validating a single metadata document."""
+
+    path: str
+    schema_name: str | None
+    error: str | None = None
+    # One-based location of the error in the document, if known.
+    line: int | None = None
+    column: int | None = None
+
+    @property
+    def is_valid(self) -> bool:
+        """Whether the document passed validation."""
+        return self.error is None
+
+    def as_dict(self) -> dict:
+        """Return the result as a JSON serializable dictionary."""
+        return {**asdict(self), "valid": self.is_valid}
+
+
+def detect_schema_name(path: str | Path) -> str:
+    """Detect schema name from a metadata file name.
+
+    Args:
+        path: Metadata file path, e.g. `project.owasp.yaml`
+
+    Returns:
+        The schema name
+
+    Raises:
+        ValueError: If the file name doesn't match any schema
+
+    """
+    schema_name = Path(path).name.split(".")[0]
+    if schema_name not in SCHEMA_NAMES:
+        error_message = (
+            f"Could not detect schema for '{path}'. Expected one of {list(SCHEMA_NAMES)} "
+            "as the file name prefix."
+        )
+        raise ValueError(error_message)
+    return schema_name
+
+
+def iter_metadata_files(paths: Iterable[str | Path]) -> Iterator[Path]:
+    """Expand paths into metadata files, directories are searched recursively."""
+    for path in map(Path, paths):
+        if path.is_dir():
+            yield from sorted(path.rglob(METADATA_FILE_GLOB))
+        else:
+            yield path
+
+
+def _load(
+    name: str,
+    content: bytes | str,
+    schema_name: str | None,
+) -> ValidationResult | tuple[str, object]:
+    """Load a document, returning its schema name and data or a failed result."""
+    try:
+        schema_name = schema_name or detect_schema_name(name)
+    except ValueError as e:
+        return ValidationResult(path=name, schema_name=None, error=str(e))
+
+    import yaml  # noqa: PLC0415
+
+    try:
+        return schema_name, yaml.safe_load(content)
+    except yaml.YAMLError as e:
+        mark = getattr(e, "problem_mark", None)
+        return ValidationResult(
+            path=name,
+            schema_name=schema_name,
+            error=f"Invalid YAML: {e}",
+            line=mark.line + 1 if mark else None,
+            column=mark.column + 1 if mark else None,
+        )
+
+
+def _result(name: str, schema_name: str, content: bytes | str, error) -> ValidationResult:
+    """Convert the best matching `ValidationError`, if any, to a result."""
+    if error is None:
+        return ValidationResult(path=name, schema_name=schema_name)
+
+    from owasp_schema.utils.yaml_locations import load_with_locations, locate  # noqa: PLC0415
+
+    line = column = None
+    _, locations = load_with_locations(content)
+    if (location := locate(locations, error.absolute_path)) is not None:
+        line, column = location.line + 1, location.column + 1
+    return ValidationResult(
+        path=name,
+        schema_name=schema_name,
+        error=error.message,
+        line=line,
+        column=column,
+    )
+
+
+def validate_content(
+    name: str,
+    content: bytes | str,
+    schema_name: str | None = None,
+    format_profile: str = DEFAULT_FORMAT_PROFILE,
+) -> ValidationResult:
+    """Validate YAML content against a schema.
+
+    Args:
+        name: Document name used for reporting and schema detection
+        content: YAML document content
+        schema_name: Schema name, detected from the name if not provided
+        format_profile: Format check profile, see `format_engines`
+
+    Returns:
+        The validation result
+
+    """
+    loaded = _load(name, content, schema_name)
+    if isinstance(loaded, ValidationResult):
+        return loaded
+
+    schema_name, data = loaded
+    schema = get_schema(schema_name)
+    start = time.perf_counter()
+    error = get_validation_error(schema, data, format_profile)
+    if metrics.enabled:
+        metrics.observe_validation(
+            schema,
+            duration=time.perf_counter() - start,
+            passed=error is None,
+        )
+    return _result(name, schema_name, content, error)
+
+
+def _read(path: str | Path, schema_name: str | None) -> bytes | ValidationResult:
+    """Read a file, returning a failed result if it can't be read."""
+    try:
+        return Path(path).read_bytes()
+    except OSError as e:
+        return ValidationResult(
+            path=str(path),
+            schema_name=schema_name,
+            error=f"Could not read file: {e.strerror}",
+        )
+
+
+def validate_file(
+    path: str | Path,
+    schema_name: str | None = None,
+    format_profile: str = DEFAULT_FORMAT_PROFILE,
+) -> ValidationResult:
+    """Validate a metadata file against a schema.
+
+    Args:
+        path: Metadata file path
+        schema_name: Schema name, detected from the file name if not provided
+        format_profile: Format check profile, see `format_engines`
+
+    Returns:
+        The validation result
+
+    """
+    content = _read(path, schema_name)
+    if isinstance(content, ValidationResult):
+        return content
+
+    return validate_content(
+        str(path),
+        content,
+        schema_name=schema_name,
+        format_profile=format_profile,
+    )
+
+
+def warm_validators(format_profile: str = DEFAULT_FORMAT_PROFILE) -> None:
+    """Compile validators for all schemas ahead of validation."""
+    for schema_name in SCHEMA_NAMES:
+        get_validator(get_schema(schema_name), format_profile)
+
+
+def validate_batch(
+    documents: Iterable[tuple[str, bytes | str | None]],
+    schema_name: str | None = None,
+    format_profile: str = DEFAULT_FORMAT_PROFILE,
+) -> list[ValidationResult]:
+    """Validate a batch of documents, checking each distinct format value once.
+
+    All documents are loaded first, their `format` annotated values are
+    collected and checked once per distinct value, then the documents are
+    validated with the format results looked up, see `format_batch`.
+
+    Args:
+        documents: Document name and content pairs, content is read from the
+            name as a file path if None
+        schema_name: Schema name, detected per document if not provided
+        format_profile: Format check profile, see `format_engines`
+
+    Returns:
+        The validation results in document order
+
+    """
+    results: list[ValidationResult | None] = []
+    loaded = []
+    for name, document_content in documents:
+        content = _read(name, schema_name) if document_content is None else document_content
+        if isinstance(content, ValidationResult):
+            results.append(content)
+            continue
+
+        document = _load(name, content, schema_name)
+        if isinstance(document, ValidationResult):
+            results.append(document)
+            continue
+        loaded.append((len(results), name, content, *document))
+        results.append(None)
+
+    from jsonschema.exceptions import best_match  # noqa: PLC0415
+
+    from owasp_schema.utils.format_batch import (  # noqa: PLC0415
+        check_format_values,
+        collect_format_values,
+    )
+
+    values = collect_format_values(
+        (get_schema(document_schema_name), data) for *_, document_schema_name, data in loaded
+    )
+    format_checker = check_format_values(values, format_profile)
+    validators: dict[str, Any] = {}
+    for index, name, content, document_schema_name, data in loaded:
+        schema = get_schema(document_schema_name)
+        if (validator := validators.get(document_schema_name)) is None:
+            validator = validators[document_schema_name] = get_validator(
+                schema,
+                format_profile,
+            ).evolve(format_checker=format_checker)
+        start = time.perf_counter()
+        error = best_match(validator.iter_errors(data))
+        if metrics.enabled:
+            metrics.observe_validation(
+                schema,
+                duration=time.perf_counter() - start,
+                passed=error is None,
+            )
+        results[index] = _result(name, document_schema_name, content, error)
+
+    return [result for result in results if result is not None]
+
+
+def _iter_documents(paths, schema_name):
+    """Yield name and content pairs, content is None for files read by the task."""
+    # Imported here, `archives` imports `METADATA_FILE_GLOB` from this module.
+    from owasp_schema.utils.archives import is_archive, iter_archive_members  # noqa: PLC0415
+
+    for path in iter_metadata_files(paths):
+        if not is_archive(path):
+            yield str(path), None
+            continue
+
+        import tarfile  # noqa: PLC0415
+        import zipfile  # noqa: PLC0415
+
+        try:
+            yield from iter_archive_members(path)
+        except (OSError, EOFError, tarfile.TarError, zipfile.BadZipFile) as e:
+            yield _archive_error(path, schema_name, str(e))
+
+
+def _iter_tasks(paths, schema_name, format_profile, batch_size):
+    """Yield validation tasks, or results known without validating."""
+    batch: list[tuple[str, bytes | None]] = []
+    for document in _iter_documents(paths, schema_name):
+        if isinstance(document, ValidationResult):
+            yield document
+            continue
+
+        name, content = document
+        if batch_size is None:
+            if content is None:
+                yield validate_file, (name, schema_name, format_profile)
+            else:
+                yield validate_content, (name, content, schema_name, format_profile)
+            continue
+
+        batch.append((name, content))
+        if len(batch) == batch_size:
+            yield validate_batch, (batch, schema_name, format_profile)
+            batch = []
+
+    if batch:
+        yield validate_batch, (batch, schema_name, format_profile)
+
+
+def _archive_error(path, schema_name, error) -> ValidationResult:
+    return ValidationResult(
+        path=str(path),
+        schema_name=schema_name,
+        error=f"Could not read archive: {error}",
+    )
+
+
+def _results(result: ValidationResult | list[ValidationResult]) -> list[ValidationResult]:
+    return result if isinstance(result, list) else [result]
+
+
+def validate_files(
+    paths: Iterable[str | Path],
+    jobs: int | None = 1,
+    schema_name: str | None = None,
+    format_profile: str = DEFAULT_FORMAT_PROFILE,
+    batch_size: int | None = None,
+) -> Iterator[ValidationResult]:
+    """Validate metadata files, yielding results as they complete.
+
+    Archives (zip, tar and compressed tar) are read in place and each
+    `*.owasp.yaml` member is validated as a separate document. Worker
+    processes are forked once validators are compiled, see `prefork_pool`.
+
+    Args:
+        paths: Metadata files, archives or directories to search
+        jobs: Number of worker processes, all available cores if None or 0
+        schema_name: Schema name, detected per file if not provided
+        format_profile: Format check profile, see `format_engines`
+        batch_size: Documents validated together checking each distinct
+            format value once, see `validate_batch`, one at a time if None
+
+    Yields:
+        Validation results in completion order
+
+    """
+    jobs = jobs or os.cpu_count() or 1
+    tasks = _iter_tasks(paths, schema_name, format_profile, batch_size)
+
+    if jobs == 1:
+        for task in tasks:
+            if isinstance(task, ValidationResult):
+                yield task
+            else:
+                function, args = task
+                yield from _results(function(*args))
+        return
+
+    from concurrent.futures import FIRST_COMPLETED, wait  # noqa: PLC0415
+
+    from owasp_schema.utils.worker_pool import prefork_pool  # noqa: PLC0415
+
+    with prefork_pool(jobs, warm_validators, (format_profile,)) as executor:
+        pending: set = set()
+        for task in tasks:
+            if isinstance(task, ValidationResult):
+                yield task
+                continue
+            function, args = task
+            pending.add(executor.submit(function, *args))
+            if len(pending) >= jobs * TASKS_PER_WORKER:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield from _results(future.result())
+
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield from _results(future.result())
@@ -0,0 +1,204 @@
+"""Cross-document corpus indexes.
+
+Schemas enforce uniqueness within a document only. The corpus index keeps hash
+indexes over all documents to find collisions between them: duplicate project
+names, repository URLs claimed by several projects and GitHub handles whose
+person details differ between entities.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+import yaml
+
+from owasp_schema.utils.bulk_validation import detect_schema_name, iter_metadata_files
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from pathlib import Path
+
+PERSON_ATTRIBUTES = ("email", "name", "slack")
+PERSON_FIELDS = ("leaders", "members")
+
+INCONSISTENT_PERSON = "inconsistent_person"
+PROJECT_NAME = "project_name"
+REPOSITORY_URL = "repository_url"
+
+
+@dataclass(frozen=True)
+class Collision:
+    """A corpus-wide uniqueness or consistency violation."""
+
+    rule: str
+    key: str
+    documents: tuple[str, ...]
+    message: str
+
+    def as_dict(self) -> dict:
+        """Return the collision as a JSON serializable dictionary."""
+        return {
+            "documents": list(self.documents),
+            "key": self.key,
+            "message": self.message,
+            "rule": self.rule,
+        }
+
+
+def normalize_name(name: str) -> str:
+    """Normalize an entity name for comparison."""
+    return " ".join(name.split()).casefold()
+
+
+def normalize_url(url: str) -> str:
+    """Normalize a repository URL for comparison."""
+    return url.strip().rstrip("/").removesuffix(".git").casefold()
+
+
+def _iter_people(data: dict):
+    for field in PERSON_FIELDS:
+        for person in data.get(field) or ():
+            if isinstance(person, dict) and isinstance(person.get("github"), str):
+                yield person
+
+
+def extract_keys(schema_name: str, data: Any) -> list[tuple[str, str, Any]]:
+    """Extract index entries from a document.
+
+    Returns:
+        List of (rule, key, value) tuples
+
+    """
+    if not isinstance(data, dict):
+        return []
+
+    entries: list[tuple[str, str, Any]] = []
+    if schema_name == "project":
+        if isinstance(name := data.get("name"), str):
+            entries.append((PROJECT_NAME, normalize_name(name), name))
+
+        entries.extend(
+            (REPOSITORY_URL, normalize_url(url), url)
+            for repository in data.get("repositories") or ()
+            if isinstance(repository, dict) and isinstance(url := repository.get("url"), str)
+        )
+
+    entries.extend(
+        (
+            INCONSISTENT_PERSON,
+            person["github"].casefold(),
+            tuple(person.get(attribute) for attribute in PERSON_ATTRIBUTES),
+        )
+        for person in _iter_people(data)
+    )
+    return entries
+
+
+class CorpusIndex:
+    """Hash indexes over a corpus of metadata documents.
+
+    Documents can be added, replaced and removed one at a time, so the indexes
+    can be kept up to date as individual files change.
+    """
+
+    def __init__(self) -> None:
+        """Initialize empty indexes."""
+        self._documents: dict[str, list[tuple[str, str]]] = {}
+        self._indexes: dict[str, dict[str, dict[str, list]]] = {
+            INCONSISTENT_PERSON: {},
+            PROJECT_NAME: {},
+            REPOSITORY_URL: {},
+        }
+
+    def __contains__(self, document_id: str) -> bool:
+        """Check whether the document is indexed."""
+        return document_id in self._documents
+
+    def __len__(self) -> int:
+        """Return the number of indexed documents."""
+        return len(self._documents)
+
+    def add(self, document_id: str, schema_name: str, data: Any) -> None:
+        """Add a document, replacing its previous version if indexed."""
+        self.remove(document_id)
+
+        keys = []
+        for rule, key, value in extract_keys(schema_name, data):
+            self._indexes[rule].setdefault(key, {}).setdefault(document_id, []).append(value)
+            keys.append((rule, key))
+        self._documents[document_id] = keys
+
+    def remove(self, document_id: str) -> None:
+        """Remove a document if indexed."""
+        for rule, key in self._documents.pop(document_id, ()):
+            entries = self._indexes[rule].get(key)
+            if entries is None:
+                continue
+            entries.pop(document_id, None)
+            if not entries:
+                del self._indexes[rule][key]
+
+    def lookup(self, rule: str, key: str) -> dict[str, list]:
+        """Get documents and their values indexed under a normalized key."""
+        return {
+            document_id: list(values)
+            for document_id, values in self._indexes[rule].get(key, {}).items()
+        }
+
+    def _person_collisions(self):
+        for handle, entries in self._indexes[INCONSISTENT_PERSON].items():
+            conflicts = []
+            for attribute_index, attribute in enumerate(PERSON_ATTRIBUTES):
+                values = {
+                    person[attribute_index]
+                    for people in entries.values()
+                    for person in people
+                    if person[attribute_index] is not None
+                }
+                if len(values) > 1:
+                    conflicts.append(f"{attribute} {sorted(values)}")
+
+            if conflicts:
+                yield Collision(
+                    rule=INCONSISTENT_PERSON,
+                    key=handle,
+                    documents=tuple(sorted(entries)),
+                    message=f"GitHub user '{handle}' has conflicting {', '.join(conflicts)}",
+                )
+
+    def _unique_collisions(self, rule: str, label: str):
+        for key, entries in self._indexes[rule].items():
+            if len(entries) > 1:
+                yield Collision(
+                    rule=rule,
+                    key=key,
+                    documents=tuple(sorted(entries)),
+                    message=f"{label} '{key}' is used by {len(entries)} projects",
+                )
+
+    def collisions(self) -> list[Collision]:
+        """Get all corpus-wide collisions ordered by rule and key."""
+        collisions = [
+            *self._unique_collisions(PROJECT_NAME, "Project name"),
+            *self._unique_collisions(REPOSITORY_URL, "Repository URL"),
+            *self._person_collisions(),
+        ]
+        return sorted(collisions, key=lambda collision: (collision.rule, collision.key))
+
+
+def build_corpus_index(paths: Iterable[str | Path]) -> CorpusIndex:
+    """Build a corpus index from metadata files in a single pass.
+
+    Files that can't be read or parsed are skipped, they are reported by
+    schema validation.
+    """
+    index = CorpusIndex()
+    for path in iter_metadata_files(paths):
+        try:
+            data = yaml.safe_load(path.read_bytes())
+            schema_name = detect_schema_name(path)
+        except (OSError, ValueError, yaml.YAMLError):
+            continue
+        index.add(str(path), schema_name, data)
+    return index
@@ -0,0 +1,177 @@
+"""Batch-level deduplicated format checking.
+
+Metadata corpora repeat the same `uri` and `email` values across documents,
+e.g. OWASP Slack URLs, foundation websites and sponsor links. Rather than
+checking every occurrence, the `format`-annotated string values of a batch of
+documents are collected first, each distinct value is checked once and the
+documents are then validated with a `LookupFormatChecker` answering from those
+results. Batches are checked in parallel by validating them on worker
+processes, see `validate_files`.
+"""
+
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+from jsonschema import FormatChecker
+from jsonschema.exceptions import FormatError
+from referencing import Resource
+from referencing.jsonschema import DRAFT7
+
+from owasp_schema.utils.format_engines import DEFAULT_FORMAT_PROFILE, get_format_checker
+from owasp_schema.utils.schema_validators import (
+    VALIDATOR_CACHE_SIZE,
+    IdentityCache,
+    get_registry,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+
+@dataclass(eq=False)
+class _FormatPlan:
+    """Schema locations of `format` annotated values."""
+
+    format: str | None = None
+    properties: dict[str, _FormatPlan] = field(default_factory=dict)
+    additional: _FormatPlan | None = None
+    items: _FormatPlan | None = None
+
+
+_plans = IdentityCache(VALIDATOR_CACHE_SIZE)
+_plans_lock = threading.Lock()
+
+
+def _build_plan(schema, resolver, plans: dict[int, _FormatPlan]) -> _FormatPlan:
+    # Keywords next to `$ref` are ignored in draft 7.
+    while isinstance(schema, dict) and isinstance(ref := schema.get("$ref"), str):
+        resolved = resolver.lookup(ref)
+        schema, resolver = resolved.contents, resolved.resolver
+
+    # Recursive schemas share their plan.
+    if (plan := plans.get(id(schema))) is not None:
+        return plan
+    plan = plans[id(schema)] = _FormatPlan()
+    if not isinstance(schema, dict):
+        return plan
+
+    plan.format = schema.get("format")
+    for name, subschema in schema.get("properties", {}).items():
+        plan.properties[name] = _build_plan(subschema, resolver, plans)
+    if isinstance(additional := schema.get("additionalProperties"), dict):
+        plan.additional = _build_plan(additional, resolver, plans)
+    if isinstance(items := schema.get("items"), dict):
+        plan.items = _build_plan(items, resolver, plans)
+    return plan
+
+
+def _get_plan(schema: dict) -> _FormatPlan:
+    with _plans_lock:
+        if (plan := _plans.get(schema)) is not None:
+            return plan
+
+        uri = schema.get("$id", "")
+        resource = Resource.from_contents(schema, default_specification=DRAFT7)
+        resolver = get_registry().with_resource(uri, resource).resolver(base_uri=uri)
+        plan = _build_plan(schema, resolver, {})
+
+        _plans.put(schema, plan)
+        return plan
+
+
+def _collect(plan: _FormatPlan, instance: Any, values: dict[str, set[str]]) -> None:
+    if plan.format is not None and isinstance(instance, str):
+        values.setdefault(plan.format, set()).add(instance)
+
+    if isinstance(instance, dict):
+        for key, value in instance.items():
+            if (subplan := plan.properties.get(key, plan.additional)) is not None:
+                _collect(subplan, value, values)
+    elif isinstance(instance, list) and plan.items is not None:
+        for item in instance:
+            _collect(plan.items, item, values)
+
+
+def collect_format_values(
+    documents: Iterable[tuple[dict, Any]],
+    values: dict[str, set[str]] | None = None,
+) -> dict[str, set[str]]:
+    """Collect distinct `format` annotated string values of documents.
+
+    Values are found through `properties`, `additionalProperties` and `items`,
+    values only reachable otherwise, e.g. through `anyOf`, are checked when
+    validating as usual.
+
+    Args:
+        documents: Schema and data pairs
+        values: Format name to values mapping to add to, a new one if None
+
+    Returns:
+        Format name to distinct values mapping, e.g. `{"uri": {"https://..."}}`
+
+    """
+    values = {} if values is None else values
+    for schema, data in documents:
+        _collect(_get_plan(schema), data, values)
+    return values
+
+
+class LookupFormatChecker(FormatChecker):
+    """Format checker answering from precomputed results.
+
+    Values not checked ahead fall back to the wrapped checker.
+    """
+
+    def __init__(
+        self,
+        format_checker: FormatChecker,
+        results: dict[tuple[str, str], bool],
+    ) -> None:
+        """Initialize the checker.
+
+        Args:
+            format_checker: Checker of the format profile, e.g. from `get_format_checker`
+            results: Format name and value to conformance mapping
+
+        """
+        super().__init__(formats=())
+        self.checkers = format_checker.checkers
+        self.format_checker = format_checker
+        self.results = results
+
+    def check(self, instance, format):  # noqa: A002
+        """Check the instance conforms to the format, see `FormatChecker.check`."""
+        result = self.results.get((format, instance)) if isinstance(instance, str) else None
+        if result is None:
+            return self.format_checker.check(instance, format)
+        if not result:
+            error_message = f"{instance!r} is not a {format!r}"
+            raise FormatError(error_message)
+        return None
+
+
+def check_format_values(
+    values: dict[str, set[str]],
+    format_profile: str = DEFAULT_FORMAT_PROFILE,
+) -> LookupFormatChecker:
+    """Check each distinct value once.
+
+    Args:
+        values: Format name to values mapping, e.g. from `collect_format_values`
+        format_profile: Format check profile, see `format_engines`
+
+    Returns:
+        A format checker answering from the results
+
+    """
+    format_checker = get_format_checker(format_profile)
+    results = {
+        (format_name, value): format_checker.conforms(value, format_name)
+        for format_name, format_values in values.items()
+        if format_name in format_checker.checkers
+        for value in format_values
+    }
+    return LookupFormatChecker(format_checker, results)
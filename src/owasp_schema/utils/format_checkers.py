@@ -0,0 +1,27 @@
+"""Format checkers built by `format_engines`.
+
+Kept apart from `format_engines`, listing format profiles doesn't import
+`jsonschema`.
+"""
+
+from jsonschema import FormatChecker
+from jsonschema.exceptions import FormatError
+
+from owasp_schema.utils.metrics import metrics
+
+
+class InstrumentedFormatChecker(FormatChecker):
+    """Format checker recording format check metrics when enabled."""
+
+    def check(self, instance, format):  # noqa: A002
+        """Check the instance conforms to the format, see `FormatChecker.check`."""
+        if not metrics.enabled or format not in self.checkers:
+            return super().check(instance, format)
+
+        try:
+            super().check(instance, format)
+        except FormatError:
+            metrics.observe_format_check(format, passed=False)
+            raise
+        metrics.observe_format_check(format, passed=True)
+        return None
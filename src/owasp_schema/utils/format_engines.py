@@ -0,0 +1,147 @@
+"""Format check engines.
+
+Format checks are grouped into profiles selectable per validator or per call:
+
+- `strict`: the `validators` library, the default
+- `fast`: precompiled regular expressions, standard library only
+- `skip`: no format checks, for re-validating trusted data
+
+Formats not overridden by a profile fall back to the `jsonschema` built-in
+checks, except in the `skip` profile. Custom profiles and engines can be added
+with `register_format_engine`.
+"""
+
+from __future__ import annotations
+
+import re
+import threading
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from jsonschema import FormatChecker
+
+FAST = "fast"
+SKIP = "skip"
+STRICT = "strict"
+
+DEFAULT_FORMAT_PROFILE = STRICT
+
+EMAIL_REGEX = re.compile(
+    r"^(?=.{1,64}@)[a-z0-9!#$%&'*+/=?^_`{|}~-]+(?:\.[a-z0-9!#$%&'*+/=?^_`{|}~-]+)*"
+    r"@(?=.{1,253}$)(?:[a-z0-9](?:[a-z0-9-]{0,61}[a-z0-9])?\.)+[a-z]{2,63}$",
+    re.IGNORECASE,
+)
+URI_REGEX = re.compile(
+    r"^(?:https?|ftps?)://"
+    r"(?:[^\s:@/]+(?::[^\s@/]*)?@)?"
+    r"(?:(?:[a-z0-9](?:[a-z0-9-]{0,61}[a-z0-9])?\.)+[a-z]{2,63}\.?"
+    r"|\d{1,3}(?:\.\d{1,3}){3}"
+    r"|\[[0-9a-f:.]+\])"
+    r"(?::\d{1,5})?"
+    r"(?:[/?#]\S*)?$",
+    re.IGNORECASE,
+)
+
+
+# `validators` and `jsonschema` are imported on first use, listing profiles
+# doesn't load them.
+def check_email_format(value):
+    import validators  # noqa: PLC0415
+
+    return validators.email(value)
+
+
+def check_uri_format(value):
+    import validators  # noqa: PLC0415
+
+    return validators.url(value)
+
+
+def check_email_format_fast(value):
+    return isinstance(value, str) and EMAIL_REGEX.match(value) is not None
+
+
+def check_uri_format_fast(value):
+    return isinstance(value, str) and URI_REGEX.match(value) is not None
+
+
+# Profile name to format name to check function mapping.
+_engines: dict[str, dict[str, Callable]] = {
+    FAST: {"email": check_email_format_fast, "uri": check_uri_format_fast},
+    SKIP: {},
+    STRICT: {"email": check_email_format, "uri": check_uri_format},
+}
+_format_checkers: dict[str, FormatChecker] = {}
+_lock = threading.Lock()
+
+
+def list_format_profiles() -> list[str]:
+    """List available format profile names."""
+    with _lock:
+        return sorted(_engines)
+
+
+def register_format_engine(profile: str, format_name: str, check: Callable) -> None:
+    """Register a format check for a profile, creating the profile if needed.
+
+    Args:
+        profile: Profile name, e.g. `fast`
+        format_name: JSON schema format name, e.g. `uri`
+        check: Function returning a truthy value for conforming values
+
+    """
+    with _lock:
+        _engines.setdefault(profile, {})[format_name] = check
+        _format_checkers.pop(profile, None)
+
+
+def get_format_checker(profile: str = DEFAULT_FORMAT_PROFILE) -> FormatChecker:
+    """Get the format checker for a profile.
+
+    Checkers are built once and shared between threads, they aren't modified
+    afterwards. Registering an engine replaces the checker of its profile.
+
+    Raises:
+        KeyError: If the profile doesn't exist
+
+    """
+    if (format_checker := _format_checkers.get(profile)) is not None:
+        return format_checker
+
+    with _lock:
+        if (format_checker := _format_checkers.get(profile)) is not None:
+            return format_checker
+
+        from owasp_schema.utils.format_checkers import (  # noqa: PLC0415
+            InstrumentedFormatChecker,
+        )
+
+        if profile not in _engines:
+            error_message = (
+                f"Format profile '{profile}' not found. Available profiles: {sorted(_engines)}"
+            )
+            raise KeyError(error_message)
+
+        format_checker = (
+            InstrumentedFormatChecker(formats=())
+            if profile == SKIP
+            else InstrumentedFormatChecker()
+        )
+        for format_name, check in _engines[profile].items():
+            format_checker.checks(format_name)(check)
+
+        _format_checkers[profile] = format_checker
+        return format_checker
+
+
+def __getattr__(name: str) -> Any:
+    """Import `InstrumentedFormatChecker` on first access, see `format_checkers`."""
+    if name == "InstrumentedFormatChecker":
+        from owasp_schema.utils import format_checkers  # noqa: PLC0415
+
+        return format_checkers.InstrumentedFormatChecker
+
+    error_message = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(error_message)
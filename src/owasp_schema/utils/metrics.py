@@ -0,0 +1,250 @@
+"""Validation metrics.
+
+Records validation call counts, pass/fail counts and latency histograms per
+schema, format check counts, schema loading times and result cache statistics.
+Metrics are exported in the Prometheus text format, either by calling
+`render_prometheus` or by serving `MetricsHandler` over HTTP, see
+`metrics_server`.
+
+Validation and format check metrics are only recorded after `enable_metrics`
+is called.
+"""
+
+from __future__ import annotations
+
+import bisect
+import threading
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from owasp_schema.utils.result_cache import ValidationCache
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+DEFAULT_BUCKETS = (
+    0.0001,
+    0.00025,
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+)
+METRICS_PATH = "/metrics"
+PREFIX = "owasp_schema"
+UNKNOWN_SCHEMA = "unknown"
+
+
+def schema_label(schema) -> str:
+    """Get a metrics label for a schema, e.g. `project` or `Person`."""
+    if not isinstance(schema, dict):
+        return UNKNOWN_SCHEMA
+    if isinstance(schema_id := schema.get("$id"), str):
+        return schema_id.rsplit("/", 1)[-1].removesuffix(".json")
+    return schema.get("title") or UNKNOWN_SCHEMA
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(**labels) -> str:
+    return ",".join(f'{name}="{_escape(str(value))}"' for name, value in labels.items())
+
+
+class _Histogram:
+    def __init__(self, buckets: tuple[float, ...]) -> None:
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+
+    def render(self, name: str, labels: str) -> list[str]:
+        lines = []
+        cumulative = 0
+        for bucket, count in zip((*self.buckets, "+Inf"), self.counts, strict=True):
+            cumulative += count
+            lines.append(f'{name}_bucket{{{labels},le="{bucket}"}} {cumulative}')
+        lines.append(f"{name}_sum{{{labels}}} {self.sum}")
+        lines.append(f"{name}_count{{{labels}}} {cumulative}")
+        return lines
+
+
+class ValidationMetrics:
+    """Thread-safe validation metrics registry."""
+
+    def __init__(self, buckets: tuple[float, ...] = DEFAULT_BUCKETS) -> None:
+        """Initialize empty metrics."""
+        self.buckets = buckets
+        self.enabled = False
+
+        self._caches: dict[str, ValidationCache] = {}
+        self._format_checks: dict[tuple[str, bool], int] = {}
+        self._latencies: dict[str, _Histogram] = {}
+        self._lock = threading.Lock()
+        self._schema_loads: dict[str, tuple[int, float]] = {}
+        self._validations: dict[tuple[str, bool], int] = {}
+
+    def observe_validation(self, schema, *, passed: bool, duration: float) -> None:
+        """Record a validation call."""
+        label = schema_label(schema)
+        with self._lock:
+            key = (label, passed)
+            self._validations[key] = self._validations.get(key, 0) + 1
+            if (histogram := self._latencies.get(label)) is None:
+                histogram = self._latencies[label] = _Histogram(self.buckets)
+            histogram.observe(duration)
+
+    def observe_format_check(self, format_name: str, *, passed: bool) -> None:
+        """Record a format check."""
+        with self._lock:
+            key = (format_name, passed)
+            self._format_checks[key] = self._format_checks.get(key, 0) + 1
+
+    def observe_schema_load(self, loader: str, duration: float) -> None:
+        """Record a schema loader run."""
+        with self._lock:
+            count, total = self._schema_loads.get(loader, (0, 0.0))
+            self._schema_loads[loader] = (count + 1, total + duration)
+
+    def register_cache(self, name: str, cache: ValidationCache) -> None:
+        """Export statistics of a result cache under the name."""
+        with self._lock:
+            self._caches[name] = cache
+
+    def reset(self) -> None:
+        """Reset recorded validation and format check metrics."""
+        with self._lock:
+            self._format_checks.clear()
+            self._latencies.clear()
+            self._validations.clear()
+
+    def _render_validations(self) -> list[str]:
+        lines = [
+            f"# HELP {PREFIX}_validations_total Validation calls by schema and result.",
+            f"# TYPE {PREFIX}_validations_total counter",
+        ]
+        lines.extend(
+            f"{PREFIX}_validations_total{{{_labels(schema=label, result=_result(passed))}}} "
+            f"{count}"
+            for (label, passed), count in sorted(self._validations.items())
+        )
+
+        name = f"{PREFIX}_validation_duration_seconds"
+        lines.extend(
+            (
+                f"# HELP {name} Validation latency by schema.",
+                f"# TYPE {name} histogram",
+            ),
+        )
+        for label, histogram in sorted(self._latencies.items()):
+            lines.extend(histogram.render(name, _labels(schema=label)))
+        return lines
+
+    def _render_format_checks(self) -> list[str]:
+        lines = [
+            f"# HELP {PREFIX}_format_checks_total Format checks by format and result.",
+            f"# TYPE {PREFIX}_format_checks_total counter",
+        ]
+        lines.extend(
+            f"{PREFIX}_format_checks_total{{{_labels(format=name, result=_result(passed))}}} "
+            f"{count}"
+            for (name, passed), count in sorted(self._format_checks.items())
+        )
+        return lines
+
+    def _render_schema_loads(self) -> list[str]:
+        lines = [
+            f"# HELP {PREFIX}_schema_loads_total Schema loader runs.",
+            f"# TYPE {PREFIX}_schema_loads_total counter",
+        ]
+        lines.extend(
+            f"{PREFIX}_schema_loads_total{{{_labels(loader=loader)}}} {count}"
+            for loader, (count, _) in sorted(self._schema_loads.items())
+        )
+        lines.extend(
+            (
+                f"# HELP {PREFIX}_schema_load_seconds_total Time spent loading schemas.",
+                f"# TYPE {PREFIX}_schema_load_seconds_total counter",
+            ),
+        )
+        lines.extend(
+            f"{PREFIX}_schema_load_seconds_total{{{_labels(loader=loader)}}} {total}"
+            for loader, (_, total) in sorted(self._schema_loads.items())
+        )
+        return lines
+
+    def _render_caches(self) -> list[str]:
+        stats = {name: cache.stats() for name, cache in sorted(self._caches.items())}
+        lines: list[str] = []
+        for metric, metric_type, description, value in (
+            ("cache_hits_total", "counter", "Result cache hits.", "hits"),
+            ("cache_misses_total", "counter", "Result cache misses.", "misses"),
+            ("cache_evictions_total", "counter", "Result cache evictions.", "evictions"),
+            ("cache_entries", "gauge", "Result cache entries.", "entries"),
+            ("cache_bytes", "gauge", "Approximate result cache size.", "bytes"),
+            ("cache_hit_ratio", "gauge", "Result cache hit ratio.", "hit_rate"),
+        ):
+            lines.extend(
+                (
+                    f"# HELP {PREFIX}_{metric} {description}",
+                    f"# TYPE {PREFIX}_{metric} {metric_type}",
+                ),
+            )
+            lines.extend(
+                f"{PREFIX}_{metric}{{{_labels(cache=name)}}} {getattr(cache_stats, value)}"
+                for name, cache_stats in stats.items()
+            )
+        return lines
+
+    def render_prometheus(self) -> str:
+        """Render all metrics in the Prometheus text exposition format."""
+        with self._lock:
+            lines = [
+                *self._render_validations(),
+                *self._render_format_checks(),
+                *self._render_schema_loads(),
+            ]
+            caches_lines = self._render_caches()
+        return "\n".join((*lines, *caches_lines)) + "\n"
+
+
+def _result(passed: bool) -> str:  # noqa: FBT001
+    return "pass" if passed else "fail"
+
+
+metrics = ValidationMetrics()
+
+
+def enable_metrics() -> None:
+    """Start recording validation and format check metrics."""
+    metrics.enabled = True
+
+
+def disable_metrics() -> None:
+    """Stop recording validation and format check metrics."""
+    metrics.enabled = False
+
+
+def render_prometheus() -> str:
+    """Render the global metrics in the Prometheus text exposition format."""
+    return metrics.render_prometheus()
+
+
+def __getattr__(name: str) -> Any:
+    """Import the HTTP server on first access, see `metrics_server`."""
+    if name in {"MetricsHandler", "start_metrics_server"}:
+        from owasp_schema.utils import metrics_server  # noqa: PLC0415
+
+        return getattr(metrics_server, name)
+
+    error_message = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(error_message)
@@ -0,0 +1,41 @@
+"""Validation metrics HTTP server.
+
+Kept apart from `metrics`, validation doesn't import the HTTP server.
+"""
+
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from owasp_schema.utils.metrics import CONTENT_TYPE, METRICS_PATH, render_prometheus
+
+
+class MetricsHandler(BaseHTTPRequestHandler):
+    """HTTP handler serving the global metrics on `/metrics`."""
+
+    def do_GET(self) -> None:
+        """Serve the metrics."""
+        if self.path.split("?", 1)[0] != METRICS_PATH:
+            self.send_error(404)
+            return
+
+        body = render_prometheus().encode()
+        self.send_response(200)
+        self.send_header("Content-Type", CONTENT_TYPE)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args) -> None:  # noqa: A002
+        """Don't log scrapes."""
+
+
+def start_metrics_server(port: int, address: str = "") -> ThreadingHTTPServer:
+    """Serve the global metrics over HTTP from a daemon thread.
+
+    Returns:
+        The running server, call `shutdown()` to stop it
+
+    """
+    server = ThreadingHTTPServer((address, port), MetricsHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
@@ -0,0 +1,166 @@
+"""Single-pass validation and normalization.
+
+The normalizing validator fills in `default` values of missing properties,
+strips surrounding whitespace from strings and canonicalizes `uri` and `email`
+values while validating, in the same traversal. The document is
+normalized in place, so no extra copy or walk is needed.
+"""
+
+import copy
+from urllib.parse import urlsplit, urlunsplit
+
+from jsonschema.exceptions import best_match
+from jsonschema.validators import extend, validator_for
+
+from owasp_schema.utils.format_engines import DEFAULT_FORMAT_PROFILE
+from owasp_schema.utils.schema_validators import ValidatorCache, get_registry
+
+_normalizing_classes: dict[type, type] = {}
+
+
+def normalize_email(value: str) -> str:
+    """Lowercase the domain of an email address."""
+    local_part, separator, domain = value.rpartition("@")
+    return f"{local_part}{separator}{domain.lower()}" if separator else value
+
+
+def normalize_uri(value: str) -> str:
+    """Lowercase the scheme and host of a URI."""
+    try:
+        parts = urlsplit(value)
+    except ValueError:
+        return value
+    if not parts.scheme or not parts.netloc:
+        return value
+
+    user_info, separator, host = parts.netloc.rpartition("@")
+    return urlunsplit(
+        (
+            parts.scheme.lower(),
+            f"{user_info}{separator}{host.lower()}",
+            parts.path,
+            parts.query,
+            parts.fragment,
+        ),
+    )
+
+
+FORMAT_NORMALIZERS = {
+    "email": normalize_email,
+    "uri": normalize_uri,
+}
+
+
+def normalize_string(value: str, schema) -> str:
+    """Normalize a string according to its schema."""
+    value = value.strip()
+    if isinstance(schema, dict) and (
+        normalizer := FORMAT_NORMALIZERS.get(schema.get("format", ""))
+    ):
+        return normalizer(value)
+    return value
+
+
+def _resolve(validator, schema):
+    """Follow the `$ref`s of a subschema, e.g. to a `common.json` definition."""
+    resolver = validator._resolver  # noqa: SLF001
+    while isinstance(schema, dict) and isinstance(ref := schema.get("$ref"), str):
+        resolved = resolver.lookup(ref)
+        schema, resolver = resolved.contents, resolved.resolver
+    return schema
+
+
+def _normalize_items(validator, instance: list, items) -> None:
+    items = _resolve(validator, items)
+    if not isinstance(items, dict):
+        return
+    for index, item in enumerate(instance):
+        if isinstance(item, str):
+            instance[index] = normalize_string(item, items)
+
+
+def _fill_defaults(validator, instance: dict, properties: dict) -> None:
+    for name, property_schema in properties.items():
+        if name not in instance:
+            subschema = _resolve(validator, property_schema)
+            if isinstance(subschema, dict) and "default" in subschema:
+                instance[name] = copy.deepcopy(subschema["default"])
+
+
+def _normalize_properties(validator, instance: dict, properties: dict) -> None:
+    for name, property_schema in properties.items():
+        if isinstance(value := instance.get(name), str):
+            instance[name] = normalize_string(value, _resolve(validator, property_schema))
+    _fill_defaults(validator, instance, properties)
+
+
+def _normalizing_class(validator_class: type) -> type:
+    if (normalizing_class := _normalizing_classes.get(validator_class)) is not None:
+        return normalizing_class
+
+    validate_items = validator_class.VALIDATORS["items"]  # type: ignore[attr-defined]
+    validate_properties = validator_class.VALIDATORS["properties"]  # type: ignore[attr-defined]
+    validate_required = validator_class.VALIDATORS["required"]  # type: ignore[attr-defined]
+
+    def items(validator, items, instance, schema):
+        if validator.is_type(instance, "array"):
+            _normalize_items(validator, instance, items)
+        yield from validate_items(validator, items, instance, schema)
+
+    def properties(validator, properties, instance, schema):
+        if validator.is_type(instance, "object"):
+            _normalize_properties(validator, instance, properties)
+        yield from validate_properties(validator, properties, instance, schema)
+
+    def required(validator, required, instance, schema):
+        # Keywords are validated in schema order, defaults are filled here in
+        # case `required` comes before `properties`.
+        if validator.is_type(instance, "object"):
+            _fill_defaults(validator, instance, schema.get("properties", {}))
+        yield from validate_required(validator, required, instance, schema)
+
+    normalizing_class = extend(
+        validator_class,
+        {"items": items, "properties": properties, "required": required},
+    )
+    _normalizing_classes[validator_class] = normalizing_class
+    return normalizing_class
+
+
+def _build_normalizing_validator(schema, profile_format_checker):
+    validator_class = validator_for(schema)
+    validator_class.check_schema(schema)
+    return _normalizing_class(validator_class)(
+        schema,
+        format_checker=profile_format_checker,
+        registry=get_registry(),
+    )
+
+
+# Validators are built under the cache lock, which guards `_normalizing_classes`.
+_validators = ValidatorCache(_build_normalizing_validator)
+
+
+def get_normalizing_validator(schema, format_profile=DEFAULT_FORMAT_PROFILE):
+    """Get a compiled normalizing validator for the schema."""
+    return _validators.get(schema, format_profile)
+
+
+def validate_and_normalize(schema, data, format_profile=DEFAULT_FORMAT_PROFILE):
+    """Validate data against schema, normalizing it in the same traversal.
+
+    The data is modified in place: missing properties get their schema
+    `default`, strings are stripped and `uri`/`email` values are canonicalized.
+    Constraints, including `required`, are checked against the normalized data
+    whatever the order of the schema keywords.
+
+    Returns:
+        Tuple of the normalized data and the error message, None if valid
+
+    """
+    if isinstance(data, str):
+        data = data.strip()
+
+    validator = get_normalizing_validator(schema, format_profile)
+    error = best_match(validator.iter_errors(data))
+    return data, error.message if error else None
@@ -0,0 +1,183 @@
+"""Streaming validation report writers.
+
+Reports are written incrementally as results arrive, e.g. from
+`validate_files`, so memory use stays constant regardless of the number of
+documents and records appear as soon as they are available.
+
+- `JsonlReport`: one JSON record per document
+- `SarifReport`: SARIF 2.1.0 log of failing documents for code scanning upload
+"""
+
+from __future__ import annotations
+
+import json
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import TYPE_CHECKING, Self, TextIO
+from urllib.parse import quote
+
+from owasp_schema import __version__
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from types import TracebackType
+
+    from owasp_schema.utils.bulk_validation import ValidationResult
+
+SARIF_RULE_ID = "owasp-schema-validation"
+SARIF_SCHEMA = "https://json.schemastore.org/sarif-2.1.0.json"
+# Base URI ID of artifact locations, resolved by `originalUriBaseIds`.
+SARIF_SRCROOT = "SRCROOT"
+SARIF_VERSION = "2.1.0"
+TOOL_NAME = "owasp-schema"
+TOOL_URI = "https://github.com/OWASP/nest-schema"
+
+
+class Report(ABC):
+    """Base streaming report, use as a context manager or call `close`."""
+
+    def __init__(self, stream: TextIO) -> None:
+        """Initialize the report writing to the stream."""
+        self.failed = 0
+        self.passed = 0
+        self.stream = stream
+
+    def __enter__(self) -> Self:
+        """Start the report."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Finish the report."""
+        self.close()
+
+    def write(self, result: ValidationResult) -> None:
+        """Write a validation result."""
+        if result.is_valid:
+            self.passed += 1
+        else:
+            self.failed += 1
+        self._write(result)
+        self.stream.flush()
+
+    @abstractmethod
+    def _write(self, result: ValidationResult) -> None:
+        """Write a validation result in the report format."""
+
+    def close(self) -> None:
+        """Finish the report."""
+        self.stream.flush()
+
+
+class JsonlReport(Report):
+    """JSON Lines report with one record per document."""
+
+    def _write(self, result: ValidationResult) -> None:
+        self.stream.write(f"{json.dumps(result.as_dict())}\n")
+
+
+def _artifact_location(path: str, base_directory: Path) -> dict:
+    absolute_path = Path(path).resolve()
+    try:
+        relative_path = absolute_path.relative_to(base_directory)
+    except ValueError:
+        return {"uri": absolute_path.as_uri()}
+    return {"uri": quote(relative_path.as_posix(), safe="/!:"), "uriBaseId": SARIF_SRCROOT}
+
+
+def sarif_result(result: ValidationResult, base_directory: str | Path | None = None) -> dict:
+    """Convert a failing validation result to a SARIF result object.
+
+    Paths under the base directory, the current directory by default, are
+    relative to `SARIF_SRCROOT`, other paths are absolute file URIs.
+    """
+    base_directory = Path(base_directory or Path.cwd()).resolve()
+    physical_location: dict = {
+        "artifactLocation": _artifact_location(result.path, base_directory),
+    }
+    if result.line is not None:
+        physical_location["region"] = {"startLine": result.line}
+        if result.column is not None:
+            physical_location["region"]["startColumn"] = result.column
+
+    return {
+        "level": "error",
+        "locations": [{"physicalLocation": physical_location}],
+        "message": {"text": result.error},
+        "ruleId": SARIF_RULE_ID,
+    }
+
+
+class SarifReport(Report):
+    """SARIF 2.1.0 report listing failing documents.
+
+    The log header is written on creation and each failure is appended to the
+    results array as it arrives, the log is completed on `close`. Artifact
+    locations are relative to the base directory, declared as `SARIF_SRCROOT`.
+    """
+
+    def __init__(self, stream: TextIO, base_directory: str | Path | None = None) -> None:
+        """Initialize the report and write the SARIF log header.
+
+        Args:
+            stream: Stream to write the log to
+            base_directory: Directory artifact locations are relative to, the
+                current directory if None
+
+        """
+        super().__init__(stream)
+        self._closed = False
+        self.base_directory = Path(base_directory or Path.cwd()).resolve()
+
+        tool = {
+            "driver": {
+                "informationUri": TOOL_URI,
+                "name": TOOL_NAME,
+                "rules": [
+                    {
+                        "id": SARIF_RULE_ID,
+                        "shortDescription": {"text": "OWASP metadata file is invalid."},
+                    },
+                ],
+                "version": __version__,
+            },
+        }
+        # SARIF requires base URIs to end with a slash.
+        base_uris = {SARIF_SRCROOT: {"uri": f"{self.base_directory.as_uri().rstrip('/')}/"}}
+        header = json.dumps({"$schema": SARIF_SCHEMA, "version": SARIF_VERSION})
+        self.stream.write(
+            f'{header[:-1]}, "runs": [{{"tool": {json.dumps(tool)}, '
+            f'"originalUriBaseIds": {json.dumps(base_uris)}, "results": [',
+        )
+
+    def _write(self, result: ValidationResult) -> None:
+        if result.is_valid:
+            return
+        separator = "," if self.failed > 1 else ""
+        self.stream.write(
+            f"{separator}\n{json.dumps(sarif_result(result, self.base_directory))}",
+        )
+
+    def close(self) -> None:
+        """Complete the SARIF log."""
+        if not self._closed:
+            self._closed = True
+            self.stream.write("\n]}]}\n")
+        super().close()
+
+
+def write_report(results: Iterable[ValidationResult], report: Report) -> Report:
+    """Write results to a report as they arrive and finish it.
+
+    Returns:
+        The finished report, e.g. for its `failed` count
+
+    """
+    with report:
+        for result in results:
+            report.write(result)
+    return report
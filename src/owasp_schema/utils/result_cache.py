@@ -0,0 +1,179 @@
+"""Validation result cache.
+
+Repeated payloads are validated once: results are cached under a canonical
+hash of the instance combined with the schema identity and format profile.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any
+
+from owasp_schema.utils.schema_validators import IdentityCache
+
+DEFAULT_MAX_BYTES = 16 * 1024 * 1024
+DEFAULT_MAX_ENTRIES = 10_000
+DIGEST_SIZE = 16
+SCHEMA_KEY_CACHE_SIZE = 128
+
+# Approximate per-entry overhead of the key, tuple and ordered dict node.
+ENTRY_OVERHEAD_BYTES = 200
+
+
+_SCALAR_TAGS = {bool: "b", float: "d", int: "i", type(None): "n"}
+
+
+def _sort_key(key):
+    return (type(key).__name__, repr(key))
+
+
+def _encode(value: Any, parts: list[str]) -> None:
+    # Every value is prefixed with a type tag so that e.g. 1, 1.0, True and "1"
+    # encode differently. Strings and containers carry their length to keep
+    # the encoding unambiguous.
+    value_type = type(value)
+    if value_type is str:
+        parts.extend(("s", str(len(value)), ":", value))
+    elif value_type is dict:
+        parts.extend(("m", str(len(value)), ":"))
+        try:
+            keys = sorted(value)
+        except TypeError:
+            keys = sorted(value, key=_sort_key)
+        for key in keys:
+            _encode(key, parts)
+            _encode(value[key], parts)
+    elif value_type is list or value_type is tuple:
+        parts.extend(("l" if value_type is list else "u", str(len(value)), ":"))
+        for item in value:
+            _encode(item, parts)
+    elif (tag := _SCALAR_TAGS.get(value_type)) is not None:
+        parts.extend((tag, repr(value), ";"))
+    else:
+        representation = repr(value)
+        parts.extend(("o", value_type.__qualname__, str(len(representation)), ":", representation))
+
+
+def canonical_hash(instance: Any) -> bytes:
+    """Hash an instance independently of dictionary key order.
+
+    Values of different types never hash the same, e.g. `1`, `1.0`, `True` and
+    `"1"` all produce different hashes.
+    """
+    parts: list[str] = []
+    _encode(instance, parts)
+    return hashlib.blake2b(
+        "".join(parts).encode("utf-8", "surrogatepass"),
+        digest_size=DIGEST_SIZE,
+    ).digest()
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    """Validation cache statistics."""
+
+    bytes: int
+    entries: int
+    evictions: int
+    hits: int
+    misses: int
+
+    @property
+    def hit_rate(self) -> float:
+        """Share of lookups served from the cache."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class ValidationCache:
+    """Thread-safe LRU cache of validation results.
+
+    Bounded by both the number of entries and their approximate size in bytes.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+    ) -> None:
+        """Initialize an empty cache."""
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+
+        self._bytes = 0
+        self._entries: OrderedDict[tuple, tuple[str | None, int]] = OrderedDict()
+        self._evictions = 0
+        self._hits = 0
+        self._lock = threading.Lock()
+        self._misses = 0
+        self._schema_keys = IdentityCache(SCHEMA_KEY_CACHE_SIZE)
+
+    def __len__(self) -> int:
+        """Return the number of cached results."""
+        return len(self._entries)
+
+    def _schema_key(self, schema: dict) -> bytes:
+        if (schema_key := self._schema_keys.get(schema)) is None:
+            schema_key = canonical_hash(schema)
+            self._schema_keys.put(schema, schema_key)
+        return schema_key
+
+    def key(self, schema: dict, instance: Any, format_profile: str) -> tuple:
+        """Build the cache key of an instance validated against a schema."""
+        with self._lock:
+            schema_key = self._schema_key(schema)
+        return (schema_key, format_profile, canonical_hash(instance))
+
+    def get(self, key: tuple) -> tuple[bool, str | None]:
+        """Look up a result.
+
+        Returns:
+            Tuple of whether the key was found and the cached result
+
+        """
+        with self._lock:
+            if (entry := self._entries.get(key)) is None:
+                self._misses += 1
+                return False, None
+
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return True, entry[0]
+
+    def put(self, key: tuple, result: str | None) -> None:
+        """Store a result, evicting least recently used entries if needed."""
+        size = ENTRY_OVERHEAD_BYTES + (len(result) if result else 0)
+        if size > self.max_bytes:
+            return
+
+        with self._lock:
+            if (previous := self._entries.pop(key, None)) is not None:
+                self._bytes -= previous[1]
+            self._entries[key] = (result, size)
+            self._bytes += size
+
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self._bytes -= evicted_size
+                self._evictions += 1
+
+    def clear(self) -> None:
+        """Remove all entries and reset statistics."""
+        with self._lock:
+            self._bytes = self._evictions = self._hits = self._misses = 0
+            self._entries.clear()
+            self._schema_keys.clear()
+
+    def stats(self) -> CacheStats:
+        """Get a snapshot of the cache statistics."""
+        with self._lock:
+            return CacheStats(
+                bytes=self._bytes,
+                entries=len(self._entries),
+                evictions=self._evictions,
+                hits=self._hits,
+                misses=self._misses,
+            )
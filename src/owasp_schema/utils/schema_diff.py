@@ -0,0 +1,517 @@
+"""Schema change impact analysis.
+
+Compares two versions of the schema set keyword by keyword, classifies every
+change as widening (all previously valid documents stay valid), narrowing
+(some previously valid documents may become invalid) or annotation (no effect
+on validation), and works out which documents need revalidation using a
+field-presence index.
+"""
+
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from owasp_schema import list_schemas
+from owasp_schema.utils.bulk_validation import SCHEMA_NAMES
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+ANNOTATION = "annotation"
+NARROWING = "narrowing"
+WIDENING = "widening"
+
+ANNOTATION_KEYWORDS = frozenset(
+    (
+        "$comment",
+        "$id",
+        "$schema",
+        "default",
+        "description",
+        "enumDescriptions",
+        "examples",
+        "optional",
+        "title",
+    ),
+)
+DEFINITIONS_KEYWORDS = ("$defs", "definitions")
+LOWER_BOUND_KEYWORDS = frozenset(
+    ("exclusiveMinimum", "minItems", "minLength", "minProperties", "minimum"),
+)
+UPPER_BOUND_KEYWORDS = frozenset(
+    ("exclusiveMaximum", "maxItems", "maxLength", "maxProperties", "maximum"),
+)
+SCHEMA_LIST_KEYWORDS = ("allOf", "anyOf", "oneOf")
+# Subschemas whose changes have the opposite effect on the schema, e.g. a
+# widened `not` rejects more documents.
+NEGATING_KEYWORDS = frozenset(("not",))
+# Subschemas whose changes have no consistent effect on the schema, e.g. a
+# widened `oneOf` branch can match along with another one, a widened `if` moves
+# documents from `else` to `then`. Their changes are considered narrowing.
+MIXED_KEYWORDS = frozenset(("if", "oneOf"))
+# Subschemas applying to the same instance as the schema itself.
+IN_PLACE_KEYWORDS = ("else", "if", "not", "then")
+# Changes recorded with these keywords are located at the affected subschema
+# itself, e.g. an added property or a replaced boolean schema.
+STRUCTURAL_KEYWORDS = frozenset(("", *DEFINITIONS_KEYWORDS, "properties"))
+
+ANY_ITEM = "*"
+ROOT_PATH = ""
+
+# Polarities of a subschema, how its changes affect the schema.
+NEGATIVE = -1
+MIXED = 0
+POSITIVE = 1
+
+_MISSING = object()
+
+
+@dataclass(frozen=True)
+class SchemaChange:
+    """A single keyword level schema change."""
+
+    schema_name: str
+    location: str
+    keyword: str
+    kind: str
+    old: Any = None
+    new: Any = None
+
+    @property
+    def pointer(self) -> str:
+        """JSON pointer of the changed value within its schema."""
+        if self.keyword in STRUCTURAL_KEYWORDS:
+            return self.location
+        return f"{self.location}/{_escape(self.keyword)}"
+
+    def as_dict(self) -> dict:
+        """Return the change as a JSON serializable dictionary."""
+        return {
+            "keyword": self.keyword,
+            "kind": self.kind,
+            "new": self.new,
+            "old": self.old,
+            "pointer": self.pointer,
+            "schema_name": self.schema_name,
+        }
+
+
+def _escape(token: str) -> str:
+    return token.replace("~", "~0").replace("/", "~1")
+
+
+def _unescape(token: str) -> str:
+    return token.replace("~1", "/").replace("~0", "~")
+
+
+def _join(path: str, name: str) -> str:
+    return f"{path}.{name}" if path else name
+
+
+def _value(value):
+    return None if value is _MISSING else value
+
+
+def _json_values(values) -> set[str]:
+    return {json.dumps(value, sort_keys=True) for value in values}
+
+
+def _types(value) -> set[str]:
+    return {value} if isinstance(value, str) else set(value)
+
+
+# Predicates telling whether changing a keyword's value from old to new widens
+# the schema. Keywords without a predicate are considered narrowing.
+_WIDENS = {
+    "additionalProperties": lambda _, new: new is True,
+    "enum": lambda old, new: _json_values(new) >= _json_values(old),
+    "required": lambda old, new: _json_values(new) <= _json_values(old),
+    "type": lambda old, new: _types(new) >= _types(old),
+    "uniqueItems": lambda _, new: new is False,
+    **dict.fromkeys(LOWER_BOUND_KEYWORDS, lambda old, new: new < old),
+    **dict.fromkeys(UPPER_BOUND_KEYWORDS, lambda old, new: new > old),
+}
+
+# Keyword values that don't constrain anything when added.
+_NO_OP_VALUES = {"additionalProperties": True, "uniqueItems": False}
+
+
+def _apply_polarity(kind: str, polarity: int) -> str:
+    if kind == ANNOTATION or polarity == POSITIVE:
+        return kind
+    if polarity == MIXED:
+        return NARROWING
+    return WIDENING if kind == NARROWING else NARROWING
+
+
+def _child_polarity(keyword: str, polarity: int) -> int:
+    if keyword in MIXED_KEYWORDS:
+        return MIXED
+    if keyword in NEGATING_KEYWORDS:
+        return -polarity
+    return polarity
+
+
+def classify_keyword_change(keyword: str, old: Any, new: Any) -> str:
+    """Classify a change of a single non-subschema keyword.
+
+    Unknown keyword changes are considered narrowing.
+    """
+    if keyword in ANNOTATION_KEYWORDS:
+        return ANNOTATION
+
+    if old is _MISSING:
+        widens = keyword in _NO_OP_VALUES and new is _NO_OP_VALUES[keyword]
+    elif new is _MISSING:
+        widens = True
+    else:
+        widens = keyword in _WIDENS and _WIDENS[keyword](old, new)
+
+    return WIDENING if widens else NARROWING
+
+
+class _SchemaDiff:
+    """Collects changes between two versions of a single schema."""
+
+    def __init__(self, schema_name: str) -> None:
+        self.changes: list[SchemaChange] = []
+        self.schema_name = schema_name
+
+    def add(self, location, keyword, kind, old, new):
+        self.changes.append(
+            SchemaChange(
+                schema_name=self.schema_name,
+                location=location,
+                keyword=keyword,
+                kind=kind,
+                old=_value(old),
+                new=_value(new),
+            ),
+        )
+
+    def diff(self, location, old, new, polarity=POSITIVE):
+        if not isinstance(old, dict) or not isinstance(new, dict):
+            # Boolean schemas.
+            if old != new:
+                kind = WIDENING if new is True or old is False else NARROWING
+                self.add(location, "", _apply_polarity(kind, polarity), old, new)
+            return
+
+        for keyword in sorted(old.keys() | new.keys()):
+            old_value = old.get(keyword, _MISSING)
+            new_value = new.get(keyword, _MISSING)
+            if old_value == new_value:
+                continue
+
+            both_present = old_value is not _MISSING and new_value is not _MISSING
+            child_polarity = _child_polarity(keyword, polarity)
+            if keyword == "properties" or keyword in DEFINITIONS_KEYWORDS:
+                self.diff_members(location, keyword, old, new, polarity)
+            elif both_present and isinstance(old_value, dict) and isinstance(new_value, dict):
+                self.diff(
+                    f"{location}/{_escape(keyword)}",
+                    old_value,
+                    new_value,
+                    child_polarity,
+                )
+            elif (
+                both_present
+                and keyword in SCHEMA_LIST_KEYWORDS
+                and len(old_value) == len(new_value)
+            ):
+                for index, items in enumerate(zip(old_value, new_value, strict=True)):
+                    self.diff(f"{location}/{keyword}/{index}", *items, child_polarity)
+            else:
+                kind = _apply_polarity(
+                    classify_keyword_change(keyword, old_value, new_value),
+                    polarity,
+                )
+                self.add(location, keyword, kind, old_value, new_value)
+
+    def diff_members(self, location, keyword, old, new, polarity=POSITIVE):
+        old_members = old.get(keyword, {})
+        new_members = new.get(keyword, {})
+
+        for name in sorted(old_members.keys() | new_members.keys()):
+            member_location = f"{location}/{keyword}/{_escape(name)}"
+            old_member = old_members.get(name, _MISSING)
+            new_member = new_members.get(name, _MISSING)
+            if old_member is not _MISSING and new_member is not _MISSING:
+                self.diff(member_location, old_member, new_member, polarity)
+                continue
+
+            added = new_member is not _MISSING
+            if keyword == "properties":
+                # A property that appears where additional properties were
+                # forbidden widens the schema, one that disappears from a
+                # closed object narrows it.
+                closed = (new if not added else old).get("additionalProperties") is False
+                kind = WIDENING if added == closed else NARROWING
+            else:
+                # Unreferenced definitions have no effect, removing a
+                # referenced one breaks resolution.
+                kind = ANNOTATION if added else NARROWING
+            kind = _apply_polarity(kind, polarity)
+            self.add(member_location, keyword, kind, old_member, new_member)
+
+
+def diff_schemas(old: dict, new: dict, schema_name: str = "") -> list[SchemaChange]:
+    """Compare two versions of a schema.
+
+    Args:
+        old: The previous schema version
+        new: The current schema version
+        schema_name: Schema name recorded on the changes
+
+    Returns:
+        Keyword level changes ordered by location
+
+    """
+    schema_diff = _SchemaDiff(schema_name)
+    schema_diff.diff(ROOT_PATH, old, new)
+    return schema_diff.changes
+
+
+def diff_schema_sets(old: dict[str, dict], new: dict[str, dict]) -> list[SchemaChange]:
+    """Compare two versions of a schema set, e.g. `get_all_schemas()` results."""
+    changes: list[SchemaChange] = []
+    for schema_name in sorted(old.keys() | new.keys()):
+        old_schema = old.get(schema_name, {})
+        new_schema = new.get(schema_name, {})
+        changes.extend(diff_schemas(old_schema, new_schema, schema_name))
+    return changes
+
+
+def load_schema_set(directory: str | Path) -> dict[str, dict]:
+    """Load a schema set from a directory with the schema JSON files."""
+    schemas = {}
+    for schema_name in list_schemas():
+        schema_path = Path(directory) / f"{schema_name}.json"
+        if schema_path.exists():
+            schemas[schema_name] = json.loads(schema_path.read_text(encoding="utf-8"))
+    return schemas
+
+
+def _parse_ref(ref: str, schema_name: str) -> tuple[str, str]:
+    resource, _, pointer = ref.partition("#")
+    if resource:
+        schema_name = resource.rsplit("/", 1)[-1].removesuffix(".json")
+    return schema_name, pointer
+
+
+def _resolve_pointer(schema, pointer: str):
+    for token in filter(None, pointer.split("/")):
+        schema = schema[_unescape(token)]
+    return schema
+
+
+def _subschemas(location: str, schema: dict, path: str):
+    """Yield (location, subschema, document path) of the schema's children."""
+    for name, subschema in schema.get("properties", {}).items():
+        yield f"{location}/properties/{_escape(name)}", subschema, _join(path, name)
+
+    items = schema.get("items")
+    if isinstance(items, dict):
+        yield f"{location}/items", items, _join(path, ANY_ITEM)
+    elif isinstance(items, list):
+        for index, item in enumerate(items):
+            yield f"{location}/items/{index}", item, _join(path, ANY_ITEM)
+
+    yield from _in_place_subschemas(location, schema, path)
+
+
+def _in_place_subschemas(location: str, schema: dict, path: str):
+    """Yield (location, subschema, document path) of children mapped to the schema's path."""
+    # Names of the members these apply to aren't known, they are mapped to the
+    # object holding the members.
+    if isinstance(additional := schema.get("additionalProperties"), dict):
+        yield f"{location}/additionalProperties", additional, path
+    for pattern, subschema in schema.get("patternProperties", {}).items():
+        yield f"{location}/patternProperties/{_escape(pattern)}", subschema, path
+    for keyword in IN_PLACE_KEYWORDS:
+        if isinstance(subschema := schema.get(keyword), dict):
+            yield f"{location}/{keyword}", subschema, path
+    for name, dependency in schema.get("dependencies", {}).items():
+        if isinstance(dependency, dict):
+            yield f"{location}/dependencies/{_escape(name)}", dependency, path
+    for keyword in SCHEMA_LIST_KEYWORDS:
+        for index, subschema in enumerate(schema.get(keyword, ())):
+            yield f"{location}/{keyword}/{index}", subschema, path
+
+
+class _LocationMap:
+    """Maps schema locations of a schema set to document path patterns."""
+
+    def __init__(self, schemas: dict[str, dict]) -> None:
+        self.document = ""
+        self.locations: dict[tuple[str, str], set] = {}
+        self.schemas = schemas
+
+    def resolve(self, ref: str, schema_name: str):
+        target = _parse_ref(ref, schema_name)
+        try:
+            return target, _resolve_pointer(self.schemas[target[0]], target[1])
+        except (KeyError, TypeError):
+            return target, None
+
+    def visit(self, schema_name, location, schema, path, refs):
+        self.locations.setdefault((schema_name, location), set()).add((self.document, path))
+        if not isinstance(schema, dict):
+            return
+
+        # Follow references once per branch to stay finite on recursive schemas.
+        if isinstance(ref := schema.get("$ref"), str):
+            target, target_schema = self.resolve(ref, schema_name)
+            if target not in refs and target_schema is not None:
+                target_schema_name, target_location = target
+                self.visit(
+                    target_schema_name,
+                    target_location,
+                    target_schema,
+                    path,
+                    refs | {target},
+                )
+
+        for child_location, child_schema, child_path in _subschemas(location, schema, path):
+            self.visit(schema_name, child_location, child_schema, child_path, refs)
+
+
+def map_schema_locations(schemas: dict[str, dict]) -> dict[tuple[str, str], set]:
+    """Map schema locations to the document paths they validate.
+
+    `$ref`s are followed, so a `common.json` definition maps to every place a
+    document schema uses it.
+
+    Returns:
+        Mapping of (schema name, JSON pointer) to a set of
+        (document schema name, document path pattern) pairs
+
+    """
+    location_map = _LocationMap(schemas)
+    for document in SCHEMA_NAMES:
+        if document in schemas:
+            location_map.document = document
+            location_map.visit(
+                document,
+                ROOT_PATH,
+                schemas[document],
+                ROOT_PATH,
+                frozenset(((document, ROOT_PATH),)),
+            )
+    return location_map.locations
+
+
+def document_paths(data: Any) -> set[str]:
+    """Collect path patterns present in a document.
+
+    Array indices are replaced with `*`, e.g. `leaders.*.github`. The root path
+    is always present.
+    """
+    paths = {ROOT_PATH}
+    stack = [(ROOT_PATH, data)]
+    while stack:
+        path, value = stack.pop()
+        if isinstance(value, dict):
+            children = [(_join(path, str(key)), child) for key, child in value.items()]
+        elif isinstance(value, list):
+            item_path = _join(path, ANY_ITEM)
+            children = [(item_path, child) for child in value]
+        else:
+            continue
+
+        for child_path, child in children:
+            paths.add(child_path)
+            stack.append((child_path, child))
+    return paths
+
+
+class FieldPresenceIndex:
+    """Index of document path patterns to the documents containing them."""
+
+    def __init__(self) -> None:
+        """Initialize an empty index."""
+        self._documents: dict[str, tuple[str, set[str]]] = {}
+        self._paths: dict[tuple[str, str], set[str]] = {}
+
+    def __contains__(self, document_id: str) -> bool:
+        """Check whether the document is indexed."""
+        return document_id in self._documents
+
+    def __len__(self) -> int:
+        """Return the number of indexed documents."""
+        return len(self._documents)
+
+    def add(self, document_id: str, schema_name: str, data: Any) -> None:
+        """Add or replace a document."""
+        self.remove(document_id)
+        paths = document_paths(data)
+        self._documents[document_id] = (schema_name, paths)
+        for path in paths:
+            self._paths.setdefault((schema_name, path), set()).add(document_id)
+
+    def remove(self, document_id: str) -> None:
+        """Remove a document if indexed."""
+        if (entry := self._documents.pop(document_id, None)) is None:
+            return
+
+        schema_name, paths = entry
+        for path in paths:
+            documents = self._paths[(schema_name, path)]
+            documents.discard(document_id)
+            if not documents:
+                del self._paths[(schema_name, path)]
+
+    def documents(self, schema_name: str, path: str = ROOT_PATH) -> set[str]:
+        """Get documents of a schema that contain the path."""
+        return set(self._paths.get((schema_name, path), ()))
+
+
+def _mapped_paths(locations: dict[tuple[str, str], set], schema_name: str, location: str):
+    while (schema_name, location) not in locations:
+        if location == ROOT_PATH:
+            # Unreferenced, e.g. an unused definition.
+            return set()
+        location = location.rpartition("/")[0]
+    return locations[(schema_name, location)]
+
+
+def affected_documents(
+    changes: Iterable[SchemaChange],
+    index: FieldPresenceIndex,
+    old_schemas: dict[str, dict],
+    new_schemas: dict[str, dict],
+) -> set[str]:
+    """Get documents that may change validity due to the schema changes.
+
+    Only narrowing changes can invalidate a document, so a widening-only change
+    set returns no documents. A document is affected when it contains the path
+    a narrowing change applies to. Changes at locations that aren't mapped to
+    document paths, e.g. under `propertyNames`, apply to the path of the nearest
+    mapped parent location, the document root at worst.
+
+    Args:
+        changes: Changes returned by `diff_schema_sets`
+        index: Field-presence index of the corpus
+        old_schemas: The previous schema set
+        new_schemas: The current schema set
+
+    Returns:
+        IDs of the documents to revalidate
+
+    """
+    narrowing = [change for change in changes if change.kind == NARROWING]
+    if not narrowing:
+        return set()
+
+    locations = map_schema_locations(old_schemas)
+    for key, paths in map_schema_locations(new_schemas).items():
+        locations.setdefault(key, set()).update(paths)
+
+    documents: set[str] = set()
+    for change in narrowing:
+        for schema_name, path in _mapped_paths(locations, change.schema_name, change.location):
+            documents.update(index.documents(schema_name, path))
+    return documents
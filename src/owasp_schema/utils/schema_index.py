@@ -0,0 +1,86 @@
+"""Schema index for editor integrations.
+
+Maps document property paths, e.g. `("community", "*", "platform")` with `*`
+standing for array items, to the documentation and allowed values declared in
+the schema. `$ref` references, e.g. to `common.json` definitions, are resolved.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from functools import lru_cache
+
+from referencing import Resource
+from referencing.jsonschema import DRAFT7
+
+from owasp_schema import get_schema
+from owasp_schema.utils.schema_validators import get_registry
+
+ITEMS = "*"
+
+
+@dataclass(frozen=True)
+class SchemaIndexEntry:
+    """Documentation and allowed values of a document property."""
+
+    description: str | None = None
+    enum: tuple = ()
+    enum_descriptions: tuple[str, ...] = ()
+    properties: tuple[str, ...] = ()
+    required: tuple[str, ...] = ()
+    type: str | None = None
+
+    def enum_items(self) -> list[tuple[object, str | None]]:
+        """Get the allowed values along with their descriptions, if any."""
+        descriptions = (*self.enum_descriptions, *(None,) * len(self.enum))
+        return list(zip(self.enum, descriptions, strict=False))
+
+
+class _SchemaIndexBuilder:
+    def __init__(self) -> None:
+        self.index: dict[tuple[str, ...], SchemaIndexEntry] = {}
+
+    def add(self, schema: dict, path: tuple[str, ...], resolver, seen: frozenset) -> None:
+        recursive = False
+        if isinstance(ref := schema.get("$ref"), str):
+            resolved = resolver.lookup(ref)
+            # Recursive references are indexed once per branch to stay finite.
+            recursive = id(resolved.contents) in seen
+            seen |= {id(resolved.contents)}
+            # Keywords next to `$ref`, e.g. a description, take precedence.
+            schema = {**resolved.contents, **schema}
+            resolver = resolved.resolver
+
+        properties = schema.get("properties", {})
+        self.index[path] = SchemaIndexEntry(
+            description=schema.get("description"),
+            enum=tuple(schema.get("enum", ())),
+            enum_descriptions=tuple(schema.get("enumDescriptions", ())),
+            properties=tuple(properties),
+            required=tuple(schema.get("required", ())),
+            type=schema.get("type") if isinstance(schema.get("type"), str) else None,
+        )
+        if recursive:
+            return
+
+        for name, subschema in properties.items():
+            if isinstance(subschema, dict):
+                self.add(subschema, (*path, name), resolver, seen)
+        if isinstance(items := schema.get("items"), dict):
+            self.add(items, (*path, ITEMS), resolver, seen)
+
+
+def build_schema_index(schema: dict) -> dict[tuple[str, ...], SchemaIndexEntry]:
+    """Build a property path to schema index entry mapping for a schema."""
+    builder = _SchemaIndexBuilder()
+    uri = schema.get("$id", "")
+    resource = Resource.from_contents(schema, default_specification=DRAFT7)
+    resolver = get_registry().with_resource(uri, resource).resolver(base_uri=uri)
+    builder.add(schema, (), resolver, frozenset({id(schema)}))
+    return builder.index
+
+
+@lru_cache
+def get_schema_index(schema_name: str) -> dict[tuple[str, ...], SchemaIndexEntry]:
+    """Get the cached schema index for a schema name, e.g. `project`."""
+    return build_schema_index(get_schema(schema_name))
@@ -0,0 +1,290 @@
+"""Reloadable schema registry.
+
+`SCHEMAS` and the shared validators are loaded once per process. Long-running services
+can use a `SchemaRegistry` instead, which picks up edited schema files without a
+restart:
+
+- Files are checked by modification time and size, only changed files are read
+  and only a changed content hash triggers a reload, e.g. a `touch` doesn't.
+- A reload parses the schemas and compiles their validators into a new
+  `SchemaSnapshot`, then swaps it in with a single assignment.
+- Snapshots are immutable. Validations hold on to the snapshot they started
+  with and never wait for a reload, broken schema files never replace a working
+  snapshot.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+import time
+from dataclasses import dataclass, field, replace
+from functools import partial
+from pathlib import Path
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any
+
+from jsonschema.exceptions import SchemaError
+from jsonschema.validators import validator_for
+from referencing import Registry, Resource
+
+from owasp_schema import list_schemas
+from owasp_schema.utils.format_engines import DEFAULT_FORMAT_PROFILE
+from owasp_schema.utils.metrics import metrics
+from owasp_schema.utils.schema_validators import (
+    SCHEMA_DIRECTORY,
+    ValidatorCache,
+    get_error_message,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Mapping
+
+    from jsonschema import FormatChecker
+    from jsonschema.protocols import Validator
+
+
+@dataclass(frozen=True)
+class SchemaFile:
+    """Schema file state a snapshot was loaded from."""
+
+    path: Path
+    mtime_ns: int
+    size: int
+    digest: str
+
+    def is_stale(self) -> bool:
+        """Whether the file modification time or size changed since loaded."""
+        stat = self.path.stat()
+        return (stat.st_mtime_ns, stat.st_size) != (self.mtime_ns, self.size)
+
+
+def _read_schema_file(path: Path) -> tuple[SchemaFile, bytes]:
+    stat = path.stat()
+    content = path.read_bytes()
+    digest = hashlib.blake2b(content, digest_size=16).hexdigest()
+    return SchemaFile(path, stat.st_mtime_ns, stat.st_size, digest), content
+
+
+def _build_validator(
+    registry: Registry,
+    schema: dict[str, Any],
+    profile_format_checker: FormatChecker,
+) -> Validator:
+    return validator_for(schema)(
+        schema,
+        format_checker=profile_format_checker,
+        registry=registry,
+    )
+
+
+@dataclass(frozen=True)
+class SchemaSnapshot:
+    """Schemas and validators of one version of the schema files."""
+
+    files: Mapping[str, SchemaFile]
+    registry: Registry
+    schemas: Mapping[str, dict[str, Any]]
+    version: int
+    validators: ValidatorCache = field(compare=False, repr=False)
+
+    def get_schema(self, schema_name: str) -> dict[str, Any]:
+        """Get a schema by name.
+
+        Raises:
+            KeyError: If the schema doesn't exist
+
+        """
+        if schema_name not in self.schemas:
+            error_message = (
+                f"Schema '{schema_name}' not found. Available schemas: {list(self.schemas)}"
+            )
+            raise KeyError(error_message)
+        return self.schemas[schema_name]
+
+    def get_validator(self, schema_name: str, format_profile: str = DEFAULT_FORMAT_PROFILE):
+        """Get the compiled validator of a schema, see `get_validator`."""
+        return self.validators.get(self.get_schema(schema_name), format_profile)
+
+    def validate(
+        self,
+        schema_name: str,
+        data: Any,
+        format_profile: str = DEFAULT_FORMAT_PROFILE,
+    ) -> str | None:
+        """Validate data against a schema, see `validate_data`."""
+        return get_error_message(self.get_validator(schema_name, format_profile), data)
+
+
+def load_snapshot(
+    directory: Path,
+    previous: SchemaSnapshot | None = None,
+    format_profiles: Iterable[str] = (DEFAULT_FORMAT_PROFILE,),
+) -> SchemaSnapshot:
+    """Load schema files into a snapshot with compiled validators.
+
+    Schemas whose content hash is unchanged since the previous snapshot are
+    reused, all validators are recompiled as referenced schemas may have changed.
+
+    Args:
+        directory: Directory with the `<name>.json` schema files
+        previous: Snapshot to reuse unchanged schemas of
+        format_profiles: Format check profiles to compile validators for
+
+    Returns:
+        The new snapshot
+
+    Raises:
+        OSError: If a schema file can't be read
+        ValueError: If a schema file isn't valid JSON
+        SchemaError: If a schema isn't a valid JSON schema
+
+    """
+    start = time.perf_counter()
+    files = {}
+    schemas = {}
+    for schema_name in list_schemas():
+        schema_file, content = _read_schema_file(directory / f"{schema_name}.json")
+        files[schema_name] = schema_file
+        if previous is not None and previous.files[schema_name].digest == schema_file.digest:
+            schemas[schema_name] = previous.schemas[schema_name]
+        else:
+            schemas[schema_name] = json.loads(content)
+            validator_for(schemas[schema_name]).check_schema(schemas[schema_name])
+
+    registry = Registry().with_resources(
+        (f"{schema_name}.json", Resource.from_contents(schema))
+        for schema_name, schema in schemas.items()
+    )
+    # Crawled so references by `$id` resolve, see `get_registry`.
+    registry = registry.crawl()
+    snapshot = SchemaSnapshot(
+        files=MappingProxyType(files),
+        registry=registry,
+        schemas=MappingProxyType(schemas),
+        version=0 if previous is None else previous.version + 1,
+        validators=ValidatorCache(partial(_build_validator, registry)),
+    )
+    for format_profile in format_profiles:
+        for schema_name in schemas:
+            snapshot.get_validator(schema_name, format_profile)
+
+    metrics.observe_schema_load("reload", time.perf_counter() - start)
+    return snapshot
+
+
+class SchemaRegistry:
+    """Schema registry reloading changed schema files.
+
+    Reloads are serialized, readers never take a lock: `snapshot` returns the
+    current snapshot, which stays valid for as long as it is held.
+    """
+
+    def __init__(
+        self,
+        directory: str | Path = SCHEMA_DIRECTORY,
+        check_interval: float | None = None,
+        format_profiles: Iterable[str] = (DEFAULT_FORMAT_PROFILE,),
+    ) -> None:
+        """Load the schema files.
+
+        Args:
+            directory: Directory with the `<name>.json` schema files
+            check_interval: Seconds between checks for changed files on access,
+                only checked by `reload` if None
+            format_profiles: Format check profiles to compile validators for
+
+        """
+        self.check_interval = check_interval
+        self.directory = Path(directory)
+        self.format_profiles = tuple(format_profiles)
+        # Error of the last failed reload on access, cleared by a successful one.
+        self.last_error: Exception | None = None
+
+        self._lock = threading.Lock()
+        self._snapshot = load_snapshot(self.directory, format_profiles=self.format_profiles)
+        self._checked_at = time.monotonic()
+
+    @property
+    def snapshot(self) -> SchemaSnapshot:
+        """Get the current snapshot, checking for changed files when due.
+
+        Access doesn't wait for a reload in progress, the current snapshot is
+        returned instead. Failed reloads keep the current snapshot and are
+        recorded in `last_error`.
+        """
+        if (
+            self.check_interval is not None
+            and time.monotonic() - self._checked_at >= self.check_interval
+            and self._lock.acquire(blocking=False)
+        ):
+            try:
+                self._reload()
+            except (OSError, SchemaError, ValueError) as e:
+                self.last_error = e
+            finally:
+                self._lock.release()
+        return self._snapshot
+
+    def _reload(self) -> bool:
+        self._checked_at = time.monotonic()
+        snapshot = self._snapshot
+        stale = {
+            schema_name: _read_schema_file(schema_file.path)[0]
+            for schema_name, schema_file in snapshot.files.items()
+            if schema_file.is_stale()
+        }
+        if all(
+            schema_file.digest == snapshot.files[schema_name].digest
+            for schema_name, schema_file in stale.items()
+        ):
+            if stale:
+                # Touched but unchanged, recorded so the files aren't hashed again.
+                self._snapshot = replace(
+                    snapshot,
+                    files=MappingProxyType({**snapshot.files, **stale}),
+                )
+            return False
+
+        self._snapshot = load_snapshot(
+            self.directory,
+            previous=snapshot,
+            format_profiles=self.format_profiles,
+        )
+        self.last_error = None
+        return True
+
+    def reload(self) -> bool:
+        """Reload the schema files if any changed.
+
+        Waits for a reload in progress on another thread.
+
+        Returns:
+            Whether a new snapshot was swapped in
+
+        Raises:
+            OSError: If a schema file can't be read
+            ValueError: If a schema file isn't valid JSON
+            SchemaError: If a schema isn't a valid JSON schema
+
+        """
+        with self._lock:
+            return self._reload()
+
+    def get_schema(self, schema_name: str) -> dict[str, Any]:
+        """Get a schema by name from the current snapshot."""
+        return self.snapshot.get_schema(schema_name)
+
+    def list_schemas(self) -> list[str]:
+        """List the schema names of the current snapshot."""
+        return list(self.snapshot.schemas)
+
+    def validate(
+        self,
+        schema_name: str,
+        data: Any,
+        format_profile: str = DEFAULT_FORMAT_PROFILE,
+    ) -> str | None:
+        """Validate data against a schema of the current snapshot."""
+        return self.snapshot.validate(schema_name, data, format_profile)
@@ -0,0 +1,263 @@
+"""Versioned schema store.
+
+Producers pinned to different `owasp-schema` releases are validated against the
+schemas of their release. The store keeps a directory of schema sets per
+version on disk:
+
+    <root>/<version>/chapter.json
+    <root>/<version>/common.json
+    ...
+
+References between schemas, e.g. `common.json#/definitions/person`, resolve to
+the `$id` URLs on raw.githubusercontent.com. Each version has its own registry
+whose retrieve hook serves those URLs from the version directory, nothing is
+fetched over the network. The bundled schemas are always available as the
+installed package version.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import json
+import re
+import shutil
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+from urllib.parse import urljoin
+
+from jsonschema.validators import validator_for
+from referencing import Registry, Resource
+from referencing.exceptions import NoSuchResource
+from referencing.jsonschema import DRAFT7
+
+from owasp_schema import __version__, list_schemas
+from owasp_schema.utils.format_engines import DEFAULT_FORMAT_PROFILE
+from owasp_schema.utils.schema_validators import (
+    SCHEMA_DIRECTORY,
+    ValidatorCache,
+    get_error_message,
+)
+
+if TYPE_CHECKING:
+    from jsonschema import FormatChecker
+    from jsonschema.protocols import Validator
+    from referencing.typing import URI
+
+SCHEMA_ID_PREFIX = "https://raw.githubusercontent.com/OWASP/nest-schema/"
+VERSION_CACHE_SIZE = 8
+VERSION_REGEX = re.compile(r"^[0-9A-Za-z][0-9A-Za-z._+-]*$")
+
+
+def _version_key(version: str) -> tuple:
+    # Numeric parts compare as numbers, e.g. 0.1.9 < 0.1.14.
+    return tuple((int(part), "") if part.isdigit() else (-1, part) for part in version.split("."))
+
+
+class SchemaVersion:
+    """Schemas and compiled validators of one release."""
+
+    def __init__(self, version: str, directory: Path) -> None:
+        """Initialize the version, schemas are loaded on first use.
+
+        Args:
+            version: Release version, e.g. `0.1.14`
+            directory: Directory with the `<name>.json` schema files of the release
+
+        """
+        self.directory = directory
+        self.registry: Registry = Registry(retrieve=self._retrieve)  # type: ignore[call-arg]
+        self.validators = ValidatorCache(self._build_validator)
+        self.version = version
+
+        self._lock = threading.Lock()
+        self._resources: dict[str, Resource] = {}
+        self._schemas: dict[str, dict[str, Any]] = {}
+
+    def _load(self, schema_name: str) -> dict[str, Any]:
+        if (schema := self._schemas.get(schema_name)) is not None:
+            return schema
+
+        with self._lock:
+            if (schema := self._schemas.get(schema_name)) is None:
+                path = self.directory / f"{schema_name}.json"
+                with path.open(encoding="utf-8") as f:
+                    schema = self._schemas[schema_name] = json.load(f)
+            return schema
+
+    def _retrieve(self, uri: URI) -> Resource:
+        # Cached, the immutable registry asks again for every lookup.
+        if (resource := self._resources.get(uri)) is not None:
+            return resource
+
+        file_name = uri.rsplit("/", 1)[-1]
+        schema_name = file_name.removesuffix(".json")
+        if (
+            not (uri.startswith(SCHEMA_ID_PREFIX) or uri == file_name)
+            or schema_name not in list_schemas()
+        ):
+            raise NoSuchResource(uri)
+
+        try:
+            schema = self._load(schema_name)
+        except (OSError, ValueError) as e:
+            raise NoSuchResource(uri) from e
+        resource = self._resources[uri] = Resource.from_contents(
+            schema,
+            default_specification=DRAFT7,
+        )
+        return resource
+
+    def _build_validator(
+        self,
+        schema: dict[str, Any],
+        profile_format_checker: FormatChecker,
+    ) -> Validator:
+        # Schema files next to the schema are added up front, lookups through
+        # the retrieve hook build a new registry each time.
+        base_uri = schema.get("$id", "")
+        registry = self.registry
+        for schema_name in list_schemas():
+            uri = urljoin(base_uri, f"{schema_name}.json")
+            with contextlib.suppress(NoSuchResource):
+                registry = registry.with_resource(uri, self._retrieve(uri))
+
+        return validator_for(schema)(
+            schema,
+            format_checker=profile_format_checker,
+            registry=registry.crawl(),
+        )
+
+    def get_schema(self, schema_name: str) -> dict[str, Any]:
+        """Get a schema of the release by name.
+
+        Raises:
+            KeyError: If the schema doesn't exist
+
+        """
+        if schema_name not in (schema_names := list_schemas()):
+            error_message = f"Schema '{schema_name}' not found. Available schemas: {schema_names}"
+            raise KeyError(error_message)
+        return self._load(schema_name)
+
+    def get_validator(self, schema_name: str, format_profile: str = DEFAULT_FORMAT_PROFILE):
+        """Get the compiled validator of a schema of the release."""
+        return self.validators.get(self.get_schema(schema_name), format_profile)
+
+    def validate(
+        self,
+        schema_name: str,
+        data: Any,
+        format_profile: str = DEFAULT_FORMAT_PROFILE,
+    ) -> str | None:
+        """Validate data against a schema of the release, see `validate_data`."""
+        return get_error_message(self.get_validator(schema_name, format_profile), data)
+
+
+class SchemaStore:
+    """Local store of schema sets keyed by release version.
+
+    Loaded versions and their compiled validators are kept in a thread-safe
+    LRU cache of `max_versions` entries.
+    """
+
+    def __init__(self, root: str | Path, max_versions: int = VERSION_CACHE_SIZE) -> None:
+        """Initialize the store.
+
+        Args:
+            root: Directory with a schema directory per version, created if needed
+            max_versions: Maximum number of versions kept loaded
+
+        """
+        self.max_versions = max_versions
+        self.root = Path(root)
+
+        self._lock = threading.Lock()
+        self._versions: OrderedDict[str, SchemaVersion] = OrderedDict()
+
+    def _directory(self, version: str) -> Path:
+        if not VERSION_REGEX.match(version):
+            error_message = f"Invalid schema version: {version!r}"
+            raise ValueError(error_message)
+
+        directory = self.root / version
+        if version == __version__ and not directory.is_dir():
+            return SCHEMA_DIRECTORY
+        return directory
+
+    def add_version(self, version: str, source: str | Path = SCHEMA_DIRECTORY) -> None:
+        """Copy the schema files of a release into the store.
+
+        Args:
+            version: Release version, e.g. `0.1.14`
+            source: Directory with the `<name>.json` schema files of the release
+
+        Raises:
+            OSError: If a schema file can't be copied
+            ValueError: If the version isn't a valid directory name
+
+        """
+        directory = self._directory(version)
+        if directory == SCHEMA_DIRECTORY:
+            directory = self.root / version
+        directory.mkdir(parents=True, exist_ok=True)
+        for schema_name in list_schemas():
+            shutil.copyfile(
+                Path(source) / f"{schema_name}.json",
+                directory / f"{schema_name}.json",
+            )
+
+        with self._lock:
+            self._versions.pop(version, None)
+
+    def list_versions(self) -> list[str]:
+        """List the stored versions and the bundled one, oldest first."""
+        versions = {__version__}
+        if self.root.is_dir():
+            versions.update(
+                path.name
+                for path in self.root.iterdir()
+                if path.is_dir() and VERSION_REGEX.match(path.name)
+            )
+        return sorted(versions, key=_version_key)
+
+    def get_version(self, version: str = __version__) -> SchemaVersion:
+        """Get the schemas of a release.
+
+        Raises:
+            KeyError: If the version isn't in the store
+            ValueError: If the version isn't a valid directory name
+
+        """
+        with self._lock:
+            if (schema_version := self._versions.get(version)) is not None:
+                self._versions.move_to_end(version)
+                return schema_version
+
+            directory = self._directory(version)
+            if not directory.is_dir():
+                error_message = (
+                    f"Schema version '{version}' not found. "
+                    f"Available versions: {self.list_versions()}"
+                )
+                raise KeyError(error_message)
+
+            schema_version = self._versions[version] = SchemaVersion(version, directory)
+            if len(self._versions) > self.max_versions:
+                self._versions.popitem(last=False)
+            return schema_version
+
+    def get_schema(self, schema_name: str, version: str = __version__) -> dict[str, Any]:
+        """Get a schema of a release by name."""
+        return self.get_version(version).get_schema(schema_name)
+
+    def validate(
+        self,
+        schema_name: str,
+        data: Any,
+        version: str = __version__,
+        format_profile: str = DEFAULT_FORMAT_PROFILE,
+    ) -> str | None:
+        """Validate data against a schema of a release, see `validate_data`."""
+        return self.get_version(version).validate(schema_name, data, format_profile)
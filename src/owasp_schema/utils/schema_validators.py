@@ -1,47 +1,297 @@
-"""Schema validator."""
+"""Schema validator.
+
+Validation is thread-safe: compiled validators, the registry and format checkers
+are built once under a lock and shared read-only between threads, and all other
+validation state is local to the call. Each thread keeps its own front cache of
+looked up validators, so cache hits don't contend for a lock.
+
+`jsonschema` and `referencing` are imported when the first validator is built,
+importing this module is cheap.
+"""
+
+from __future__ import annotations
 
 import json
+import threading
+import time
+from collections import OrderedDict
 from functools import lru_cache
 from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
-import validators
-from jsonschema import FormatChecker, validate
-from jsonschema.exceptions import ValidationError
-from referencing import Registry, Resource
+from owasp_schema.utils.format_engines import (
+    DEFAULT_FORMAT_PROFILE,
+    check_email_format,
+    check_uri_format,
+    get_format_checker,
+)
+from owasp_schema.utils.metrics import metrics
 
-COMMON_JSON = "common.json"
+if TYPE_CHECKING:
+    from collections.abc import Callable, Hashable
 
-format_checker = FormatChecker()
+COMMON_JSON = "common.json"
+SCHEMA_DIRECTORY = Path(__file__).parent.parent.resolve()
+VALIDATOR_CACHE_SIZE = 128
 
+_registry_lock = threading.Lock()
 
-@format_checker.checks("email")
-def check_email_format(value):
-    return validators.email(value)
 
+@lru_cache
+def _load_registry():
+    from referencing import Registry, Resource  # noqa: PLC0415
 
-@format_checker.checks("uri")
-def check_uri_format(value):
-    return validators.url(value)
+    start = time.perf_counter()
+    with (SCHEMA_DIRECTORY / COMMON_JSON).open() as f:
+        # Crawled up front so references by `$id` resolve without crawling the
+        # immutable registry again on every lookup.
+        registry = (
+            Registry()
+            .with_resource(
+                COMMON_JSON,
+                Resource.from_contents(json.load(f)),
+            )
+            .crawl()
+        )
+    metrics.observe_schema_load("registry", time.perf_counter() - start)
+    return registry
 
 
-@lru_cache
 def get_registry():
-    schema_path = Path(f"{Path(__file__).parent.parent.resolve()}/{COMMON_JSON}")
-    with schema_path.open() as f:
-        return Registry().with_resource(
-            COMMON_JSON,
-            Resource.from_contents(json.load(f)),
-        )
+    """Get the registry of referenced schemas, e.g. `common.json`.
+
+    The registry is immutable and shared by all threads.
+    """
+    # `lru_cache` doesn't prevent concurrent first calls from each loading it.
+    with _registry_lock:
+        return _load_registry()
+
+
+class IdentityCache:
+    """LRU cache of values keyed by schema identity.
+
+    Schemas are stored alongside their values so the id can't be reused by
+    another object while cached. Callers serialize access.
+    """
+
+    def __init__(self, max_size: int = VALIDATOR_CACHE_SIZE) -> None:
+        """Initialize an empty cache of at most `max_size` values."""
+        self.max_size = max_size
+
+        self._entries: OrderedDict[tuple[int, Hashable], tuple[dict, Any]] = OrderedDict()
+
+    def __len__(self) -> int:
+        """Return the number of cached values."""
+        return len(self._entries)
+
+    def get(self, schema: dict, key: Hashable = None) -> Any:
+        """Get the value cached for a schema and key, None if not cached."""
+        if (cached := self._entries.get((id(schema), key))) is None:
+            return None
+        self._entries.move_to_end((id(schema), key))
+        return cached[1]
+
+    def put(self, schema: dict, value: Any, key: Hashable = None) -> None:
+        """Cache a value for a schema and key, evicting the least recently used."""
+        self._entries[id(schema), key] = (schema, value)
+        self._entries.move_to_end((id(schema), key))
+        if len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all cached values."""
+        self._entries.clear()
+
+
+class ValidatorCache:
+    """Thread-safe LRU cache of compiled validators.
+
+    Validators are keyed by schema identity and format profile, built once
+    under a lock and never mutated afterwards, so they are shared between
+    threads. Each thread keeps a front cache of the validators it looked up,
+    hits on it take no lock.
+    """
+
+    def __init__(
+        self,
+        build: Callable[[dict, Any], Any],
+        max_size: int = VALIDATOR_CACHE_SIZE,
+    ) -> None:
+        """Initialize an empty cache.
+
+        Args:
+            build: Function compiling a validator from a schema and format checker
+            max_size: Maximum number of validators kept, per thread as well
+
+        """
+        self.max_size = max_size
+
+        self._build = build
+        self._entries = IdentityCache(max_size)
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Return the number of shared validators."""
+        return len(self._entries)
+
+    def get(self, schema, format_profile=DEFAULT_FORMAT_PROFILE):
+        """Get the validator of a schema and format profile, compiling it if needed."""
+        profile_format_checker = get_format_checker(format_profile)
+        if (local_entries := getattr(self._local, "entries", None)) is None:
+            local_entries = self._local.entries = IdentityCache(self.max_size)
+
+        validator = local_entries.get(schema, format_profile)
+        if validator is not None and validator.format_checker is profile_format_checker:
+            return validator
+
+        with self._lock:
+            validator = self._entries.get(schema, format_profile)
+            if validator is None or validator.format_checker is not profile_format_checker:
+                validator = self._build(schema, profile_format_checker)
+                self._entries.put(schema, validator, format_profile)
+
+        local_entries.put(schema, validator, format_profile)
+        return validator
+
+    def clear(self) -> None:
+        """Remove the shared validators, thread front caches are replaced."""
+        with self._lock:
+            self._entries.clear()
+            self._local = threading.local()
+
+
+def _build_validator(schema, profile_format_checker):
+    from jsonschema.validators import validator_for  # noqa: PLC0415
 
+    validator_class = validator_for(schema)
+    validator_class.check_schema(schema)
+    return validator_class(
+        schema,
+        format_checker=profile_format_checker,
+        registry=get_registry(),
+    )
 
-def validate_data(schema, data):
-    """Validate data against schema."""
-    try:
-        validate(
-            format_checker=format_checker,
-            instance=data,
-            registry=get_registry(),
-            schema=schema,
+
+_validators = ValidatorCache(_build_validator)
+
+
+def get_validator(schema, format_profile=DEFAULT_FORMAT_PROFILE):
+    """Get a compiled validator for the schema.
+
+    The schema is checked and the validator is built once per schema object and
+    format profile, subsequent calls return the cached instance.
+    """
+    return _validators.get(schema, format_profile)
+
+
+def get_validation_error(schema, data, format_profile=DEFAULT_FORMAT_PROFILE):
+    """Get the most relevant validation error, None if the data is valid.
+
+    Unlike `validate_data` the `ValidationError` is returned, e.g. for its
+    `absolute_path`.
+    """
+    from jsonschema.exceptions import best_match  # noqa: PLC0415
+
+    return best_match(get_validator(schema, format_profile).iter_errors(data))
+
+
+def get_error_message(validator, data) -> str | None:
+    """Validate data with a compiled validator, e.g. from `get_validator`.
+
+    Returns:
+        Message of the most relevant error, None if the data is valid
+
+    """
+    from jsonschema.exceptions import best_match  # noqa: PLC0415
+
+    if error := best_match(validator.iter_errors(data)):
+        return error.message
+    return None
+
+
+def _validate(schema, data, format_profile):
+    return get_error_message(get_validator(schema, format_profile), data)
+
+
+def _validate_cached(schema, data, format_profile, cache):
+    if cache is None:
+        return _validate(schema, data, format_profile)
+
+    key = cache.key(schema, data, format_profile)
+    found, result = cache.get(key)
+    if not found:
+        result = _validate(schema, data, format_profile)
+        cache.put(key, result)
+    return result
+
+
+def validate_data(schema, data, format_profile=DEFAULT_FORMAT_PROFILE, cache=None):
+    """Validate data against schema.
+
+    If a `ValidationCache` is passed, results of previously seen data are
+    returned from it.
+    """
+    if not metrics.enabled:
+        return _validate_cached(schema, data, format_profile, cache)
+
+    start = time.perf_counter()
+    result = _validate_cached(schema, data, format_profile, cache)
+    metrics.observe_validation(
+        schema,
+        duration=time.perf_counter() - start,
+        passed=result is None,
+    )
+    return result
+
+
+async def validate_data_async(schema, data, format_profile=DEFAULT_FORMAT_PROFILE, cache=None):
+    """Validate data against schema without blocking the event loop.
+
+    Cache hits are answered directly, validation runs in a worker thread.
+    """
+    import asyncio  # noqa: PLC0415
+
+    start = time.perf_counter()
+    key = None
+    found = False
+    result = None
+    if cache is not None:
+        key = cache.key(schema, data, format_profile)
+        found, result = cache.get(key)
+
+    if not found:
+        result = await asyncio.to_thread(_validate, schema, data, format_profile)
+        if cache is not None:
+            cache.put(key, result)
+
+    if metrics.enabled:
+        metrics.observe_validation(
+            schema,
+            duration=time.perf_counter() - start,
+            passed=result is None,
         )
-    except ValidationError as e:
-        return e.message
+    return result
+
+
+def __getattr__(name: str) -> Any:
+    """Build the default `format_checker` on first access."""
+    if name == "format_checker":
+        return get_format_checker(DEFAULT_FORMAT_PROFILE)
+
+    error_message = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(error_message)
+
+
+__all__ = [
+    "ValidatorCache",
+    "check_email_format",
+    "check_uri_format",
+    "format_checker",  # noqa: F822
+    "get_error_message",
+    "get_registry",
+    "get_validation_error",
+    "get_validator",
+    "validate_data",
+    "validate_data_async",
+]
@@ -0,0 +1,368 @@
+"""Export validated metadata documents to SQLite.
+
+Tables are derived from the schemas: a table per schema, e.g. `project`, with
+a column per scalar property, and a child table per array property, e.g.
+`project_leaders` with the `common.json` person columns or `project_tags` with
+a `value` column. Child rows reference their document and keep the array
+position.
+
+Exports are incremental: each document row stores a hash of the file content
+and the schema, unchanged documents are skipped without parsing them.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import sqlite3
+from dataclasses import asdict, dataclass, replace
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
+import yaml
+
+from owasp_schema import get_schema
+from owasp_schema.utils.bulk_validation import (
+    SCHEMA_NAMES,
+    detect_schema_name,
+    iter_metadata_files,
+)
+from owasp_schema.utils.format_engines import DEFAULT_FORMAT_PROFILE
+from owasp_schema.utils.result_cache import canonical_hash
+from owasp_schema.utils.schema_index import ITEMS, get_schema_index
+from owasp_schema.utils.schema_validators import validate_data
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from pathlib import Path
+
+    from owasp_schema.utils.schema_index import SchemaIndexEntry
+
+# Commonly filtered columns, columns with an `enum` are indexed as well.
+FILTER_COLUMNS = ("country", "github", "name", "region", "url")
+SQL_TYPES = {
+    "boolean": "INTEGER",
+    "integer": "INTEGER",
+    "number": "REAL",
+    "string": "TEXT",
+}
+TRANSACTION_SIZE = 500
+
+
+@dataclass(frozen=True)
+class Column:
+    """Table column derived from a schema property."""
+
+    name: str
+    sql_type: str
+    # Values without a SQL type, e.g. nested objects, are stored as JSON text.
+    is_json: bool = False
+    is_indexed: bool = False
+
+    def value(self, data: dict):
+        """Get the column value from a document or array item."""
+        value = data.get(self.name)
+        return json.dumps(value) if self.is_json and value is not None else value
+
+
+@dataclass(frozen=True)
+class Table:
+    """Table derived from a schema or an array property of a schema."""
+
+    name: str
+    columns: tuple[Column, ...]
+    parent: str | None = None
+    property_name: str | None = None
+
+    @property
+    def is_scalar(self) -> bool:
+        """Whether rows hold scalar array items in the `value` column."""
+        return self.parent is not None and [column.name for column in self.columns] == ["value"]
+
+    def create_statements(self) -> list[str]:
+        """Get the statements creating the table and its indexes."""
+        if self.parent is None:
+            key_columns = [
+                "id INTEGER PRIMARY KEY",
+                "path TEXT NOT NULL UNIQUE",
+                "content_hash TEXT NOT NULL",
+            ]
+            indexed = [column.name for column in self.columns if column.is_indexed]
+        else:
+            key_columns = [
+                "id INTEGER PRIMARY KEY",
+                (
+                    f'"{self.parent}_id" INTEGER NOT NULL '
+                    f'REFERENCES "{self.parent}"(id) ON DELETE CASCADE'
+                ),
+                "position INTEGER NOT NULL",
+            ]
+            indexed = [
+                f"{self.parent}_id",
+                *(column.name for column in self.columns if column.is_indexed),
+            ]
+
+        columns = [f'"{column.name}" {column.sql_type}' for column in self.columns]
+        return [
+            f'CREATE TABLE IF NOT EXISTS "{self.name}" ({", ".join(key_columns + columns)})',
+            *(
+                f'CREATE INDEX IF NOT EXISTS "ix_{self.name}_{column}" '
+                f'ON "{self.name}" ("{column}")'
+                for column in indexed
+            ),
+        ]
+
+
+def _column(name: str, entry: SchemaIndexEntry) -> Column:
+    sql_type = SQL_TYPES.get(entry.type or "")
+    return Column(
+        name=name,
+        sql_type=sql_type or "TEXT",
+        is_json=sql_type is None,
+        is_indexed=bool(entry.enum) or name in FILTER_COLUMNS,
+    )
+
+
+@lru_cache
+def get_tables(schema_name: str) -> tuple[Table, ...]:
+    """Get the document table followed by the child tables of a schema."""
+    index = get_schema_index(schema_name)
+    columns = []
+    children = []
+    for name in index[()].properties:
+        entry = index[(name,)]
+        items = index.get((name, ITEMS))
+        if entry.type != "array" or items is None:
+            columns.append(_column(name, entry))
+            continue
+
+        if items.properties:
+            item_columns = tuple(
+                _column(item_name, index[(name, ITEMS, item_name)])
+                for item_name in items.properties
+            )
+        else:
+            item_columns = (replace(_column("value", items), is_indexed=True),)
+        children.append(
+            Table(
+                name=f"{schema_name}_{name}",
+                columns=item_columns,
+                parent=schema_name,
+                property_name=name,
+            ),
+        )
+
+    return (Table(name=schema_name, columns=tuple(columns)), *children)
+
+
+# Table and column names in statements come from the schemas, document values are
+# always bound as parameters.
+def _insert_statement(table_name: str, names: list[str]) -> str:
+    columns = ", ".join(f'"{name}"' for name in names)
+    return f'INSERT INTO "{table_name}" ({columns}) VALUES ({", ".join("?" * len(names))})'  # noqa: S608
+
+
+@lru_cache
+def _schema_digest(schema_name: str) -> bytes:
+    return canonical_hash(get_schema(schema_name))
+
+
+def content_hash(schema_name: str, content: bytes) -> str:
+    """Hash file content along with its schema, so schema changes re-export."""
+    return hashlib.blake2b(_schema_digest(schema_name) + content, digest_size=16).hexdigest()
+
+
+@dataclass
+class ExportStats:
+    """Counts of an export run."""
+
+    inserted: int = 0
+    updated: int = 0
+    unchanged: int = 0
+    invalid: int = 0
+    deleted: int = 0
+
+    def as_dict(self) -> dict:
+        """Return the stats as a JSON serializable dictionary."""
+        return asdict(self)
+
+
+class SqliteExporter:
+    """Incremental exporter of validated metadata documents to SQLite."""
+
+    def __init__(
+        self,
+        connection: sqlite3.Connection,
+        format_profile: str = DEFAULT_FORMAT_PROFILE,
+        transaction_size: int = TRANSACTION_SIZE,
+    ) -> None:
+        """Initialize the exporter and create missing tables, columns and indexes.
+
+        Args:
+            connection: SQLite connection
+            format_profile: Format check profile, see `format_engines`
+            transaction_size: Documents written per transaction
+
+        """
+        self.connection = connection
+        self.format_profile = format_profile
+        self.transaction_size = transaction_size
+
+        self.connection.execute("PRAGMA foreign_keys = ON")
+        self.create_tables()
+
+    def create_tables(self) -> None:
+        """Create tables and indexes, adding columns of new schema properties."""
+        with self.connection:
+            for schema_name in SCHEMA_NAMES:
+                for table in get_tables(schema_name):
+                    for statement in table.create_statements():
+                        self.connection.execute(statement)
+
+                    existing = {
+                        row[1]
+                        for row in self.connection.execute(f'PRAGMA table_info("{table.name}")')
+                    }
+                    for column in table.columns:
+                        if column.name not in existing:
+                            self.connection.execute(
+                                f'ALTER TABLE "{table.name}" '
+                                f'ADD COLUMN "{column.name}" {column.sql_type}',
+                            )
+
+    def _insert(self, schema_name: str, path: str, digest: str, data: dict) -> None:
+        document_table, *child_tables = get_tables(schema_name)
+        names = ["path", "content_hash", *(column.name for column in document_table.columns)]
+        values = [path, digest, *(column.value(data) for column in document_table.columns)]
+        document_id = self.connection.execute(
+            _insert_statement(schema_name, names),
+            values,
+        ).lastrowid
+
+        for table in child_tables:
+            if not (items := data.get(table.property_name or "")):
+                continue
+            names = [f"{schema_name}_id", "position", *(column.name for column in table.columns)]
+            self.connection.executemany(
+                _insert_statement(table.name, names),
+                (
+                    [
+                        document_id,
+                        position,
+                        *(
+                            [item]
+                            if table.is_scalar
+                            else [column.value(item) for column in table.columns]
+                        ),
+                    ]
+                    for position, item in enumerate(items)
+                ),
+            )
+
+    def export_file(self, path: Path, stats: ExportStats) -> None:
+        """Export a metadata file unless it's unchanged or invalid."""
+        schema_name = detect_schema_name(path)
+        content = path.read_bytes()
+        digest = content_hash(schema_name, content)
+        row = self.connection.execute(
+            f'SELECT id, content_hash FROM "{schema_name}" WHERE path = ?',  # noqa: S608
+            (str(path),),
+        ).fetchone()
+        if row is not None and row[1] == digest:
+            stats.unchanged += 1
+            return
+
+        try:
+            data = yaml.safe_load(content)
+        except yaml.YAMLError:
+            stats.invalid += 1
+            return
+        if validate_data(get_schema(schema_name), data, self.format_profile) is not None:
+            stats.invalid += 1
+            return
+
+        if row is not None:
+            # Child rows are removed by the cascade.
+            self.connection.execute(f'DELETE FROM "{schema_name}" WHERE id = ?', (row[0],))  # noqa: S608
+            stats.updated += 1
+        else:
+            stats.inserted += 1
+        self._insert(schema_name, str(path), digest, data)
+
+    def prune(self, paths: set[str]) -> int:
+        """Delete documents not in paths, e.g. removed files.
+
+        The caller is responsible for committing the deletions.
+
+        Returns:
+            Number of deleted documents
+
+        """
+        deleted = 0
+        for schema_name in SCHEMA_NAMES:
+            stale = [
+                (document_id,)
+                for document_id, path in self.connection.execute(
+                    f'SELECT id, path FROM "{schema_name}"',  # noqa: S608
+                )
+                if path not in paths
+            ]
+            self.connection.executemany(f'DELETE FROM "{schema_name}" WHERE id = ?', stale)  # noqa: S608
+            deleted += len(stale)
+        return deleted
+
+    def export(self, paths: Iterable[str | Path], *, prune: bool = False) -> ExportStats:
+        """Export metadata files, directories are searched recursively.
+
+        Documents are written in transactions of `transaction_size` files.
+        Invalid, unreadable and unrecognized files are counted as invalid and
+        don't change the database.
+
+        Args:
+            paths: Metadata files or directories
+            prune: Whether to delete documents of files not in paths
+
+        Returns:
+            The export stats
+
+        """
+        stats = ExportStats()
+        exported: set[str] = set()
+        pending = 0
+        self.connection.execute("BEGIN")
+        try:
+            for path in iter_metadata_files(paths):
+                exported.add(str(path))
+                try:
+                    self.export_file(path, stats)
+                except (OSError, ValueError):
+                    stats.invalid += 1
+
+                pending += 1
+                if pending == self.transaction_size:
+                    self.connection.execute("COMMIT")
+                    self.connection.execute("BEGIN")
+                    pending = 0
+
+            if prune:
+                stats.deleted = self.prune(exported)
+        except BaseException:
+            self.connection.execute("ROLLBACK")
+            raise
+        self.connection.execute("COMMIT")
+        return stats
+
+
+def export_to_sqlite(
+    database: str | Path,
+    paths: Iterable[str | Path],
+    format_profile: str = DEFAULT_FORMAT_PROFILE,
+    *,
+    prune: bool = False,
+) -> ExportStats:
+    """Export metadata files to a SQLite database file, see `SqliteExporter`."""
+    connection = sqlite3.connect(database, isolation_level=None)
+    try:
+        return SqliteExporter(connection, format_profile).export(paths, prune=prune)
+    finally:
+        connection.close()
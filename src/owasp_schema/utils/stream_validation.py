@@ -0,0 +1,381 @@
+"""Validate YAML documents from the parse event stream.
+
+`validate_stream` validates a document while PyYAML parses it, without
+building the Python object first. Scalars are constructed and checked one at a
+time, mappings and sequences are checked as their keys and items stream by, so
+huge lists, e.g. generated committee `members` rosters, are never held in
+memory and the first error rejects the document without parsing the rest of it.
+
+Keywords needing a whole container, e.g. `anyOf` or `enum` on an object, are
+checked by the jsonschema validator on that subtree only, `uniqueItems` keeps a
+digest per item rather than the items. Documents with aliases, duplicate keys
+or non-unique items fall back to the dict-based path, see `validate_data`.
+
+Unlike `validate_data`, which reports the best match among all errors, the
+first error in document order is reported.
+"""
+
+from __future__ import annotations
+
+import time
+from dataclasses import asdict, dataclass
+from typing import IO, TYPE_CHECKING, Any
+
+import yaml
+from jsonschema.exceptions import best_match
+from referencing import Resource
+from referencing.jsonschema import DRAFT7
+
+from owasp_schema.utils.format_engines import DEFAULT_FORMAT_PROFILE
+from owasp_schema.utils.metrics import metrics
+from owasp_schema.utils.result_cache import canonical_hash
+from owasp_schema.utils.schema_validators import (
+    get_registry,
+    get_validation_error,
+    get_validator,
+)
+from owasp_schema.utils.yaml_locations import load_with_locations, locate
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+# Keywords checked on the whole container value rather than streamed.
+SUBTREE_KEYWORDS = frozenset(
+    (
+        "additionalItems",
+        "allOf",
+        "anyOf",
+        "const",
+        "contains",
+        "dependencies",
+        "enum",
+        "if",
+        "maxItems",
+        "maxProperties",
+        "minProperties",
+        "not",
+        "oneOf",
+        "patternProperties",
+        "propertyNames",
+    ),
+)
+MERGE_TAG = "tag:yaml.org,2002:merge"
+
+
+@dataclass(frozen=True)
+class StreamError:
+    """First validation error of a streamed document."""
+
+    message: str
+    path: tuple[str | int, ...] = ()
+    # One-based location of the error in the document, if known.
+    line: int | None = None
+    column: int | None = None
+
+    def as_dict(self) -> dict:
+        """Return the error as a JSON serializable dictionary."""
+        return {**asdict(self), "path": list(self.path)}
+
+
+class _RejectedError(Exception):
+    def __init__(self, error: StreamError) -> None:
+        super().__init__(error.message)
+        self.error = error
+
+
+class _FallbackError(Exception):
+    """The document can't be validated from its events alone."""
+
+
+def _unique_key(value: Any) -> bytes:
+    # Numbers compare equal across types for `uniqueItems`, e.g. 1 and 1.0.
+    def normalize(value: Any) -> Any:
+        if type(value) is float and value.is_integer():
+            return int(value)
+        if type(value) is dict:
+            return {key: normalize(item) for key, item in value.items()}
+        if type(value) is list:
+            return [normalize(item) for item in value]
+        return value
+
+    return canonical_hash(normalize(value))
+
+
+class _StreamValidator:
+    def __init__(self, loader: yaml.SafeLoader, schema: dict, format_profile: str) -> None:
+        self.loader = loader
+        self.validator = get_validator(schema, format_profile)
+        self._validators: dict[int, Any] = {}
+
+        uri = schema.get("$id", "")
+        resource = Resource.from_contents(schema, default_specification=DRAFT7)
+        self.resolver = get_registry().with_resource(uri, resource).resolver(base_uri=uri)
+
+    def next_event(self) -> yaml.Event:
+        event = self.loader.get_event()
+        if isinstance(event, yaml.AliasEvent):
+            raise _FallbackError
+        return event
+
+    def evolved(self, schema: dict, resolver):
+        if (validator := self._validators.get(id(schema))) is None:
+            validator = self.validator.evolve(schema=schema, _resolver=resolver)
+            self._validators[id(schema)] = validator
+        return validator
+
+    def resolve(self, schema, resolver):
+        # Keywords next to `$ref` are ignored in draft 7.
+        while isinstance(schema, dict) and isinstance(ref := schema.get("$ref"), str):
+            resolved = resolver.lookup(ref)
+            schema, resolver = resolved.contents, resolved.resolver
+        return schema, resolver
+
+    def reject(self, error, path: tuple, mark) -> None:
+        if error is not None:
+            raise _RejectedError(
+                StreamError(
+                    message=error.message,
+                    path=(*path, *error.absolute_path),
+                    line=mark.line + 1,
+                    column=mark.column + 1,
+                ),
+            )
+
+    def construct_scalar(self, event) -> Any:
+        tag = event.tag
+        if tag is None or tag == "!":
+            tag = self.loader.resolve(yaml.ScalarNode, event.value, event.implicit)
+        if tag == MERGE_TAG:
+            raise _FallbackError
+        node = yaml.ScalarNode(tag, event.value, event.start_mark, event.end_mark, event.style)
+        constructors = self.loader.yaml_constructors
+        return (constructors.get(tag) or constructors[None])(self.loader, node)
+
+    def build(self, event: yaml.Event) -> Any:
+        """Construct the value of a node without validating it."""
+        if isinstance(event, yaml.ScalarEvent):
+            return self.construct_scalar(event)
+        if isinstance(event, yaml.SequenceStartEvent):
+            items = []
+            while not isinstance(item := self.next_event(), yaml.SequenceEndEvent):
+                items.append(self.build(item))
+            return items
+
+        mapping = {}
+        while not isinstance(key_event := self.next_event(), yaml.MappingEndEvent):
+            key = self.key(key_event)
+            if key in mapping:
+                raise _FallbackError
+            mapping[key] = self.build(self.next_event())
+        return mapping
+
+    def key(self, event: yaml.Event) -> Any:
+        if isinstance(event, yaml.ScalarEvent):
+            return self.construct_scalar(event)
+        # Let the dict-based path raise the unhashable key error.
+        raise _FallbackError
+
+    def node(self, event, schema, resolver, path: tuple, *, build: bool) -> Any:
+        """Validate a node, returning its value if `build` is set."""
+        schema, resolver = self.resolve(schema, resolver)
+        if schema is True or schema == {}:
+            value = self.build(event)
+            return value if build else None
+
+        if isinstance(event, yaml.ScalarEvent) or not isinstance(schema, dict):
+            value = self.build(event)
+            self.reject(
+                best_match(self.evolved_errors(schema, resolver, value)),
+                path,
+                event.start_mark,
+            )
+            return value
+
+        validator = self.evolved(schema, resolver)
+        is_mapping = isinstance(event, yaml.MappingStartEvent)
+        types = schema.get("type", "object" if is_mapping else "array")
+        if (
+            not SUBTREE_KEYWORDS.isdisjoint(schema)
+            or not isinstance(schema.get("items", {}), dict)
+            or not any(
+                validator.is_type({} if is_mapping else [], name)
+                for name in ([types] if isinstance(types, str) else types)
+            )
+        ):
+            value = self.build(event)
+            self.reject(best_match(validator.iter_errors(value)), path, event.start_mark)
+            return value
+
+        if is_mapping:
+            return self.mapping(event, schema, resolver, path, build=build)
+        return self.sequence(event, schema, resolver, path, build=build)
+
+    def evolved_errors(self, schema, resolver, value) -> Iterator:
+        if isinstance(schema, dict):
+            return self.evolved(schema, resolver).iter_errors(value)
+        return self.validator.evolve(schema=schema, _resolver=resolver).iter_errors(value)
+
+    def mapping(self, event, schema: dict, resolver, path: tuple, *, build: bool) -> Any:
+        validator = self.evolved(schema, resolver)
+        properties = schema.get("properties", {})
+        additional = schema.get("additionalProperties", True)
+        keys: dict = {}
+        values: dict = {}
+        extra_mark = None
+
+        while not isinstance(key_event := self.next_event(), yaml.MappingEndEvent):
+            key = self.key(key_event)
+            if key in keys:
+                raise _FallbackError
+            keys[key] = None
+
+            value_event = self.next_event()
+            if key in properties:
+                subschema = properties[key]
+            elif additional is False:
+                # Collect all unexpected keys for the error message.
+                extra_mark = extra_mark or key_event.start_mark
+                self.build(value_event)
+                continue
+            else:
+                subschema = additional
+            value = self.node(
+                value_event,
+                subschema,
+                resolver,
+                (*path, key),
+                build=build,
+            )
+            if build:
+                values[key] = value
+
+        if extra_mark is not None:
+            errors = validator.VALIDATORS["additionalProperties"](
+                validator,
+                additional,
+                keys,
+                schema,
+            )
+            self.reject(next(iter(errors)), path, extra_mark)
+        if required := schema.get("required"):
+            errors = validator.VALIDATORS["required"](validator, required, keys, schema)
+            self.reject(next(iter(errors), None), path, event.start_mark)
+        return values if build else None
+
+    def sequence(self, event, schema: dict, resolver, path: tuple, *, build: bool) -> Any:
+        validator = self.evolved(schema, resolver)
+        items_schema = schema.get("items", True)
+        min_items = schema.get("minItems", 0)
+        unique = schema.get("uniqueItems", False)
+        # Short sequences are kept for the `minItems` error message.
+        items = []
+        digests: set[bytes] = set()
+
+        index = 0
+        while not isinstance(item_event := self.next_event(), yaml.SequenceEndEvent):
+            item = self.node(
+                item_event,
+                items_schema,
+                resolver,
+                (*path, index),
+                build=build or unique or index < min_items,
+            )
+            if unique:
+                digest = _unique_key(item)
+                if digest in digests:
+                    raise _FallbackError
+                digests.add(digest)
+            if build or index < min_items:
+                items.append(item)
+            index += 1
+
+        if index < min_items:
+            errors = validator.VALIDATORS["minItems"](validator, min_items, items, schema)
+            self.reject(next(iter(errors)), path, event.start_mark)
+        return items if build else None
+
+    def validate(self) -> StreamError | None:
+        # Stream and document start events.
+        self.next_event()
+        document = self.next_event()
+        if isinstance(document, yaml.StreamEndEvent):
+            self.reject(best_match(self.validator.iter_errors(None)), (), document.start_mark)
+            return None
+
+        root = self.next_event()
+        self.node(root, self.validator.schema, self.resolver, (), build=False)
+        self.next_event()  # Document end.
+        if not isinstance(self.next_event(), yaml.StreamEndEvent):
+            # Let the dict-based path raise the multiple documents error.
+            raise _FallbackError
+        return None
+
+
+def _fallback(
+    schema: dict,
+    content: bytes | str,
+    format_profile: str,
+) -> StreamError | None:
+    data, locations = load_with_locations(content)
+    if (error := get_validation_error(schema, data, format_profile)) is None:
+        return None
+
+    path = tuple(error.absolute_path)
+    location = locate(locations, path)
+    return StreamError(
+        message=error.message,
+        path=path,
+        line=location.line + 1 if location else None,
+        column=location.column + 1 if location else None,
+    )
+
+
+def _validate_stream(
+    schema: dict,
+    content: bytes | str | IO,
+    format_profile: str,
+) -> StreamError | None:
+    loader = yaml.SafeLoader(content)
+    try:
+        return _StreamValidator(loader, schema, format_profile).validate()
+    except _RejectedError as e:
+        return e.error
+    except _FallbackError:
+        pass
+    finally:
+        loader.dispose()
+
+    if isinstance(content, bytes | str):
+        return _fallback(schema, content, format_profile)
+    content.seek(0)
+    return _fallback(schema, content.read(), format_profile)
+
+
+def validate_stream(
+    schema: dict,
+    content: bytes | str | IO,
+    format_profile: str = DEFAULT_FORMAT_PROFILE,
+) -> StreamError | None:
+    """Validate a YAML document against a schema while it is parsed.
+
+    Args:
+        schema: JSON schema, e.g. from `get_schema`
+        content: YAML document content or a seekable file object
+        format_profile: Format check profile, see `format_engines`
+
+    Returns:
+        The first error in document order, None if the document is valid
+
+    Raises:
+        yaml.YAMLError: If the document is not valid YAML
+
+    """
+    start = time.perf_counter()
+    error = _validate_stream(schema, content, format_profile)
+    if metrics.enabled:
+        metrics.observe_validation(
+            schema,
+            duration=time.perf_counter() - start,
+            passed=error is None,
+        )
+    return error
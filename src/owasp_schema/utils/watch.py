@@ -0,0 +1,111 @@
+"""Watch mode for OWASP metadata files.
+
+Metadata files are polled for changes, saves are debounced and only the
+changed files are revalidated with validators compiled once at startup.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from owasp_schema.utils.bulk_validation import (
+    iter_metadata_files,
+    validate_file,
+    warm_validators,
+)
+from owasp_schema.utils.format_engines import DEFAULT_FORMAT_PROFILE
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+    from owasp_schema.utils.bulk_validation import ValidationResult
+
+DEBOUNCE_SECONDS = 0.05
+POLL_INTERVAL_SECONDS = 0.1
+
+
+def snapshot(paths: Iterable[str | Path]) -> dict[Path, tuple[int, int, int]]:
+    """Get the inode, size and modification time of each metadata file."""
+    stats = {}
+    for path in iter_metadata_files(paths):
+        try:
+            stat = path.stat()
+        except OSError:
+            continue
+        stats[path] = (stat.st_ino, stat.st_size, stat.st_mtime_ns)
+    return stats
+
+
+class MetadataWatcher:
+    """Polling watcher revalidating metadata files as they change."""
+
+    def __init__(
+        self,
+        paths: Iterable[str | Path],
+        format_profile: str = DEFAULT_FORMAT_PROFILE,
+        interval: float = POLL_INTERVAL_SECONDS,
+        debounce: float = DEBOUNCE_SECONDS,
+    ) -> None:
+        """Initialize the watcher.
+
+        Args:
+            paths: Metadata files or directories to watch
+            format_profile: Format check profile, see `format_engines`
+            interval: Seconds between polls
+            debounce: Seconds a file must stay unchanged before revalidation
+
+        """
+        self.debounce = debounce
+        self.format_profile = format_profile
+        self.interval = interval
+        self.paths = [Path(path) for path in paths]
+
+        self._pending: dict[Path, float] = {}
+        self._stats: dict[Path, tuple[int, int, int]] = {}
+
+        warm_validators(format_profile)
+
+    def _validate(self, path: Path) -> ValidationResult:
+        return validate_file(path, format_profile=self.format_profile)
+
+    def start(self) -> list[ValidationResult]:
+        """Record the current files and validate all of them."""
+        self._pending.clear()
+        self._stats = snapshot(self.paths)
+        return [self._validate(path) for path in self._stats]
+
+    def poll(self) -> list[ValidationResult]:
+        """Revalidate files changed and left unchanged for the debounce period."""
+        stats = snapshot(self.paths)
+        now = time.monotonic()
+        for path, stat in stats.items():
+            if self._stats.get(path) != stat:
+                self._pending[path] = now
+        self._stats = stats
+
+        results = []
+        for path, changed_at in list(self._pending.items()):
+            if path not in stats:
+                del self._pending[path]
+            elif now - changed_at >= self.debounce:
+                del self._pending[path]
+                results.append(self._validate(path))
+        return results
+
+    def watch(self, stop_event: threading.Event | None = None) -> Iterator[ValidationResult]:
+        """Validate all files, then yield results for changed files until stopped.
+
+        Args:
+            stop_event: Event stopping the watcher when set, runs forever if None
+
+        Yields:
+            Validation results
+
+        """
+        stop_event = stop_event or threading.Event()
+        yield from self.start()
+        while not stop_event.wait(self.interval):
+            yield from self.poll()
@@ -0,0 +1,85 @@
+"""Prefork worker pool.
+
+Workers spawned from a fresh interpreter re-import the package, parse the
+schemas and compile the registry and validators again. Where `fork` is safe to
+use, `prefork_pool` does that work once in the parent instead and forks the
+workers from it: schemas and validators are inherited, never pickled, and the
+pages holding them stay shared between processes.
+
+Objects alive at fork time are moved to the permanent generation with
+`gc.freeze()`, the garbage collector of a worker then never touches them, so
+their pages aren't copied on write by collections. Reference counting still
+copies the pages of objects a worker uses.
+"""
+
+from __future__ import annotations
+
+import gc
+import multiprocessing
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+    from multiprocessing.context import BaseContext
+
+FORK_START_METHOD = "fork"
+# Platform system libraries aren't safe to use in forked processes.
+SPAWN_PLATFORMS = ("darwin", "win32")
+
+
+def _fork_context() -> BaseContext | None:
+    if sys.platform in SPAWN_PLATFORMS:
+        return None
+    if FORK_START_METHOD not in multiprocessing.get_all_start_methods():
+        return None
+    return multiprocessing.get_context(FORK_START_METHOD)
+
+
+@contextmanager
+def prefork_pool(
+    max_workers: int,
+    initializer: Callable[..., Any] | None = None,
+    initargs: tuple = (),
+) -> Iterator[ProcessPoolExecutor]:
+    """Create a process pool of workers forked from a warmed up parent.
+
+    The initializer runs once in the parent before the workers are forked,
+    e.g. `warm_validators`. On platforms without a safe `fork` the workers are
+    spawned and each runs the initializer instead.
+
+    Args:
+        max_workers: Number of worker processes
+        initializer: Function loading schemas and compiling validators
+        initargs: Initializer arguments
+
+    Yields:
+        The process pool, shut down on exit
+
+    """
+    if (context := _fork_context()) is None:
+        with ProcessPoolExecutor(
+            max_workers=max_workers,
+            initializer=initializer,
+            initargs=initargs,
+        ) as executor:
+            yield executor
+        return
+
+    if initializer is not None:
+        initializer(*initargs)
+
+    # Nested pools leave freezing to the outermost one.
+    is_frozen = gc.get_freeze_count() > 0
+    if not is_frozen:
+        gc.collect()
+        gc.freeze()
+    try:
+        # Forking workers all start before the pool's manager thread does.
+        with ProcessPoolExecutor(max_workers=max_workers, mp_context=context) as executor:
+            yield executor
+    finally:
+        if not is_frozen:
+            gc.unfreeze()
@@ -0,0 +1,85 @@
+"""Source locations of YAML document nodes."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+import yaml
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+
+@dataclass(frozen=True)
+class Location:
+    """Zero-based source range of a YAML node."""
+
+    line: int
+    column: int
+    end_line: int
+    end_column: int
+
+    @classmethod
+    def from_node(cls, node: yaml.Node) -> Location:
+        """Create a location from a composed YAML node."""
+        return cls(
+            line=node.start_mark.line,
+            column=node.start_mark.column,
+            end_line=node.end_mark.line,
+            end_column=node.end_mark.column,
+        )
+
+
+def _collect(node: yaml.Node, path: tuple, locations: dict[tuple, Location]) -> None:
+    if isinstance(node, yaml.MappingNode):
+        for key_node, value_node in node.value:
+            value_path = (*path, key_node.value)
+            # Mapping values are located by their key, e.g. `level` in `level: 2`.
+            locations[value_path] = Location.from_node(key_node)
+            _collect(value_node, value_path, locations)
+    elif isinstance(node, yaml.SequenceNode):
+        for index, item_node in enumerate(node.value):
+            item_path = (*path, index)
+            locations[item_path] = Location.from_node(item_node)
+            _collect(item_node, item_path, locations)
+
+
+def load_with_locations(content: bytes | str) -> tuple[object, dict[tuple, Location]]:
+    """Load a YAML document along with the location of each node.
+
+    The document is parsed once, locations are collected from the composed
+    node tree before it is constructed into Python objects.
+
+    Args:
+        content: YAML document content
+
+    Returns:
+        Tuple of the loaded data and a document path to location mapping,
+        e.g. `("leaders", 0, "github")`, the root path is `()`
+
+    Raises:
+        yaml.YAMLError: If the content is not valid YAML
+
+    """
+    loader = yaml.SafeLoader(content)
+    try:
+        node = loader.get_single_node()
+        if node is None:
+            return None, {}
+        data = loader.construct_document(node)
+    finally:
+        loader.dispose()
+
+    locations = {(): Location.from_node(node)}
+    _collect(node, (), locations)
+    return data, locations
+
+
+def locate(locations: dict[tuple, Location], path: Iterable) -> Location | None:
+    """Get the location of a document path, or of its closest located parent."""
+    path = tuple(path)
+    for length in range(len(path), -1, -1):
+        if (location := locations.get(path[:length])) is not None:
+            return location
+    return None
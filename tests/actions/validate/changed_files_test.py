@@ -0,0 +1,146 @@
+"""Tests for the GitHub Action validator script in changed files mode."""
+
+import subprocess
+
+import pytest
+from actions.validate import main as action
+
+from tests.conftest import tests_data_dir
+
+VALID_CHAPTER = tests_data_dir / "actions/validate/chapter/positive/valid_chapter.yaml"
+VALID_PROJECT = tests_data_dir / "actions/validate/project/positive/valid_project.yaml"
+INVALID_PROJECT = tests_data_dir / "actions/validate/project/negative/audience_empty.yaml"
+
+
+def git(workspace, *args):
+    subprocess.run(  # noqa: S603
+        ["git", "-c", "user.name=test", "-c", "user.email=test@owasp.org", *args],  # noqa: S607
+        capture_output=True,
+        check=True,
+        cwd=workspace,
+    )
+
+
+def commit(workspace, files, message):
+    for name, source in files.items():
+        path = workspace / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(source.read_text())
+    git(workspace, "add", "-A")
+    git(workspace, "commit", "-m", message)
+
+
+@pytest.fixture
+def mock_workspace(tmp_path, monkeypatch):
+    """Fixture to mock a GitHub workspace git repository."""
+    monkeypatch.setattr(action, "WORKSPACE_PATH", tmp_path)
+    monkeypatch.setattr(action, "JOBS", 1)
+    monkeypatch.setenv(action.BASE_REF_ENV, "base")
+
+    git(tmp_path, "init", "-q")
+    commit(
+        tmp_path,
+        {
+            "chapters/a/chapter.owasp.yaml": VALID_CHAPTER,
+            "projects/a/project.owasp.yaml": INVALID_PROJECT,
+        },
+        "Initial commit",
+    )
+    git(tmp_path, "tag", "base")
+    return tmp_path
+
+
+def test_get_changed_files(mock_workspace):
+    git(mock_workspace, "mv", "chapters/a", "chapters/renamed")
+    commit(mock_workspace, {"projects/b/project.owasp.yaml": VALID_PROJECT}, "Change")
+    git(mock_workspace, "rm", "-q", "projects/a/project.owasp.yaml")
+    git(mock_workspace, "commit", "-m", "Delete")
+
+    assert sorted(action.get_changed_files("base")) == [
+        ("A", "projects/b/project.owasp.yaml"),
+        ("D", "projects/a/project.owasp.yaml"),
+        ("R", "chapters/renamed/chapter.owasp.yaml"),
+    ]
+
+
+def test_changed_files_only(mock_workspace, capsys):
+    commit(mock_workspace, {"projects/b/project.owasp.yaml": VALID_PROJECT}, "Add project")
+
+    with pytest.raises(SystemExit) as exit_info:
+        action.main()
+
+    assert exit_info.value.code == 0
+    captured = capsys.readouterr()
+    assert "SUCCESS: Validation passed for 'projects/b/project.owasp.yaml'!" in captured.out
+    assert "projects/a" not in captured.out + captured.err
+
+
+def test_changed_files_invalid(mock_workspace, capsys):
+    commit(mock_workspace, {"projects/b/project.owasp.yaml": INVALID_PROJECT}, "Add project")
+
+    with pytest.raises(SystemExit) as exit_info:
+        action.main()
+
+    assert exit_info.value.code == 1
+    captured = capsys.readouterr()
+    assert "ERROR: Validation failed for 'projects/b/project.owasp.yaml'!" in captured.err
+    assert "[] should be non-empty" in captured.err
+
+
+def test_no_changed_files(mock_workspace, capsys):
+    commit(mock_workspace, {"README.md": VALID_CHAPTER}, "Add readme")
+
+    with pytest.raises(SystemExit) as exit_info:
+        action.main()
+
+    assert exit_info.value.code == 0
+    assert "INFO: No changed OWASP metadata files found." in capsys.readouterr().out
+
+
+def test_schema_changed(mock_workspace, capsys, monkeypatch):
+    monkeypatch.setenv(action.SCHEMA_DIRECTORY_ENV, "schema")
+    commit(mock_workspace, {"schema/project.json": VALID_CHAPTER}, "Change schema")
+
+    with pytest.raises(SystemExit) as exit_info:
+        action.main()
+
+    assert exit_info.value.code == 1
+    captured = capsys.readouterr()
+    assert "INFO: Schema files changed." in captured.out
+    assert "SUCCESS: Validation passed for 'chapters/a/chapter.owasp.yaml'!" in captured.out
+    assert "ERROR: Validation failed for 'projects/a/project.owasp.yaml'!" in captured.err
+
+
+def test_schema_file_name_elsewhere(mock_workspace, capsys):
+    commit(mock_workspace, {"docs/project.json": VALID_CHAPTER}, "Add document")
+
+    with pytest.raises(SystemExit) as exit_info:
+        action.main()
+
+    assert exit_info.value.code == 0
+    assert "INFO: No changed OWASP metadata files found." in capsys.readouterr().out
+
+
+@pytest.mark.parametrize(
+    ("path", "schema_directory", "expected"),
+    [
+        ("project.json", "", True),
+        ("schema/project.json", "schema", True),
+        ("schema/nested/project.json", "schema", False),
+        ("docs/project.json", "", False),
+        ("schema/README.md", "schema", False),
+    ],
+)
+def test_is_schema_file(path, schema_directory, expected):
+    assert action.is_schema_file(path, schema_directory) is expected
+
+
+@pytest.mark.usefixtures("mock_workspace")
+def test_unknown_base_ref(capsys, monkeypatch):
+    monkeypatch.setenv(action.BASE_REF_ENV, "unknown")
+
+    with pytest.raises(SystemExit) as exit_info:
+        action.main()
+
+    assert exit_info.value.code == 1
+    assert "ERROR: Could not list changed files." in capsys.readouterr().err
@@ -0,0 +1,152 @@
+"""Command line interface tests."""
+
+import json
+
+import pytest
+
+from owasp_schema import get_all_schemas
+from owasp_schema.cli import main
+from owasp_schema.utils.watch import MetadataWatcher
+
+CHAPTER_FILES = 2
+CORPUS_FILES = 6
+CORPUS_INVALID_FILES = 3
+CORPUS_VALID_FILES = 3
+SKIPPED_FILES = 2
+USAGE_ERROR_CODE = 2
+
+
+def test_validate_text(metadata_corpus, capsys):
+    assert main(["validate", str(metadata_corpus / "project-valid")]) == 0
+
+    captured = capsys.readouterr()
+    assert captured.out.startswith("SUCCESS: ")
+    assert "project.owasp.yaml" in captured.out
+
+
+def test_validate_text_failure(metadata_corpus, capsys):
+    assert main(["validate", str(metadata_corpus / "project-invalid")]) == 1
+
+    captured = capsys.readouterr()
+    assert "ERROR: " in captured.out
+    assert "[] should be non-empty" in captured.out
+
+
+def test_validate_json(metadata_corpus, capsys):
+    assert main(["validate", "--format", "json", str(metadata_corpus)]) == 1
+
+    report = json.loads(capsys.readouterr().out)
+    assert report["failed"] == CORPUS_INVALID_FILES
+    assert report["passed"] == CORPUS_VALID_FILES
+    assert len(report["results"]) == CORPUS_FILES
+
+
+def test_validate_jsonl(metadata_corpus, capsys):
+    assert main(["validate", "--format", "jsonl", "-j", "2", str(metadata_corpus)]) == 1
+
+    records = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert len(records) == CORPUS_FILES
+    assert sum(record["valid"] for record in records) == CORPUS_VALID_FILES
+
+
+def test_validate_batch_size(metadata_corpus, capsys):
+    assert main(["validate", "--format", "json", "--batch-size", "4", str(metadata_corpus)]) == 1
+
+    report = json.loads(capsys.readouterr().out)
+    assert report["failed"] == CORPUS_INVALID_FILES
+    assert report["passed"] == CORPUS_VALID_FILES
+
+
+def test_validate_schema_override(metadata_corpus, capsys):
+    path = metadata_corpus / "chapter-valid/chapter.owasp.yaml"
+
+    assert main(["validate", "--schema", "project", "--format", "jsonl", str(path)]) == 1
+
+    record = json.loads(capsys.readouterr().out)
+    assert record["schema_name"] == "project"
+
+
+def test_validate_no_paths():
+    with pytest.raises(SystemExit) as exit_info:
+        main(["validate"])
+
+    assert exit_info.value.code == USAGE_ERROR_CODE
+
+
+@pytest.mark.parametrize(
+    ("option", "value", "minimum"),
+    [("--jobs", "-1", 0), ("--jobs", "many", 0), ("--batch-size", "0", 1)],
+)
+def test_validate_invalid_numbers(metadata_corpus, capsys, option, value, minimum):
+    with pytest.raises(SystemExit) as exit_info:
+        main(["validate", option, value, str(metadata_corpus)])
+
+    assert exit_info.value.code == USAGE_ERROR_CODE
+    assert f"must be an integer of at least {minimum}" in capsys.readouterr().err
+
+
+def _diff_args(tmp_path):
+    for version in ("old", "new"):
+        schemas = get_all_schemas()
+        if version == "new":
+            schemas["chapter"] = {**schemas["chapter"], "required": ["blog"]}
+        (tmp_path / version).mkdir()
+        for schema_name, schema in schemas.items():
+            (tmp_path / version / f"{schema_name}.json").write_text(json.dumps(schema))
+
+    return ["diff", str(tmp_path / "old"), str(tmp_path / "new")]
+
+
+def test_diff_affected(metadata_corpus, tmp_path, capsys):
+    args = _diff_args(tmp_path)
+    assert main([*args, "--format", "json", "--affected", str(metadata_corpus)]) == 0
+
+    report = json.loads(capsys.readouterr().out)
+    assert [change["pointer"] for change in report["changes"]] == ["/required"]
+    assert [path.rsplit("/", 2)[-2] for path in report["affected"]] == [
+        "chapter-invalid",
+        "chapter-valid",
+    ]
+
+
+def test_diff_affected_skips_invalid_files(metadata_corpus, tmp_path, capsys):
+    (metadata_corpus / "foo.owasp.yaml").write_text("name: Foo\n")
+    (metadata_corpus / "chapter-broken").mkdir()
+    (metadata_corpus / "chapter-broken" / "chapter.owasp.yaml").write_text("name: [\n")
+
+    args = _diff_args(tmp_path)
+    assert main([*args, "--format", "json", "--affected", str(metadata_corpus)]) == 0
+
+    captured = capsys.readouterr()
+    assert len(json.loads(captured.out)["affected"]) == CHAPTER_FILES
+    assert captured.err.count("WARNING: Skipping") == SKIPPED_FILES
+
+
+def test_watch(metadata_corpus, capsys, monkeypatch):
+    def watch_once(watcher):
+        yield from watcher.start()
+        raise KeyboardInterrupt
+
+    monkeypatch.setattr(MetadataWatcher, "watch", watch_once)
+
+    assert main(["watch", "--format", "jsonl", str(metadata_corpus)]) == 0
+
+    records = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert len(records) == CORPUS_FILES
+
+
+def test_validate_sarif(metadata_corpus, capsys):
+    assert main(["validate", "--format", "sarif", str(metadata_corpus)]) == 1
+
+    (run,) = json.loads(capsys.readouterr().out)["runs"]
+    assert len(run["results"]) == CORPUS_INVALID_FILES
+
+
+def test_export(metadata_corpus, tmp_path, capsys):
+    database = tmp_path / "metadata.db"
+
+    assert main(["export", "--format", "json", str(database), str(metadata_corpus)]) == 1
+    assert json.loads(capsys.readouterr().out)["inserted"] == CORPUS_VALID_FILES
+
+    assert main(["export", str(database), str(metadata_corpus / "project-valid")]) == 0
+    assert capsys.readouterr().out.startswith("0 inserted, 0 updated, 1 unchanged")
@@ -9,6 +9,7 @@ from owasp_schema import chapter_schema as chapter_schema_module
 from owasp_schema import committee_schema as committee_schema_module
 from owasp_schema import common_schema as common_schema_module
 from owasp_schema import project_schema as project_schema_module
+from owasp_schema.utils import format_engines
 from owasp_schema.utils.schema_validators import validate_data
 
 project_root_dir = Path(__file__).parent.parent
@@ -17,6 +18,22 @@ tests_data_dir = tests_dir / "data"
 
 
 # Fixtures.
+@pytest.fixture
+def isolated_format_profiles(monkeypatch):
+    """Drop format profiles and engines registered by the test on teardown."""
+    engines = format_engines._engines  # noqa: SLF001
+    monkeypatch.setattr(
+        format_engines,
+        "_engines",
+        {profile: dict(profile_engines) for profile, profile_engines in engines.items()},
+    )
+    monkeypatch.setattr(
+        format_engines,
+        "_format_checkers",
+        dict(format_engines._format_checkers),  # noqa: SLF001
+    )
+
+
 @pytest.fixture
 def chapter_schema():
     return chapter_schema_module
@@ -37,6 +54,26 @@ def committee_schema():
     return committee_schema_module
 
 
+@pytest.fixture
+def metadata_corpus(tmp_path):
+    """Directory with a valid and an invalid metadata file per schema."""
+    for schema_name, negative_file in (
+        ("chapter", "blog_empty.yaml"),
+        ("committee", "community_empty.yaml"),
+        ("project", "audience_empty.yaml"),
+    ):
+        data_dir = tests_data_dir / "actions/validate" / schema_name
+        for kind, source in (
+            ("valid", data_dir / f"positive/valid_{schema_name}.yaml"),
+            ("invalid", data_dir / "negative" / negative_file),
+        ):
+            target_dir = tmp_path / f"{schema_name}-{kind}"
+            target_dir.mkdir()
+            (target_dir / f"{schema_name}.owasp.yaml").write_text(source.read_text())
+
+    return tmp_path
+
+
 # Base functions.
 def common_negative_test(common_schema, attribute_name, file_path, error_message):
     assert (
@@ -0,0 +1,245 @@
+"""Language server tests."""
+
+import io
+
+import pytest
+
+from owasp_schema.lsp import (
+    LanguageServer,
+    apply_change,
+    container_path,
+    read_message,
+    to_character,
+    to_index,
+    write_message,
+)
+from owasp_schema.utils.schema_index import ITEMS
+
+URI = "file:///workspace/project.owasp.yaml"
+DOCUMENT = """\
+name: Test project
+level: 3
+community:
+- platform: slack
+  url: https://slack.com/example
+leaders:
+  - github: leader
+    name: Leader
+  - gi
+"""
+EMOJI_NAME = "name: \U0001f600 x\n"
+MESSAGE_TYPE_ERROR = 1
+METHOD_NOT_FOUND = -32601
+
+
+def run(*messages):
+    reader = io.BytesIO()
+    for message_id, (method, params) in enumerate(messages):
+        message = {"jsonrpc": "2.0", "method": method, "params": params}
+        if not method.startswith(("exit", "textDocument/did")):
+            message["id"] = message_id
+        write_message(reader, message)
+    reader.seek(0)
+
+    writer = io.BytesIO()
+    exit_code = LanguageServer(reader, writer).serve()
+    writer.seek(0)
+
+    responses = []
+    while (response := read_message(writer)) is not None:
+        responses.append(response)
+    return exit_code, responses
+
+
+def position(line, character, uri=URI):
+    return {"position": {"character": character, "line": line}, "textDocument": {"uri": uri}}
+
+
+def did_open(text=DOCUMENT, uri=URI):
+    return "textDocument/didOpen", {"textDocument": {"text": text, "uri": uri}}
+
+
+@pytest.fixture
+def server():
+    server = LanguageServer(io.BytesIO(), io.BytesIO())
+    server.documents[URI] = DOCUMENT
+    return server
+
+
+def test_lifecycle():
+    exit_code, responses = run(("initialize", {}), ("shutdown", {}), ("exit", {}))
+
+    assert exit_code == 0
+    assert responses[0]["result"]["capabilities"]["hoverProvider"]
+    assert responses[1] == {"id": 1, "jsonrpc": "2.0", "result": None}
+
+
+def test_exit_without_shutdown():
+    assert run(("exit", {})) == (1, [])
+
+
+def test_unknown_method():
+    _, (response,) = run(("unknown", {}))
+
+    assert response["error"]["code"] == METHOD_NOT_FOUND
+
+
+def test_notification_error():
+    change = {"contentChanges": [{"range": {}, "text": "x"}], "textDocument": {"uri": URI}}
+
+    exit_code, (log_message,) = run(("textDocument/didChange", change), ("exit", {}))
+
+    assert exit_code == 1
+    assert log_message["method"] == "window/logMessage"
+    assert log_message["params"]["type"] == MESSAGE_TYPE_ERROR
+    assert log_message["params"]["message"].startswith("textDocument/didChange failed:")
+
+
+@pytest.mark.parametrize(
+    "message",
+    [
+        b"Content-Type: application/json\r\n\r\n",
+        b"Content-Length: x\r\n\r\n",
+        b"Content-Length: 2\r\n\r\n[]",
+    ],
+    ids=["no_length", "invalid_length", "not_object"],
+)
+def test_invalid_message(message):
+    reader = io.BytesIO(message)
+    reader.seek(0, io.SEEK_END)
+    write_message(reader, {"jsonrpc": "2.0", "method": "exit"})
+    reader.seek(0)
+    writer = io.BytesIO()
+
+    exit_code = LanguageServer(reader, writer).serve()
+
+    writer.seek(0)
+    log_message = read_message(writer)
+    assert exit_code == 1
+    assert log_message is not None
+    assert log_message["params"]["type"] == MESSAGE_TYPE_ERROR
+    assert log_message["params"]["message"].startswith("Invalid message:")
+    assert read_message(writer) is None
+
+
+@pytest.mark.parametrize(
+    ("line", "path"),
+    [
+        (1, ()),
+        (4, ("community", ITEMS)),
+        (7, ("leaders", ITEMS)),
+        (8, ("leaders", ITEMS)),
+    ],
+)
+def test_container_path(line, path):
+    assert container_path(DOCUMENT.splitlines(), line) == path
+
+
+def test_hover_key(server):
+    hover = server.hover(position(1, 2))
+
+    assert hover["contents"]["value"].startswith("**level** (number)")
+    assert "- `2`: Incubator" in hover["contents"]["value"]
+
+
+def test_hover_value(server):
+    value = server.hover(position(1, 7))["contents"]["value"]
+
+    assert "- `3`: Lab" in value
+    assert "Incubator" not in value
+
+
+def test_hover_nested(server):
+    assert "**platform**" in server.hover(position(3, 4))["contents"]["value"]
+    assert server.hover(position(0, 0, "file:///workspace/README.md")) is None
+
+
+def test_completion_keys(server):
+    labels = [item["label"] for item in server.completion(position(8, 6))]
+
+    assert labels == ["email", "github", "name", "slack"]
+
+
+def test_completion_values(server):
+    assert [item["label"] for item in server.completion(position(3, 12))] == [
+        "discord",
+        "slack",
+    ]
+
+
+def test_diagnostics():
+    _, (diagnostics,) = run(did_open())
+
+    assert diagnostics["method"] == "textDocument/publishDiagnostics"
+    messages = [diagnostic["message"] for diagnostic in diagnostics["params"]["diagnostics"]]
+    assert "'audience' is a required property" in messages
+    assert "'gi' is not of type 'object'" in messages
+
+    (diagnostic,) = [
+        diagnostic
+        for diagnostic in diagnostics["params"]["diagnostics"]
+        if diagnostic["message"] == "'gi' is not of type 'object'"
+    ]
+    assert diagnostic["range"]["start"] == {"character": 4, "line": 8}
+
+
+def test_diagnostics_invalid_yaml():
+    _, (diagnostics,) = run(did_open("name: [\n"))
+
+    (diagnostic,) = diagnostics["params"]["diagnostics"]
+    assert diagnostic["message"].startswith("Invalid YAML:")
+
+
+def test_did_change_incremental():
+    change = {
+        "contentChanges": [
+            {
+                "range": {
+                    "end": {"character": 8, "line": 1},
+                    "start": {"character": 7, "line": 1},
+                },
+                "text": "5",
+            },
+        ],
+        "textDocument": {"uri": URI},
+    }
+
+    _, (_, diagnostics) = run(did_open(), ("textDocument/didChange", change))
+
+    messages = [diagnostic["message"] for diagnostic in diagnostics["params"]["diagnostics"]]
+    assert "5 is not one of [2, 3, 3.5, 4]" in messages
+
+
+def test_did_close():
+    close = {"textDocument": {"uri": URI}}
+
+    _, (_, diagnostics) = run(did_open(), ("textDocument/didClose", close))
+
+    assert diagnostics["params"]["diagnostics"] == []
+
+
+def test_apply_change():
+    change = {"range": {"end": {"character": 1, "line": 1}, "start": {"character": 0, "line": 1}}}
+
+    assert apply_change("ab\ncd\n", {**change, "text": "x"}) == "ab\nxd\n"
+    assert apply_change("ab\n", {"text": "new"}) == "new"
+
+
+def test_apply_change_utf16():
+    # The emoji is two UTF-16 code units, the space after it starts at 8.
+    change = {"range": {"end": {"character": 9, "line": 0}, "start": {"character": 8, "line": 0}}}
+
+    assert apply_change(EMOJI_NAME, {**change, "text": "-"}) == "name: \U0001f600-x\n"
+
+
+@pytest.mark.parametrize(
+    ("character", "index"),
+    [(0, 0), (6, 6), (7, 6), (8, 7), (10, 9), (100, 9)],
+)
+def test_to_index(character, index):
+    assert to_index(EMOJI_NAME, character) == index
+
+
+@pytest.mark.parametrize(("index", "character"), [(0, 0), (6, 6), (7, 8), (9, 10)])
+def test_to_character(index, character):
+    assert to_character(EMOJI_NAME, index) == character
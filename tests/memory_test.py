@@ -0,0 +1,121 @@
+"""Memory budget tests.
+
+Peak budgets are about twice the baselines measured with CPython 3.11, recorded
+next to them. Retained memory of a few KiB varies between interpreter versions,
+so it is checked by its growth instead: leaks like validators rebuilt per call,
+leaked `ValidationError` trees or results accumulated in memory grow with the
+number of calls or files, small fluctuations don't. Update the baselines along
+with the budgets, use `python -m benchmarks.memory --top` to investigate a
+failure.
+"""
+
+import pytest
+
+from benchmarks.memory import (
+    IMPORT_CODE,
+    SCHEMA_LOADING_CODE,
+    make_project,
+    measure,
+    measure_bulk_validation,
+    measure_cold,
+    measure_validation,
+    measure_yaml_validation,
+    write_corpus,
+)
+from owasp_schema import get_schema
+from owasp_schema.utils.schema_validators import validate_data
+
+KIB = 1024
+MIB = 1024 * KIB
+
+# Baseline 12 KiB.
+BULK_PEAK_GROWTH_BUDGET = 24 * KIB
+BULK_RETAINED_PER_FILE_BUDGET = 1 * KIB
+CALLS = 10
+# Baseline 1.2 MiB.
+IMPORT_BUDGET = 2 * MIB
+# Baseline 35 KiB.
+INVALID_VALIDATION_PEAK_BUDGET = 64 * KIB
+LARGE_CORPUS_FILES = 20
+RETAINED_PER_CALL_BUDGET = 1 * KIB
+# Baseline 8.9 MiB.
+SCHEMA_LOADING_BUDGET = 16 * MIB
+SMALL_CORPUS_FILES = 5
+STREAM_DOCUMENT_SIZE = 300
+STREAM_PEAK_RATIO = 4
+# Baseline 21 KiB.
+VALIDATION_PEAK_BUDGET = 40 * KIB
+
+
+def _retained_per_call(function):
+    """Measure retained memory growth per call, a leak grows with the calls."""
+
+    def repeat():
+        for _ in range(CALLS):
+            function()
+
+    once = measure(function)
+    repeated = measure(repeat)
+    return (repeated.retained - once.retained) / (CALLS - 1)
+
+
+def test_import():
+    assert measure_cold(IMPORT_CODE).peak < IMPORT_BUDGET
+
+
+def test_schema_loading():
+    usage = measure_cold(SCHEMA_LOADING_CODE)
+
+    assert usage.peak < SCHEMA_LOADING_BUDGET
+    assert usage.retained < SCHEMA_LOADING_BUDGET
+
+
+@pytest.mark.parametrize("size", [1, 10, 100])
+def test_validation(size):
+    measure_validation(size)  # Warm up lazy imports and bounded caches.
+    schema = get_schema("project")
+    data = make_project(size)
+
+    usage = measure_validation(size)
+
+    assert usage.peak < VALIDATION_PEAK_BUDGET
+    assert _retained_per_call(lambda: validate_data(schema, data)) < RETAINED_PER_CALL_BUDGET
+
+
+def test_invalid_validation():
+    schema = get_schema("project")
+    data = make_project(100)
+    for leader in data["leaders"]:
+        leader["github"] = ""
+    validate_data(schema, data)
+
+    usage = measure(lambda: validate_data(schema, data))
+
+    assert usage.peak < INVALID_VALIDATION_PEAK_BUDGET
+    assert _retained_per_call(lambda: validate_data(schema, data)) < RETAINED_PER_CALL_BUDGET
+
+
+def test_stream_validation():
+    measure_yaml_validation(STREAM_DOCUMENT_SIZE, stream=True)
+
+    loaded = measure_yaml_validation(STREAM_DOCUMENT_SIZE)
+    streamed = measure_yaml_validation(STREAM_DOCUMENT_SIZE, stream=True)
+
+    # The document is validated while parsed and never built as a whole.
+    assert streamed.peak * STREAM_PEAK_RATIO < loaded.peak
+
+
+def test_bulk_validation(tmp_path):
+    small = write_corpus(tmp_path / "small", files=SMALL_CORPUS_FILES, size=10)
+    large = write_corpus(tmp_path / "large", files=LARGE_CORPUS_FILES, size=10)
+    measure_bulk_validation(small)
+
+    small_usage = measure_bulk_validation(small)
+    large_usage = measure_bulk_validation(large)
+
+    # Results are streamed, memory doesn't grow with the number of files.
+    assert large_usage.peak < small_usage.peak + BULK_PEAK_GROWTH_BUDGET
+    retained_per_file = (large_usage.retained - small_usage.retained) / (
+        LARGE_CORPUS_FILES - SMALL_CORPUS_FILES
+    )
+    assert retained_per_file < BULK_RETAINED_PER_FILE_BUDGET
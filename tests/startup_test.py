@@ -0,0 +1,41 @@
+"""Startup time tests.
+
+Budgets are deliberately loose, import times vary between machines. They catch
+heavy dependencies moved back to module import, which the tests also check for
+directly. Use `python -m benchmarks.startup` or `python -X importtime` to
+investigate a failure.
+"""
+
+import pytest
+
+from benchmarks.startup import SCENARIOS, measure_import_time
+
+MSEC = 1000
+
+STARTUP_BUDGET = 100 * MSEC
+# The command line interface also loads argparse and the standard library
+# modules of bulk validation, e.g. dataclasses.
+STARTUP_BUDGETS = {"cli": 150 * MSEC}
+LAZY_SCENARIOS = ("list schemas", "schema validators", "action", "cli")
+
+
+@pytest.mark.parametrize("scenario", LAZY_SCENARIOS)
+def test_startup(scenario):
+    code, module = SCENARIOS[scenario]
+
+    times = measure_import_time(code)
+
+    assert times.heavy_modules() == []
+    assert times.modules[module] < STARTUP_BUDGETS.get(scenario, STARTUP_BUDGET)
+
+
+def test_heavy_modules_on_first_use():
+    times = measure_import_time(
+        "from owasp_schema import get_schema\n"
+        "from owasp_schema.utils.schema_validators import validate_data\n"
+        "validate_data(get_schema('project'), {'website': 'https://owasp.org'})",
+    )
+
+    assert times.imported("jsonschema")
+    assert times.imported("validators")
+    assert not times.imported("http.server")
@@ -0,0 +1,88 @@
+"""Archive input tests."""
+
+import tarfile
+import zipfile
+
+import pytest
+
+from owasp_schema.utils.archives import is_archive, iter_archive_members, member_name
+from owasp_schema.utils.bulk_validation import validate_files
+
+CORPUS_FILES = 6
+CORPUS_VALID_FILES = 3
+
+
+def _write_archive(corpus_dir, archive_path):
+    files = sorted(corpus_dir.rglob("*.owasp.yaml"))
+    if archive_path.suffix == ".zip":
+        with zipfile.ZipFile(archive_path, "w") as archive:
+            for path in files:
+                archive.write(path, path.relative_to(corpus_dir))
+            archive.writestr("README.md", "Not a metadata file.")
+    else:
+        with (
+            tarfile.open(archive_path, "w:gz")
+            if archive_path.suffix == ".gz"
+            else tarfile.open(archive_path, "w")
+        ) as archive:
+            for path in files:
+                archive.add(path, path.relative_to(corpus_dir))
+    return archive_path
+
+
+@pytest.fixture(params=["corpus.tar", "corpus.tar.gz", "corpus.zip"])
+def archive(request, metadata_corpus, tmp_path_factory):
+    archive_path = tmp_path_factory.mktemp("archives") / request.param
+    return _write_archive(metadata_corpus, archive_path)
+
+
+@pytest.mark.parametrize(
+    ("path", "expected"),
+    [
+        ("corpus.tar", True),
+        ("corpus.TGZ", True),
+        ("corpus.tar.xz", True),
+        ("corpus.zip", True),
+        ("project.owasp.yaml", False),
+    ],
+)
+def test_is_archive(path, expected):
+    assert is_archive(path) == expected
+
+
+def test_iter_archive_members(archive, metadata_corpus):
+    members = dict(iter_archive_members(archive))
+
+    assert len(members) == CORPUS_FILES
+    name = member_name(archive, "project-valid/project.owasp.yaml")
+    assert members[name] == (metadata_corpus / "project-valid/project.owasp.yaml").read_bytes()
+
+
+def test_iter_archive_members_empty_tar(tmp_path):
+    (tmp_path / "empty.tar").touch()
+
+    assert list(iter_archive_members(tmp_path / "empty.tar")) == []
+
+
+def test_iter_archive_members_unsupported(tmp_path):
+    with pytest.raises(ValueError, match="Unsupported archive format"):
+        list(iter_archive_members(tmp_path / "corpus.rar"))
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_validate_files_archive(archive, jobs):
+    results = list(validate_files([archive], jobs=jobs))
+
+    assert len(results) == CORPUS_FILES
+    assert sum(result.is_valid for result in results) == CORPUS_VALID_FILES
+    for result in results:
+        assert result.is_valid == ("-valid/" in result.path)
+
+
+def test_validate_files_corrupt_archive(tmp_path):
+    (tmp_path / "corpus.zip").write_bytes(b"not a zip file")
+
+    (result,) = validate_files([tmp_path / "corpus.zip"])
+
+    assert result.error is not None
+    assert result.error.startswith("Could not read archive:")
@@ -0,0 +1,149 @@
+"""Bulk validation tests."""
+
+import pytest
+import yaml
+
+from owasp_schema.utils import bulk_validation
+from owasp_schema.utils.bulk_validation import (
+    detect_schema_name,
+    iter_metadata_files,
+    validate_batch,
+    validate_content,
+    validate_file,
+    validate_files,
+)
+from tests.conftest import tests_data_dir
+
+BATCH_SIZE = 4
+CORPUS_FILES = 6
+VALID_PROJECT = tests_data_dir / "actions/validate/project/positive/valid_project.yaml"
+
+
+@pytest.mark.parametrize(
+    ("file_name", "schema_name"),
+    [
+        ("chapter.owasp.yaml", "chapter"),
+        ("committee.owasp.yaml", "committee"),
+        ("some/dir/project.owasp.yaml", "project"),
+    ],
+)
+def test_detect_schema_name(file_name, schema_name):
+    assert detect_schema_name(file_name) == schema_name
+
+
+@pytest.mark.parametrize("file_name", ["common.owasp.yaml", "unknown.owasp.yaml"])
+def test_detect_schema_name_invalid(file_name):
+    with pytest.raises(ValueError, match="Could not detect schema"):
+        detect_schema_name(file_name)
+
+
+def test_iter_metadata_files(metadata_corpus):
+    files = list(iter_metadata_files([metadata_corpus]))
+
+    assert len(files) == CORPUS_FILES
+    assert all(path.name.endswith(".owasp.yaml") for path in files)
+
+
+def test_validate_content_invalid_yaml():
+    result = validate_content("project.owasp.yaml", "name: [unclosed")
+
+    assert not result.is_valid
+    assert result.error is not None
+    assert result.error.startswith("Invalid YAML:")
+
+
+def test_validate_file_missing(tmp_path):
+    result = validate_file(tmp_path / "project.owasp.yaml")
+
+    assert not result.is_valid
+    assert result.error is not None
+    assert result.error.startswith("Could not read file:")
+
+
+def test_validate_file_schema_override(metadata_corpus):
+    result = validate_file(
+        metadata_corpus / "chapter-valid/chapter.owasp.yaml",
+        schema_name="project",
+    )
+
+    assert result.schema_name == "project"
+    assert not result.is_valid
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_validate_files(metadata_corpus, jobs):
+    results = {result.path: result for result in validate_files([metadata_corpus], jobs=jobs)}
+
+    assert len(results) == CORPUS_FILES
+    for path, result in results.items():
+        assert result.is_valid == ("-valid" in path)
+        assert result.schema_name == detect_schema_name(path)
+
+
+def test_validate_content_error_location():
+    data = yaml.safe_load(VALID_PROJECT.read_text())
+    data["leaders"].append({"github": ""})
+    content = yaml.safe_dump(data)
+    lines = content.splitlines()
+
+    result = validate_content("project.owasp.yaml", content)
+
+    assert result.error == "'' does not match '^[a-zA-Z0-9-]{1,39}$'"
+    assert result.line is not None
+    assert result.column is not None
+    assert lines[result.line - 1][result.column - 1 :] == "github: ''"
+
+
+def test_validate_content_validates_once(monkeypatch):
+    calls = []
+    get_validation_error = bulk_validation.get_validation_error
+
+    def count(*args):
+        calls.append(args)
+        return get_validation_error(*args)
+
+    monkeypatch.setattr(bulk_validation, "get_validation_error", count)
+
+    result = validate_content("project.owasp.yaml", "name: ''\n")
+
+    assert not result.is_valid
+    assert len(calls) == 1
+
+
+def test_validate_content_invalid_yaml_location():
+    result = validate_content("project.owasp.yaml", "name: test\nleaders: [\n")
+
+    assert result.line == 3  # noqa: PLR2004
+
+
+@pytest.mark.parametrize("schema_name", ["chapter", "committee", "project"])
+def test_validate_batch(schema_name):
+    paths = sorted((tests_data_dir / "schema" / schema_name).rglob("*.yaml"))
+    documents = [(str(path), path.read_bytes()) for path in paths]
+
+    results = validate_batch(documents, schema_name=schema_name)
+
+    assert results == [
+        validate_content(name, content, schema_name=schema_name) for name, content in documents
+    ]
+
+
+def test_validate_batch_files(metadata_corpus, tmp_path):
+    paths = sorted(str(path) for path in iter_metadata_files([metadata_corpus]))
+    missing = str(tmp_path / "project.owasp.yaml")
+
+    results = validate_batch([(path, None) for path in [*paths, missing]])
+
+    assert results[:-1] == [validate_file(path) for path in paths]
+    assert results[-1].error is not None
+    assert results[-1].error.startswith("Could not read file:")
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_validate_files_batch_size(metadata_corpus, jobs):
+    results = validate_files([metadata_corpus], jobs=jobs, batch_size=BATCH_SIZE)
+
+    assert sorted(results, key=lambda result: result.path) == sorted(
+        validate_files([metadata_corpus]),
+        key=lambda result: result.path,
+    )
@@ -0,0 +1,86 @@
+"""Corpus index tests."""
+
+import pytest
+
+from owasp_schema.utils.corpus_index import (
+    INCONSISTENT_PERSON,
+    PROJECT_NAME,
+    REPOSITORY_URL,
+    CorpusIndex,
+    build_corpus_index,
+)
+
+
+@pytest.fixture
+def index():
+    index = CorpusIndex()
+    index.add(
+        "a/project.owasp.yaml",
+        "project",
+        {
+            "leaders": [{"github": "Leader-1", "name": "Leader One"}],
+            "name": "OWASP Example",
+            "repositories": [{"url": "https://github.com/owasp/example"}],
+        },
+    )
+    index.add(
+        "b/project.owasp.yaml",
+        "project",
+        {
+            "leaders": [{"github": "leader-1", "name": "Leader 1"}],
+            "name": "OWASP  example",
+            "repositories": [{"url": "https://github.com/OWASP/example.git"}],
+        },
+    )
+    index.add(
+        "c/chapter.owasp.yaml",
+        "chapter",
+        {"leaders": [{"github": "leader-2", "name": "Leader Two"}], "name": "OWASP Example"},
+    )
+    return index
+
+
+def test_collisions(index):
+    collisions = {collision.rule: collision for collision in index.collisions()}
+
+    assert set(collisions) == {INCONSISTENT_PERSON, PROJECT_NAME, REPOSITORY_URL}
+    assert collisions[PROJECT_NAME].key == "owasp example"
+    assert collisions[REPOSITORY_URL].key == "https://github.com/owasp/example"
+    assert collisions[INCONSISTENT_PERSON].key == "leader-1"
+    for collision in collisions.values():
+        assert collision.documents == ("a/project.owasp.yaml", "b/project.owasp.yaml")
+
+
+def test_chapter_name_not_unique(index):
+    assert set(index.lookup(PROJECT_NAME, "owasp example")) == {
+        "a/project.owasp.yaml",
+        "b/project.owasp.yaml",
+    }
+
+
+def test_incremental_update(index):
+    index.add(
+        "b/project.owasp.yaml",
+        "project",
+        {"leaders": [{"github": "leader-1"}], "name": "OWASP Other"},
+    )
+
+    assert index.collisions() == []
+    assert len(index) == 3  # noqa: PLR2004
+
+
+def test_remove(index):
+    index.remove("a/project.owasp.yaml")
+
+    assert "a/project.owasp.yaml" not in index
+    assert index.collisions() == []
+    assert index.lookup(REPOSITORY_URL, "https://github.com/owasp/example") == {
+        "b/project.owasp.yaml": ["https://github.com/OWASP/example.git"],
+    }
+
+
+def test_build_corpus_index(metadata_corpus):
+    index = build_corpus_index([metadata_corpus])
+
+    assert len(index) == len(list(metadata_corpus.rglob("*.owasp.yaml")))
+    assert {collision.rule for collision in index.collisions()} == {PROJECT_NAME}
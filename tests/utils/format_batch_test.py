@@ -0,0 +1,65 @@
+"""Batch format checking tests."""
+
+import pytest
+from jsonschema.exceptions import FormatError
+
+from owasp_schema import get_schema
+from owasp_schema.utils.format_batch import check_format_values, collect_format_values
+from owasp_schema.utils.format_engines import get_format_checker, register_format_engine
+
+COUNTING_PROFILE = "counting"
+DOCUMENTS = 10
+SLACK_URL = "https://owasp.slack.com/archives/project-nest"
+
+
+def _project(index):
+    return {
+        "leaders": [{"email": f"leader-{index}@owasp.org", "name": f"Leader {index}"}],
+        "website": "https://owasp.org/www-project-nest/",
+        "social_media": [{"platform": "slack", "url": SLACK_URL}],
+    }
+
+
+def test_collect_format_values():
+    schema = get_schema("project")
+
+    values = collect_format_values((schema, _project(index)) for index in range(DOCUMENTS))
+
+    assert values["email"] == {f"leader-{index}@owasp.org" for index in range(DOCUMENTS)}
+    assert {"https://owasp.org/www-project-nest/", SLACK_URL} <= values["uri"]
+
+
+def test_collect_format_values_ignores_non_strings():
+    values = collect_format_values([({"format": "uri"}, 1)])
+
+    assert values == {}
+
+
+def test_check_format_values():
+    format_checker = check_format_values({"email": {"leader@owasp.org", "not-an-email"}})
+
+    format_checker.check("leader@owasp.org", "email")
+    with pytest.raises(FormatError, match="is not a 'email'"):
+        format_checker.check("not-an-email", "email")
+    # Values not checked ahead fall back to the profile checker.
+    assert not format_checker.conforms("not-a-uri", "uri")
+
+
+@pytest.mark.usefixtures("isolated_format_profiles")
+def test_check_format_values_once():
+    checked = []
+
+    def check(value):
+        checked.append(value)
+        return value.startswith("https://")
+
+    register_format_engine(COUNTING_PROFILE, "uri", check)
+    schema = get_schema("project")
+    documents = [(schema, _project(index)) for index in range(DOCUMENTS)]
+
+    format_checker = check_format_values(collect_format_values(documents), COUNTING_PROFILE)
+    for _, data in documents:
+        format_checker.check(data["social_media"][0]["url"], "uri")
+
+    assert sorted(checked) == sorted({SLACK_URL, "https://owasp.org/www-project-nest/"})
+    assert format_checker.format_checker is get_format_checker(COUNTING_PROFILE)
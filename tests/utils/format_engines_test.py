@@ -0,0 +1,80 @@
+"""Format engine tests."""
+
+import pytest
+import yaml
+
+from owasp_schema import get_schema
+from owasp_schema.utils.format_engines import (
+    FAST,
+    SKIP,
+    STRICT,
+    get_format_checker,
+    list_format_profiles,
+    register_format_engine,
+)
+from owasp_schema.utils.schema_validators import get_validator, validate_data
+from tests.conftest import tests_data_dir
+
+
+def _fixtures(kind):
+    schema_dir = tests_data_dir / "schema"
+    for path in sorted(schema_dir.glob(f"*/{kind}/*.yaml")):
+        yield pytest.param(get_schema(path.parent.parent.name), path, id=path.stem)
+    for path in sorted(schema_dir.glob(f"common/*/{kind}/*.yaml")):
+        definition = get_schema("common")["definitions"][path.parent.parent.name]
+        yield pytest.param(definition, path, id=f"common-{path.stem}")
+
+
+@pytest.mark.parametrize(
+    ("schema", "file_path"),
+    [*_fixtures("negative"), *_fixtures("positive")],
+)
+def test_fast_conformance(schema, file_path):
+    data = yaml.safe_load(file_path.read_text())
+
+    assert validate_data(schema, data, format_profile=FAST) == validate_data(
+        schema,
+        data,
+        format_profile=STRICT,
+    )
+
+
+@pytest.mark.parametrize(("schema", "file_path"), list(_fixtures("positive")))
+def test_skip_positive(schema, file_path):
+    assert validate_data(schema, yaml.safe_load(file_path.read_text()), SKIP) is None
+
+
+@pytest.mark.parametrize(
+    ("value", "format_name"),
+    [
+        ("https://invalid/", "uri"),
+        ("user@name", "email"),
+        ("not a date", "date"),
+    ],
+)
+def test_skip_ignores_formats(value, format_name):
+    assert validate_data({"format": format_name, "type": "string"}, value, SKIP) is None
+
+
+def test_list_format_profiles():
+    assert {FAST, SKIP, STRICT} <= set(list_format_profiles())
+
+
+def test_get_format_checker_invalid():
+    with pytest.raises(KeyError, match="Format profile 'unknown' not found"):
+        get_format_checker("unknown")
+
+
+@pytest.mark.usefixtures("isolated_format_profiles")
+def test_register_format_engine():
+    schema = {"format": "uri", "type": "string"}
+    register_format_engine("custom", "uri", lambda value: value.startswith("https:"))
+    validator = get_validator(schema, "custom")
+
+    register_format_engine("custom", "uri", lambda value: value.startswith("owasp:"))
+
+    assert get_validator(schema, "custom") is not validator
+    assert validate_data(schema, "owasp:nest", "custom") is None
+    assert validate_data(schema, "https://owasp.org", "custom") == (
+        "'https://owasp.org' is not a 'uri'"
+    )
@@ -0,0 +1,135 @@
+"""Validation metrics tests."""
+
+import asyncio
+import urllib.request
+
+import pytest
+
+from owasp_schema import get_schema
+from owasp_schema.utils.bulk_validation import validate_batch
+from owasp_schema.utils.metrics import (
+    CONTENT_TYPE,
+    ValidationMetrics,
+    metrics,
+    render_prometheus,
+    schema_label,
+    start_metrics_server,
+)
+from owasp_schema.utils.result_cache import ValidationCache
+from owasp_schema.utils.schema_validators import validate_data, validate_data_async
+from owasp_schema.utils.stream_validation import validate_stream
+from tests.conftest import tests_data_dir
+
+EVENT_SCHEMA = get_schema("common")["definitions"]["event"]
+INVALID_PROJECT = tests_data_dir / "actions/validate/project/negative/audience_empty.yaml"
+VALID_PROJECT = tests_data_dir / "actions/validate/project/positive/valid_project.yaml"
+
+
+@pytest.fixture
+def enabled_metrics():
+    metrics.reset()
+    metrics.enabled = True
+    yield metrics
+    metrics.enabled = False
+    metrics.reset()
+
+
+@pytest.mark.parametrize(
+    ("schema", "label"),
+    [
+        (get_schema("project"), "project"),
+        (EVENT_SCHEMA, "Event"),
+        ({}, "unknown"),
+    ],
+)
+def test_schema_label(schema, label):
+    assert schema_label(schema) == label
+
+
+def test_disabled():
+    metrics.reset()
+    validate_data(EVENT_SCHEMA, {"url": "https://owasp.org"})
+
+    assert "owasp_schema_validations_total{" not in render_prometheus()
+
+
+def test_validations(enabled_metrics):
+    validate_data(EVENT_SCHEMA, {"url": "https://owasp.org"})
+    validate_data(EVENT_SCHEMA, {"url": "invalid"})
+    asyncio.run(validate_data_async(EVENT_SCHEMA, {"url": "https://owasp.org"}))
+
+    output = enabled_metrics.render_prometheus()
+
+    assert 'owasp_schema_validations_total{schema="Event",result="pass"} 2' in output
+    assert 'owasp_schema_validations_total{schema="Event",result="fail"} 1' in output
+    assert 'owasp_schema_validation_duration_seconds_bucket{schema="Event",le="+Inf"} 3' in output
+    assert 'owasp_schema_validation_duration_seconds_count{schema="Event"} 3' in output
+    assert 'owasp_schema_format_checks_total{format="uri",result="pass"} 2' in output
+    assert 'owasp_schema_format_checks_total{format="uri",result="fail"} 1' in output
+
+
+def test_batch_validations(enabled_metrics):
+    validate_batch([(str(VALID_PROJECT), None), (str(INVALID_PROJECT), None)], "project")
+
+    output = enabled_metrics.render_prometheus()
+
+    assert 'owasp_schema_validations_total{schema="project",result="pass"} 1' in output
+    assert 'owasp_schema_validations_total{schema="project",result="fail"} 1' in output
+    assert 'owasp_schema_validation_duration_seconds_count{schema="project"} 2' in output
+
+
+def test_stream_validations(enabled_metrics):
+    validate_stream(get_schema("project"), VALID_PROJECT.read_bytes())
+    validate_stream(get_schema("project"), INVALID_PROJECT.read_bytes())
+
+    output = enabled_metrics.render_prometheus()
+
+    assert 'owasp_schema_validations_total{schema="project",result="pass"} 1' in output
+    assert 'owasp_schema_validations_total{schema="project",result="fail"} 1' in output
+
+
+def test_schema_loads():
+    assert 'owasp_schema_schema_loads_total{loader="schemas"} 1' in render_prometheus()
+
+
+def test_histogram_buckets():
+    validation_metrics = ValidationMetrics(buckets=(0.1, 1.0))
+    for duration in (0.05, 0.5, 5.0):
+        validation_metrics.observe_validation({}, duration=duration, passed=True)
+
+    output = validation_metrics.render_prometheus()
+
+    assert 'owasp_schema_validation_duration_seconds_bucket{schema="unknown",le="0.1"} 1' in output
+    assert 'owasp_schema_validation_duration_seconds_bucket{schema="unknown",le="1.0"} 2' in output
+    assert (
+        'owasp_schema_validation_duration_seconds_bucket{schema="unknown",le="+Inf"} 3' in output
+    )
+    assert 'owasp_schema_validation_duration_seconds_sum{schema="unknown"} 5.55' in output
+
+
+def test_caches():
+    validation_metrics = ValidationMetrics()
+    cache = ValidationCache()
+    validation_metrics.register_cache("api", cache)
+    for _ in range(2):
+        validate_data(EVENT_SCHEMA, {"url": "https://owasp.org"}, cache=cache)
+
+    output = validation_metrics.render_prometheus()
+
+    assert 'owasp_schema_cache_hits_total{cache="api"} 1' in output
+    assert 'owasp_schema_cache_misses_total{cache="api"} 1' in output
+    assert 'owasp_schema_cache_hit_ratio{cache="api"} 0.5' in output
+
+
+@pytest.mark.usefixtures("enabled_metrics")
+def test_metrics_server():
+    validate_data(EVENT_SCHEMA, {"url": "https://owasp.org"})
+    server = start_metrics_server(0, "127.0.0.1")
+    try:
+        url = f"http://127.0.0.1:{server.server_address[1]}/metrics"
+        with urllib.request.urlopen(url) as response:
+            assert response.headers["Content-Type"] == CONTENT_TYPE
+            assert 'schema="Event",result="pass"' in response.read().decode()
+    finally:
+        server.shutdown()
+        server.server_close()
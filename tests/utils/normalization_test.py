@@ -0,0 +1,104 @@
+"""Single-pass validation and normalization tests."""
+
+import pytest
+import yaml
+
+from owasp_schema import get_schema
+from owasp_schema.utils.normalization import (
+    normalize_email,
+    normalize_uri,
+    validate_and_normalize,
+)
+from owasp_schema.utils.schema_validators import validate_data
+from tests.conftest import tests_data_dir
+
+PROJECT_DATA = tests_data_dir / "schema/project/positive/required_properties.yaml"
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        ("HTTPS://OWASP.org/Path?Q=A#F", "https://owasp.org/Path?Q=A#F"),
+        ("https://User@Example.COM:8080/", "https://User@example.com:8080/"),
+        ("not a uri", "not a uri"),
+    ],
+)
+def test_normalize_uri(value, expected):
+    assert normalize_uri(value) == expected
+
+
+def test_normalize_email():
+    assert normalize_email("Leader@OWASP.org") == "Leader@owasp.org"
+
+
+def test_validate_and_normalize():
+    data = yaml.safe_load(PROJECT_DATA.read_text())
+    del data["level"]
+    data["name"] = f"  {data['name']}  "
+    data["leaders"][0]["email"] = " Leader@OWASP.org "
+    data["repositories"] = [{"url": " HTTPS://GitHub.com/OWASP/Nest "}]
+
+    normalized, error = validate_and_normalize(get_schema("project"), data)
+
+    assert error is None
+    assert normalized is data
+    assert data["level"] == 2  # noqa: PLR2004
+    assert data["name"] == data["name"].strip()
+    assert data["leaders"][0]["email"] == "Leader@owasp.org"
+    assert data["repositories"] == [{"url": "https://github.com/OWASP/Nest"}]
+    assert validate_data(get_schema("project"), data) is None
+
+
+def test_validate_and_normalize_array_items():
+    data = yaml.safe_load(PROJECT_DATA.read_text())
+    data["demo"] = [" HTTPS://Demo.example.com/ "]
+
+    _, error = validate_and_normalize(get_schema("project"), data)
+
+    assert error is None
+    assert data["demo"] == ["https://demo.example.com/"]
+
+
+def test_validate_and_normalize_references():
+    schema = {
+        "$schema": "http://json-schema.org/draft-07/schema#",
+        "definitions": {"website": {"format": "uri", "type": "string"}},
+        "properties": {
+            "home": {"$ref": "#/definitions/website"},
+            "websites": {"items": {"$ref": "#/definitions/website"}, "type": "array"},
+        },
+    }
+    data = {"home": " HTTPS://OWASP.org/ ", "websites": [" HTTPS://Nest.OWASP.org/ "]}
+
+    _, error = validate_and_normalize(schema, data)
+
+    assert error is None
+    assert data == {"home": "https://owasp.org/", "websites": ["https://nest.owasp.org/"]}
+
+
+@pytest.mark.parametrize("required_first", [True, False])
+def test_validate_and_normalize_required_defaults(required_first):
+    keywords = {
+        "required": ["level"],
+        "properties": {"level": {"default": 2, "type": "number"}},
+    }
+    if not required_first:
+        keywords = dict(reversed(keywords.items()))
+    schema = {"$schema": "http://json-schema.org/draft-07/schema#", **keywords}
+    data: dict = {}
+
+    _, error = validate_and_normalize(schema, data)
+
+    assert error is None
+    assert data == {"level": 2}
+
+
+def test_validate_and_normalize_errors():
+    data = yaml.safe_load(PROJECT_DATA.read_text())
+    data["pitch"] = "   "
+
+    normalized, error = validate_and_normalize(get_schema("project"), data)
+
+    assert normalized["pitch"] == ""
+    assert error == validate_data(get_schema("project"), normalized)
+    assert error is not None
@@ -0,0 +1,124 @@
+"""Streaming report writers tests."""
+
+import io
+import json
+
+import pytest
+
+from owasp_schema.utils.bulk_validation import ValidationResult, validate_files
+from owasp_schema.utils.reports import (
+    SARIF_RULE_ID,
+    SARIF_SRCROOT,
+    SARIF_VERSION,
+    JsonlReport,
+    Report,
+    SarifReport,
+    sarif_result,
+    write_report,
+)
+
+CORPUS_FILES = 6
+CORPUS_INVALID_FILES = 3
+ERROR_LINE = 3
+ERROR_COLUMN = 5
+
+
+def test_jsonl(metadata_corpus):
+    stream = io.StringIO()
+
+    report = write_report(validate_files([metadata_corpus]), JsonlReport(stream))
+
+    records = [json.loads(line) for line in stream.getvalue().splitlines()]
+    assert len(records) == CORPUS_FILES
+    assert report.failed == sum(not record["valid"] for record in records)
+    assert report.passed == CORPUS_FILES - CORPUS_INVALID_FILES
+
+
+def test_report_is_abstract():
+    with pytest.raises(TypeError, match="abstract"):
+        Report(io.StringIO())  # type: ignore[abstract]
+
+
+def test_sarif(metadata_corpus):
+    stream = io.StringIO()
+
+    report = write_report(
+        validate_files([metadata_corpus], jobs=2),
+        SarifReport(stream, base_directory=metadata_corpus),
+    )
+
+    log = json.loads(stream.getvalue())
+    assert log["version"] == SARIF_VERSION
+    (run,) = log["runs"]
+    assert run["tool"]["driver"]["rules"][0]["id"] == SARIF_RULE_ID
+    assert run["originalUriBaseIds"] == {
+        SARIF_SRCROOT: {"uri": f"{metadata_corpus.resolve().as_uri()}/"},
+    }
+    assert len(run["results"]) == report.failed == CORPUS_INVALID_FILES
+    for result in run["results"]:
+        physical_location = result["locations"][0]["physicalLocation"]
+        assert physical_location["artifactLocation"]["uriBaseId"] == SARIF_SRCROOT
+        assert not physical_location["artifactLocation"]["uri"].startswith("/")
+        assert physical_location["region"]
+
+
+def test_sarif_empty():
+    stream = io.StringIO()
+
+    write_report(
+        [ValidationResult(path="project.owasp.yaml", schema_name="project")],
+        SarifReport(stream),
+    )
+
+    assert json.loads(stream.getvalue())["runs"][0]["results"] == []
+
+
+def test_sarif_streaming():
+    stream = io.StringIO()
+    report = SarifReport(stream)
+    report.write(ValidationResult(path="a.owasp.yaml", schema_name=None, error="Invalid."))
+
+    assert "Invalid." in stream.getvalue()
+
+    report.close()
+    report.close()
+    assert len(json.loads(stream.getvalue())["runs"][0]["results"]) == 1
+
+
+def test_sarif_result(tmp_path):
+    result = ValidationResult(
+        path=str(tmp_path / "projects" / "my project.owasp.yaml"),
+        schema_name="project",
+        error="'' is not a 'uri'",
+        line=ERROR_LINE,
+        column=ERROR_COLUMN,
+    )
+
+    assert sarif_result(result, tmp_path)["locations"] == [
+        {
+            "physicalLocation": {
+                "artifactLocation": {
+                    "uri": "projects/my%20project.owasp.yaml",
+                    "uriBaseId": SARIF_SRCROOT,
+                },
+                "region": {"startColumn": ERROR_COLUMN, "startLine": ERROR_LINE},
+            },
+        },
+    ]
+
+
+def test_sarif_result_outside_base_directory(tmp_path):
+    path = tmp_path / "project.owasp.yaml"
+    result = ValidationResult(path=str(path), schema_name=None, error="Error.")
+
+    artifact_location = sarif_result(result, tmp_path / "base")["locations"][0][
+        "physicalLocation"
+    ]["artifactLocation"]
+
+    assert artifact_location == {"uri": path.resolve().as_uri()}
+
+
+def test_sarif_result_without_location():
+    result = ValidationResult(path="project.owasp.yaml", schema_name=None, error="Error.")
+
+    assert "region" not in sarif_result(result)["locations"][0]["physicalLocation"]
@@ -0,0 +1,108 @@
+"""Validation result cache tests."""
+
+import asyncio
+
+import pytest
+
+from owasp_schema import get_schema
+from owasp_schema.utils.result_cache import ENTRY_OVERHEAD_BYTES, ValidationCache, canonical_hash
+from owasp_schema.utils.schema_validators import validate_data, validate_data_async
+
+# Entries kept by `test_max_bytes`, two fit in its size limit.
+MAX_BYTES_ENTRIES = 2
+PERSON_SCHEMA = get_schema("common")["definitions"]["person"]
+# Person, repository and person with the fast profile.
+SCHEMA_ENTRIES = 3
+# A valid and an invalid document.
+VALIDATION_ENTRIES = 2
+
+
+def test_canonical_hash_key_order():
+    assert canonical_hash({"a": 1, "b": [1, 2]}) == canonical_hash({"b": [1, 2], "a": 1})
+
+
+@pytest.mark.parametrize(
+    ("first", "second"),
+    [
+        (1, 1.0),
+        (1, True),
+        (1, "1"),
+        (None, "None"),
+        ([], {}),
+        ([1, 2], [2, 1]),
+        ({1: "a"}, {"1": "a"}),
+        (["ab", "c"], ["a", "bc"]),
+    ],
+)
+def test_canonical_hash_type_aware(first, second):
+    assert canonical_hash(first) != canonical_hash(second)
+
+
+def test_validate_data_cache():
+    cache = ValidationCache()
+
+    for _ in range(3):
+        assert validate_data(PERSON_SCHEMA, {"github": "leader"}, cache=cache) is None
+        assert validate_data(PERSON_SCHEMA, {}, cache=cache) == "'github' is a required property"
+
+    stats = cache.stats()
+    assert stats.entries == len(cache) == VALIDATION_ENTRIES
+    assert (stats.hits, stats.misses) == (4, 2)
+    assert stats.hit_rate == pytest.approx(4 / 6)
+
+
+def test_validate_data_cache_schema_identity():
+    cache = ValidationCache()
+    data = {"url": "https://owasp.org"}
+
+    validate_data(PERSON_SCHEMA, data, cache=cache)
+    validate_data(get_schema("common")["definitions"]["repository"], data, cache=cache)
+    validate_data(PERSON_SCHEMA, data, format_profile="fast", cache=cache)
+
+    assert cache.stats().misses == len(cache) == SCHEMA_ENTRIES
+
+
+def test_validate_data_async_cache():
+    cache = ValidationCache()
+
+    async def validate_twice():
+        return [
+            await validate_data_async(PERSON_SCHEMA, {"github": ""}, cache=cache),
+            await validate_data_async(PERSON_SCHEMA, {"github": ""}, cache=cache),
+        ]
+
+    assert asyncio.run(validate_twice()) == ["'' does not match '^[a-zA-Z0-9-]{1,39}$'"] * 2
+    assert validate_data(PERSON_SCHEMA, {"github": ""}, cache=cache) is not None
+
+    stats = cache.stats()
+    assert (stats.hits, stats.misses) == (2, 1)
+
+
+def test_max_entries():
+    cache = ValidationCache(max_entries=2)
+    for key in range(3):
+        cache.put((key,), None)
+
+    assert cache.get((0,)) == (False, None)
+    assert cache.get((2,)) == (True, None)
+    assert cache.stats().evictions == 1
+
+
+def test_max_bytes():
+    cache = ValidationCache(max_bytes=ENTRY_OVERHEAD_BYTES * MAX_BYTES_ENTRIES + 10)
+    cache.put((1,), "x" * 10)
+    cache.put((2,), None)
+    cache.put((3,), None)
+
+    assert len(cache) == MAX_BYTES_ENTRIES
+    assert cache.stats().bytes <= cache.max_bytes
+
+
+def test_clear():
+    cache = ValidationCache()
+    validate_data(PERSON_SCHEMA, {}, cache=cache)
+
+    cache.clear()
+
+    assert len(cache) == 0
+    assert cache.stats().misses == 0
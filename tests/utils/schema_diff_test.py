@@ -0,0 +1,224 @@
+"""Schema diff tests."""
+
+import copy
+
+import pytest
+
+from owasp_schema import get_all_schemas
+from owasp_schema.utils.schema_diff import (
+    ANNOTATION,
+    NARROWING,
+    WIDENING,
+    FieldPresenceIndex,
+    affected_documents,
+    classify_keyword_change,
+    diff_schema_sets,
+    diff_schemas,
+    document_paths,
+    map_schema_locations,
+)
+
+
+@pytest.fixture
+def schemas():
+    return copy.deepcopy(get_all_schemas())
+
+
+@pytest.fixture
+def index():
+    index = FieldPresenceIndex()
+    index.add("plain.owasp.yaml", "project", {"level": 2, "name": "Plain"})
+    index.add(
+        "social.owasp.yaml",
+        "project",
+        {"name": "Social", "social_media": [{"platform": "x", "url": "https://x.com/a"}]},
+    )
+    index.add(
+        "chapter.owasp.yaml",
+        "chapter",
+        {"name": "Chapter", "social_media": [{"platform": "x", "url": "https://x.com/b"}]},
+    )
+    return index
+
+
+@pytest.mark.parametrize(
+    ("keyword", "old", "new", "kind"),
+    [
+        ("description", "Old.", "New.", ANNOTATION),
+        ("enum", ["a"], ["a", "b"], WIDENING),
+        ("enum", ["a", "b"], ["a"], NARROWING),
+        ("required", ["a", "b"], ["a"], WIDENING),
+        ("required", ["a"], ["a", "b"], NARROWING),
+        ("type", "string", ["null", "string"], WIDENING),
+        ("type", ["null", "string"], "string", NARROWING),
+        ("minLength", 5, 3, WIDENING),
+        ("minItems", 1, 2, NARROWING),
+        ("maxLength", 10, 20, WIDENING),
+        ("maxItems", 10, 5, NARROWING),
+        ("uniqueItems", True, False, WIDENING),
+        ("additionalProperties", False, True, WIDENING),
+        ("pattern", "^a$", "^b$", NARROWING),
+    ],
+)
+def test_classify_keyword_change(keyword, old, new, kind):
+    assert classify_keyword_change(keyword, old, new) == kind
+
+
+def test_diff_identical(schemas):
+    assert diff_schema_sets(schemas, copy.deepcopy(schemas)) == []
+
+
+def test_diff_enum_widening(schemas):
+    new_schemas = copy.deepcopy(schemas)
+    platform = new_schemas["common"]["definitions"]["social_media"]["properties"]["platform"]
+    platform["enum"].append("mastodon")
+
+    (change,) = diff_schema_sets(schemas, new_schemas)
+
+    assert change.schema_name == "common"
+    assert change.pointer == "/definitions/social_media/properties/platform/enum"
+    assert change.kind == WIDENING
+
+
+def test_diff_properties():
+    old = {"additionalProperties": False, "properties": {"a": {}, "b": {}}}
+    new = {"additionalProperties": False, "properties": {"a": {}, "c": {}}}
+
+    changes = {change.pointer: change.kind for change in diff_schemas(old, new)}
+
+    assert changes == {"/properties/b": NARROWING, "/properties/c": WIDENING}
+
+
+@pytest.mark.parametrize(
+    ("old", "new", "kind"),
+    [
+        ({"anyOf": [{"enum": ["a"]}]}, {"anyOf": [{"enum": ["a", "b"]}]}, WIDENING),
+        ({"not": {"enum": ["a"]}}, {"not": {"enum": ["a", "b"]}}, NARROWING),
+        ({"not": {"enum": ["a", "b"]}}, {"not": {"enum": ["a"]}}, WIDENING),
+        (
+            {"not": {"anyOf": [{"enum": ["a"]}]}},
+            {"not": {"anyOf": [{"enum": ["a", "b"]}]}},
+            NARROWING,
+        ),
+        ({"not": {"not": {"enum": ["a"]}}}, {"not": {"not": {"enum": ["a", "b"]}}}, WIDENING),
+        ({"oneOf": [{"enum": ["a"]}, {}]}, {"oneOf": [{"enum": ["a", "b"]}, {}]}, NARROWING),
+        ({"not": {"oneOf": [{"enum": ["a"]}]}}, {"not": {"oneOf": [{"enum": []}]}}, NARROWING),
+        ({"if": {"enum": ["a"]}}, {"if": {"enum": ["a", "b"]}}, NARROWING),
+    ],
+)
+def test_diff_subschema_polarity(old, new, kind):
+    (change,) = diff_schemas(old, new)
+
+    assert change.kind == kind
+
+
+def test_document_paths():
+    assert document_paths({"leaders": [{"github": "a"}, {"name": "B"}], "level": 2}) == {
+        "",
+        "leaders",
+        "leaders.*",
+        "leaders.*.github",
+        "leaders.*.name",
+        "level",
+    }
+
+
+def test_map_schema_locations(schemas):
+    locations = map_schema_locations(schemas)
+
+    assert locations[("common", "/definitions/person/properties/github")] >= {
+        ("chapter", "leaders.*.github"),
+        ("project", "leaders.*.github"),
+    }
+
+
+def test_affected_documents_widening_only(schemas, index):
+    new_schemas = copy.deepcopy(schemas)
+    new_schemas["project"]["properties"]["level"]["enum"].append(5)
+
+    changes = diff_schema_sets(schemas, new_schemas)
+
+    assert affected_documents(changes, index, schemas, new_schemas) == set()
+
+
+def test_affected_documents_common_definition(schemas, index):
+    new_schemas = copy.deepcopy(schemas)
+    platform = new_schemas["common"]["definitions"]["social_media"]["properties"]["platform"]
+    platform["enum"].remove("x")
+
+    changes = diff_schema_sets(schemas, new_schemas)
+
+    assert affected_documents(changes, index, schemas, new_schemas) == {
+        "chapter.owasp.yaml",
+        "social.owasp.yaml",
+    }
+
+
+def test_affected_documents_required(schemas, index):
+    new_schemas = copy.deepcopy(schemas)
+    new_schemas["project"]["required"].append("website")
+
+    changes = diff_schema_sets(schemas, new_schemas)
+
+    assert affected_documents(changes, index, schemas, new_schemas) == {
+        "plain.owasp.yaml",
+        "social.owasp.yaml",
+    }
+
+
+def test_affected_documents_negated(schemas, index):
+    schemas["project"]["properties"]["name"]["not"] = {"enum": ["TBD"]}
+    new_schemas = copy.deepcopy(schemas)
+    new_schemas["project"]["properties"]["name"]["not"]["enum"].append("Plain")
+
+    changes = diff_schema_sets(schemas, new_schemas)
+
+    assert affected_documents(changes, index, schemas, new_schemas) == {
+        "plain.owasp.yaml",
+        "social.owasp.yaml",
+    }
+
+
+@pytest.mark.parametrize(
+    ("keyword", "old", "new"),
+    [
+        ("dependencies", {"name": {"required": []}}, {"name": {"required": ["website"]}}),
+        ("if", {"required": ["name"]}, {"required": ["level", "name"]}),
+        ("patternProperties", {"^x-": {"type": ["null", "string"]}}, {"^x-": {"type": "string"}}),
+        ("propertyNames", {"maxLength": 20}, {"maxLength": 10}),
+    ],
+)
+def test_affected_documents_in_place_subschema(schemas, index, keyword, old, new):
+    schemas["project"][keyword] = old
+    new_schemas = copy.deepcopy(schemas)
+    new_schemas["project"][keyword] = new
+
+    changes = diff_schema_sets(schemas, new_schemas)
+
+    assert affected_documents(changes, index, schemas, new_schemas) == {
+        "plain.owasp.yaml",
+        "social.owasp.yaml",
+    }
+
+
+def test_affected_documents_unmapped_location(schemas, index):
+    social_media = schemas["common"]["definitions"]["social_media"]
+    social_media["propertyNames"] = {"maxLength": 20}
+    new_schemas = copy.deepcopy(schemas)
+    new_schemas["common"]["definitions"]["social_media"]["propertyNames"]["maxLength"] = 5
+
+    changes = diff_schema_sets(schemas, new_schemas)
+
+    # Applies to the social media items the definition is mapped to.
+    assert affected_documents(changes, index, schemas, new_schemas) == {
+        "chapter.owasp.yaml",
+        "social.owasp.yaml",
+    }
+
+
+def test_field_presence_index_remove(index):
+    index.remove("social.owasp.yaml")
+
+    assert "social.owasp.yaml" not in index
+    assert index.documents("project", "social_media.*.platform") == set()
+    assert index.documents("project") == {"plain.owasp.yaml"}
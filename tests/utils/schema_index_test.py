@@ -0,0 +1,53 @@
+"""Schema index tests."""
+
+import pytest
+
+from owasp_schema.utils.schema_index import (
+    ITEMS,
+    SchemaIndexEntry,
+    build_schema_index,
+    get_schema_index,
+)
+
+
+def test_project_level():
+    entry = get_schema_index("project")[("level",)]
+
+    assert entry.description == "The numeric level of the project."
+    assert entry.enum_items() == [
+        (2, "Incubator"),
+        (3, "Lab"),
+        (3.5, "Production"),
+        (4, "Flagship"),
+    ]
+
+
+@pytest.mark.parametrize(
+    ("schema_name", "path", "enum"),
+    [
+        ("project", ("type",), ("code", "documentation", "tool")),
+        ("project", ("community", ITEMS, "platform"), ("discord", "slack")),
+        ("project", ("audience", ITEMS), ("breaker", "builder", "defender")),
+        ("chapter", ("community", ITEMS, "platform"), ("discord", "slack")),
+    ],
+)
+def test_enum(schema_name, path, enum):
+    assert get_schema_index(schema_name)[path].enum == enum
+
+
+def test_references_resolved():
+    index = get_schema_index("project")
+
+    assert index[("leaders", ITEMS)].properties == ("email", "github", "name", "slack")
+    assert index[("leaders", ITEMS)].required == ("github",)
+    assert index[("leaders", ITEMS, "github")].type == "string"
+
+
+def test_recursive_schema():
+    schema = {"properties": {"child": {"$ref": "#"}}, "type": "object"}
+
+    assert set(build_schema_index(schema)) == {(), ("child",)}
+
+
+def test_enum_items_without_descriptions():
+    assert SchemaIndexEntry(enum=("a", "b")).enum_items() == [("a", None), ("b", None)]
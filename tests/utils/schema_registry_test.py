@@ -0,0 +1,168 @@
+"""Reloadable schema registry tests."""
+
+import json
+import os
+import shutil
+import threading
+
+import pytest
+import yaml
+from jsonschema.exceptions import SchemaError
+
+from owasp_schema import get_schema, list_schemas
+from owasp_schema.utils.format_engines import FAST
+from owasp_schema.utils.schema_registry import SchemaRegistry
+from owasp_schema.utils.schema_validators import SCHEMA_DIRECTORY, validate_data
+from tests.conftest import tests_data_dir
+
+MTIME_STEP_NS = 1_000_000_000
+RELOADS = 5
+THREADS = 4
+VALID_PROJECT = tests_data_dir / "actions/validate/project/positive/valid_project.yaml"
+
+
+@pytest.fixture
+def schema_directory(tmp_path):
+    for schema_name in list_schemas():
+        shutil.copy(SCHEMA_DIRECTORY / f"{schema_name}.json", tmp_path)
+    return tmp_path
+
+
+def _edit(path, update):
+    schema = json.loads(path.read_text())
+    update(schema)
+    stat = path.stat()
+    path.write_text(json.dumps(schema))
+    # Coarse file system timestamps may not change within a test.
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + MTIME_STEP_NS))
+
+
+def _require_tags(schema):
+    schema["required"].append("tags")
+
+
+@pytest.fixture
+def project():
+    return yaml.safe_load(VALID_PROJECT.read_text())
+
+
+def test_initial_load(schema_directory, project):
+    registry = SchemaRegistry(schema_directory)
+
+    assert registry.list_schemas() == list_schemas()
+    assert registry.get_schema("project") == get_schema("project")
+    assert registry.validate("project", project) is None
+    project["leaders"] = []
+    assert registry.validate("project", project) == validate_data(get_schema("project"), project)
+
+
+def test_reload_unchanged(schema_directory):
+    registry = SchemaRegistry(schema_directory)
+    snapshot = registry.snapshot
+
+    assert not registry.reload()
+    assert registry.snapshot is snapshot
+
+
+def test_reload_touched(schema_directory):
+    registry = SchemaRegistry(schema_directory)
+    snapshot = registry.snapshot
+    path = schema_directory / "project.json"
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + MTIME_STEP_NS))
+
+    assert not registry.reload()
+    assert registry.snapshot.version == snapshot.version
+    assert registry.snapshot.validators is snapshot.validators
+    assert not registry.snapshot.files["project"].is_stale()
+
+
+def test_reload_changed(schema_directory, project):
+    registry = SchemaRegistry(schema_directory)
+    snapshot = registry.snapshot
+    project.pop("tags", None)
+
+    _edit(schema_directory / "project.json", _require_tags)
+
+    assert registry.reload()
+    assert registry.snapshot.version == snapshot.version + 1
+    assert registry.validate("project", project) == "'tags' is a required property"
+    # Held snapshots keep validating with the schemas they were loaded with.
+    assert snapshot.validate("project", project) is None
+    # Unchanged schemas are reused.
+    assert registry.snapshot.schemas["chapter"] is snapshot.schemas["chapter"]
+
+
+def test_reload_referenced_schema(schema_directory, project):
+    registry = SchemaRegistry(schema_directory, format_profiles=(FAST,))
+
+    def limit_name(schema):
+        schema["definitions"]["person"]["properties"]["name"]["maxLength"] = 1
+
+    _edit(schema_directory / "common.json", limit_name)
+
+    assert registry.reload()
+    error = registry.validate("project", project, FAST)
+    assert error is not None
+    assert error.endswith("is too long")
+
+
+@pytest.mark.parametrize(
+    ("content", "error"),
+    [
+        ("{", ValueError),
+        ('{"type": 1}', SchemaError),
+    ],
+)
+def test_reload_invalid(schema_directory, project, content, error):
+    registry = SchemaRegistry(schema_directory)
+    snapshot = registry.snapshot
+    (schema_directory / "project.json").write_text(content)
+
+    with pytest.raises(error):
+        registry.reload()
+    assert registry.snapshot is snapshot
+    assert registry.validate("project", project) is None
+
+
+def test_check_interval(schema_directory, project):
+    registry = SchemaRegistry(schema_directory, check_interval=0)
+    project.pop("tags", None)
+
+    (schema_directory / "project.json").write_text("{")
+    assert registry.validate("project", project) is None
+    assert isinstance(registry.last_error, ValueError)
+
+    shutil.copy(SCHEMA_DIRECTORY / "project.json", schema_directory)
+    _edit(schema_directory / "project.json", _require_tags)
+    assert registry.validate("project", project) == "'tags' is a required property"
+    assert registry.last_error is None
+
+
+def test_reload_while_validating(schema_directory, project):
+    registry = SchemaRegistry(schema_directory)
+    project.pop("tags", None)
+    results = set()
+    stop = threading.Event()
+
+    def validate():
+        while not stop.is_set():
+            results.add(registry.validate("project", project))
+
+    threads = [threading.Thread(target=validate) for _ in range(THREADS)]
+    for thread in threads:
+        thread.start()
+    try:
+        for index in range(RELOADS):
+            _edit(
+                schema_directory / "project.json",
+                _require_tags if index % 2 == 0 else lambda schema: schema["required"].pop(),
+            )
+            assert registry.reload()
+    finally:
+        stop.set()
+        for thread in threads:
+            thread.join()
+
+    assert results <= {None, "'tags' is a required property"}
+    assert registry.snapshot.version == RELOADS
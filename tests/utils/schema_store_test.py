@@ -0,0 +1,81 @@
+"""Versioned schema store tests."""
+
+import json
+import shutil
+
+import pytest
+import yaml
+from referencing.exceptions import NoSuchResource
+
+from owasp_schema import __version__, get_schema, list_schemas
+from owasp_schema.utils.schema_store import SchemaStore
+from owasp_schema.utils.schema_validators import SCHEMA_DIRECTORY
+from tests.conftest import tests_data_dir
+
+OLD_VERSION = "0.1.9"
+VALID_PROJECT = tests_data_dir / "actions/validate/project/positive/valid_project.yaml"
+
+
+@pytest.fixture
+def old_schemas(tmp_path):
+    # A release limiting leader names, through the referenced common schema.
+    source = tmp_path / "source"
+    source.mkdir()
+    for schema_name in list_schemas():
+        shutil.copy(SCHEMA_DIRECTORY / f"{schema_name}.json", source)
+    common = json.loads((source / "common.json").read_text())
+    common["definitions"]["person"]["properties"]["name"]["maxLength"] = 1
+    (source / "common.json").write_text(json.dumps(common))
+    return source
+
+
+@pytest.fixture
+def project():
+    return yaml.safe_load(VALID_PROJECT.read_text())
+
+
+def test_bundled_version(tmp_path, project):
+    store = SchemaStore(tmp_path / "store")
+
+    assert store.list_versions() == [__version__]
+    assert store.get_schema("project") == get_schema("project")
+    assert store.validate("project", project) is None
+
+
+def test_versions_side_by_side(tmp_path, old_schemas, project):
+    store = SchemaStore(tmp_path / "store")
+    store.add_version(OLD_VERSION, old_schemas)
+
+    assert store.list_versions() == [OLD_VERSION, __version__]
+    assert store.validate("project", project) is None
+    error = store.validate("project", project, version=OLD_VERSION)
+    assert error is not None
+    assert error.endswith("is too long")
+
+
+def test_offline_retrieval(tmp_path):
+    registry = SchemaStore(tmp_path).get_version().registry
+
+    with pytest.raises(NoSuchResource):
+        registry.get_or_retrieve("https://example.com/common.json")
+    with pytest.raises(NoSuchResource):
+        registry.get_or_retrieve("https://raw.githubusercontent.com/OWASP/nest-schema/main/x.json")
+
+
+def test_version_cache(tmp_path, old_schemas):
+    store = SchemaStore(tmp_path, max_versions=1)
+    store.add_version(OLD_VERSION, old_schemas)
+
+    old_version = store.get_version(OLD_VERSION)
+    assert store.get_version(OLD_VERSION) is old_version
+    store.get_version()
+    assert store.get_version(OLD_VERSION) is not old_version
+
+
+def test_version_not_found(tmp_path):
+    store = SchemaStore(tmp_path)
+
+    with pytest.raises(KeyError, match="Available versions"):
+        store.get_version(OLD_VERSION)
+    with pytest.raises(ValueError, match="Invalid schema version"):
+        store.get_version("../schemas")
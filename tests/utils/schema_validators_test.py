@@ -0,0 +1,162 @@
+"""Schema validator thread safety tests."""
+
+import copy
+import random
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+import yaml
+from jsonschema.exceptions import best_match
+
+from owasp_schema import get_schema
+from owasp_schema.utils.format_engines import FAST, STRICT, get_format_checker
+from owasp_schema.utils.normalization import validate_and_normalize
+from owasp_schema.utils.schema_validators import (
+    IdentityCache,
+    ValidatorCache,
+    get_error_message,
+    get_registry,
+    get_validator,
+    validate_data,
+)
+from tests.conftest import tests_data_dir
+
+CACHE_SIZE = 2
+DOCUMENTS = 36
+ROUNDS = 1
+SWITCH_INTERVAL = 1e-5
+THREADS = 8
+
+
+@pytest.fixture
+def switch_often():
+    # Switch threads as often as possible to surface races on GIL builds too.
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(SWITCH_INTERVAL)
+    yield
+    sys.setswitchinterval(interval)
+
+
+def _run_threads(function):
+    barrier = threading.Barrier(THREADS)
+
+    def run(index):
+        barrier.wait()
+        return function(index)
+
+    with ThreadPoolExecutor(THREADS) as executor:
+        return list(executor.map(run, range(THREADS)))
+
+
+def _build(schema, format_checker):
+    return get_validator(schema).evolve(format_checker=format_checker)
+
+
+def test_identity_cache():
+    cache = IdentityCache(max_size=CACHE_SIZE)
+    schemas = [{"type": "string"} for _ in range(CACHE_SIZE + 1)]
+    for index, schema in enumerate(schemas):
+        cache.put(schema, index)
+    cache.put(schemas[1], "strict", STRICT)
+
+    assert len(cache) == CACHE_SIZE
+    assert cache.get(schemas[0]) is None
+    assert cache.get(schemas[1]) is None
+    assert cache.get(schemas[1], STRICT) == "strict"
+    assert cache.get(schemas[2]) == CACHE_SIZE
+
+
+def test_validator_cache():
+    schema = {"type": "string"}
+    cache = ValidatorCache(_build, max_size=CACHE_SIZE)
+
+    validator = cache.get(schema)
+
+    assert cache.get(schema) is validator
+    assert cache.get(schema, FAST) is not validator
+
+
+def test_validator_cache_eviction():
+    built = []
+
+    def build(schema, format_checker):
+        built.append(schema)
+        return _build(schema, format_checker)
+
+    cache = ValidatorCache(build, max_size=CACHE_SIZE)
+    schemas = [{"type": "string"} for _ in range(CACHE_SIZE + 1)]
+    for schema in schemas:
+        cache.get(schema)
+
+    assert len(cache) == CACHE_SIZE
+    cache.clear()
+    cache.get(schemas[0])
+    assert len(built) == CACHE_SIZE + 2
+
+
+def test_get_error_message():
+    validator = get_validator({"type": "string"})
+
+    assert get_error_message(validator, "valid") is None
+    assert get_error_message(validator, 1) == "1 is not of type 'string'"
+
+
+@pytest.mark.usefixtures("switch_often")
+def test_concurrent_first_use():
+    schema = {"type": "string"}
+    built = []
+
+    def build(schema, format_checker):
+        built.append(schema)
+        return _build(schema, format_checker)
+
+    cache = ValidatorCache(build)
+
+    validators = _run_threads(lambda _: cache.get(schema))
+
+    assert len(built) == 1
+    assert all(validator is validators[0] for validator in validators)
+    assert len({id(registry) for registry in _run_threads(lambda _: get_registry())}) == 1
+    assert len({id(checker) for checker in _run_threads(lambda _: get_format_checker())}) == 1
+
+
+def _documents():
+    for schema_name in ("chapter", "committee", "project"):
+        for path in sorted((tests_data_dir / "schema" / schema_name).rglob("*.yaml")):
+            yield get_schema(schema_name), yaml.safe_load(path.read_text())
+
+
+@pytest.mark.usefixtures("switch_often")
+def test_concurrent_validation():
+    cases = [
+        (
+            schema,
+            data,
+            format_profile,
+            validate_data(schema, data, format_profile),
+            validate_and_normalize(schema, copy.deepcopy(data), format_profile)[1],
+        )
+        for schema, data in random.Random(0).sample(list(_documents()), DOCUMENTS)  # noqa: S311
+        for format_profile in (FAST, STRICT)
+    ]
+    # Fewer entries than schemas and profiles, validators are evicted while in use.
+    small_cache = ValidatorCache(_build, max_size=CACHE_SIZE)
+
+    def validate(index):
+        mismatches = []
+        order = random.Random(index).sample(cases, len(cases))  # noqa: S311
+        for _ in range(ROUNDS):
+            for schema, data, format_profile, error, normalized_error in order:
+                if validate_data(schema, data, format_profile) != error:
+                    mismatches.append((data, format_profile))
+                normalized = validate_and_normalize(schema, copy.deepcopy(data), format_profile)
+                if normalized[1] != normalized_error:
+                    mismatches.append((data, format_profile))
+                validator = small_cache.get(schema, format_profile)
+                if getattr(best_match(validator.iter_errors(data)), "message", None) != error:
+                    mismatches.append((data, format_profile))
+        return mismatches
+
+    assert _run_threads(validate) == [[]] * THREADS
@@ -0,0 +1,128 @@
+"""SQLite export tests."""
+
+import sqlite3
+
+import pytest
+
+from owasp_schema.utils.sqlite_export import SqliteExporter, get_tables
+
+CORPUS_INVALID_FILES = 3
+CORPUS_VALID_FILES = 3
+PROJECT_LEVEL = 2
+
+
+@pytest.fixture
+def connection():
+    connection = sqlite3.connect(":memory:", isolation_level=None)
+    yield connection
+    connection.close()
+
+
+def test_get_tables():
+    document_table, *child_tables = get_tables("project")
+
+    assert document_table.name == "project"
+    assert {"level", "name", "type"} <= {column.name for column in document_table.columns}
+    children = {table.name: table for table in child_tables}
+    assert {"project_leaders", "project_repositories", "project_tags"} <= set(children)
+    assert children["project_tags"].is_scalar
+    assert not children["project_leaders"].is_scalar
+    assert "github" in {column.name for column in children["project_leaders"].columns}
+
+
+def test_indexes(connection):
+    SqliteExporter(connection)
+
+    indexes = {
+        row[0] for row in connection.execute("SELECT name FROM sqlite_master WHERE type = 'index'")
+    }
+    assert {
+        "ix_chapter_country",
+        "ix_project_leaders_github",
+        "ix_project_leaders_project_id",
+        "ix_project_level",
+        "ix_project_tags_value",
+    } <= indexes
+
+
+def test_export(connection, metadata_corpus):
+    stats = SqliteExporter(connection).export([metadata_corpus])
+
+    assert stats.inserted == CORPUS_VALID_FILES
+    assert stats.invalid == CORPUS_INVALID_FILES
+    assert connection.execute("SELECT name, level, type FROM project").fetchall() == [
+        ("OWASP Incubator Code Project", PROJECT_LEVEL, "code"),
+    ]
+    assert connection.execute(
+        "SELECT position, github, slack FROM project_leaders ORDER BY position",
+    ).fetchall() == [(0, "leader-1-github", None), (1, "leader-2-github", "leader-2-slack")]
+    assert connection.execute("SELECT value FROM project_audience").fetchall() == [("breaker",)]
+
+
+def test_export_unchanged(connection, metadata_corpus):
+    exporter = SqliteExporter(connection)
+    exporter.export([metadata_corpus])
+
+    stats = exporter.export([metadata_corpus])
+
+    assert stats.inserted == 0
+    assert stats.unchanged == CORPUS_VALID_FILES
+
+
+def test_export_updated(connection, metadata_corpus):
+    exporter = SqliteExporter(connection)
+    exporter.export([metadata_corpus])
+    path = metadata_corpus / "project-valid/project.owasp.yaml"
+    path.write_text(path.read_text().replace("leader-1-github", "leader-3-github"))
+
+    stats = exporter.export([metadata_corpus])
+
+    assert stats.updated == 1
+    assert stats.unchanged == CORPUS_VALID_FILES - 1
+    assert connection.execute(
+        "SELECT github FROM project_leaders ORDER BY position",
+    ).fetchall() == [
+        ("leader-3-github",),
+        ("leader-2-github",),
+    ]
+
+
+def test_export_invalid_keeps_row(connection, metadata_corpus):
+    exporter = SqliteExporter(connection)
+    exporter.export([metadata_corpus])
+    path = metadata_corpus / "project-valid/project.owasp.yaml"
+    path.write_text("audience: []\n")
+
+    stats = exporter.export([metadata_corpus / "project-valid"])
+
+    assert stats.invalid == 1
+    assert connection.execute("SELECT count(*) FROM project").fetchone() == (1,)
+
+
+def test_export_prune(connection, metadata_corpus):
+    exporter = SqliteExporter(connection)
+    exporter.export([metadata_corpus])
+
+    stats = exporter.export([metadata_corpus / "chapter-valid"], prune=True)
+
+    assert stats.deleted == CORPUS_VALID_FILES - 1
+    assert connection.execute("SELECT count(*) FROM project").fetchone() == (0,)
+    assert connection.execute("SELECT count(*) FROM project_leaders").fetchone() == (0,)
+
+
+def test_export_transactions(connection, metadata_corpus):
+    stats = SqliteExporter(connection, transaction_size=1).export([metadata_corpus])
+
+    assert stats.inserted == CORPUS_VALID_FILES
+    assert not connection.in_transaction
+
+
+def test_create_tables_adds_columns(connection):
+    connection.execute(
+        "CREATE TABLE project (id INTEGER PRIMARY KEY, path TEXT, content_hash TEXT)",
+    )
+
+    SqliteExporter(connection)
+
+    columns = {row[1] for row in connection.execute("PRAGMA table_info(project)")}
+    assert {"level", "name", "type"} <= columns
@@ -0,0 +1,118 @@
+"""Streaming validation tests."""
+
+import io
+
+import pytest
+import yaml
+
+from owasp_schema import get_schema
+from owasp_schema.utils.schema_validators import validate_data
+from owasp_schema.utils.stream_validation import StreamError, validate_stream
+from tests.conftest import tests_data_dir
+
+GITHUB_COLUMN = 13
+GITHUB_LINE = 4
+PROJECT = """\
+audience:
+  - breaker
+leaders:
+  - github: leader-1
+    name: Leader 1
+level: 2
+name: OWASP Project
+pitch: A very brief, one-line description of your project
+type: code
+"""
+
+
+@pytest.mark.parametrize("schema_name", ["chapter", "committee", "project"])
+def test_same_result_as_validate_data(schema_name):
+    schema = get_schema(schema_name)
+    for path in sorted((tests_data_dir / "schema" / schema_name).rglob("*.yaml")):
+        content = path.read_bytes()
+        error = validate_stream(schema, content)
+
+        assert (error and error.message) == validate_data(schema, yaml.safe_load(content)), path
+
+
+def test_valid():
+    assert validate_stream(get_schema("project"), PROJECT) is None
+
+
+def test_error_location():
+    content = PROJECT.replace("github: leader-1", "github: ''")
+
+    assert validate_stream(get_schema("project"), content) == StreamError(
+        message="'' does not match '^[a-zA-Z0-9-]{1,39}$'",
+        path=("leaders", 0, "github"),
+        line=GITHUB_LINE,
+        column=GITHUB_COLUMN,
+    )
+
+
+def test_rejects_before_end_of_document():
+    # The error precedes a YAML syntax error, which is never parsed.
+    content = PROJECT.replace("level: 2", "level: 7") + "tags: [unclosed\n"
+
+    error = validate_stream(get_schema("project"), content)
+
+    assert error is not None
+    assert error.path == ("level",)
+
+
+def test_required():
+    content = PROJECT.replace("name: OWASP Project\n", "")
+
+    error = validate_stream(get_schema("project"), content)
+
+    assert error is not None
+    assert error.message == "'name' is a required property"
+    assert error.path == ()
+
+
+def test_additional_properties():
+    content = PROJECT + "extra: 1\nother: 2\n"
+
+    error = validate_stream(get_schema("project"), content)
+
+    assert error is not None
+    assert error.message == validate_data(get_schema("project"), yaml.safe_load(content))
+
+
+def test_non_unique_items():
+    content = PROJECT.replace("  - breaker\n", "  - breaker\n  - breaker\n")
+
+    error = validate_stream(get_schema("project"), content)
+
+    assert error is not None
+    assert error.message.endswith("has non-unique elements")
+
+
+def test_aliases():
+    content = PROJECT.replace("  - breaker\n", "  - &audience breaker\n  - *audience\n")
+
+    error = validate_stream(get_schema("project"), content)
+
+    assert error is not None
+    assert error.message.endswith("has non-unique elements")
+
+
+def test_empty_document():
+    error = validate_stream(get_schema("project"), "")
+
+    assert error is not None
+    assert error.message == "None is not of type 'object'"
+
+
+def test_multiple_documents():
+    with pytest.raises(yaml.YAMLError):
+        validate_stream(get_schema("project"), f"{PROJECT}---\n{PROJECT}")
+
+
+def test_file_object():
+    content = PROJECT.replace("  - breaker\n", "  - breaker\n  - breaker\n")
+
+    error = validate_stream(get_schema("project"), io.BytesIO(content.encode()))
+
+    assert error is not None
+    assert error.message.endswith("has non-unique elements")
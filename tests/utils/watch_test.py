@@ -0,0 +1,72 @@
+"""Watch mode tests."""
+
+import threading
+
+from owasp_schema.utils.watch import MetadataWatcher, snapshot
+
+CORPUS_FILES = 6
+
+
+def test_snapshot(metadata_corpus, tmp_path):
+    stats = snapshot([metadata_corpus, tmp_path / "missing.owasp.yaml"])
+
+    assert len(stats) == CORPUS_FILES
+
+
+def test_start(metadata_corpus):
+    results = MetadataWatcher([metadata_corpus]).start()
+
+    assert len(results) == CORPUS_FILES
+    assert sum(result.is_valid for result in results) == CORPUS_FILES // 2
+
+
+def test_poll_changed_file_only(metadata_corpus):
+    watcher = MetadataWatcher([metadata_corpus], debounce=0)
+    watcher.start()
+    assert watcher.poll() == []
+
+    valid = metadata_corpus / "project-valid/project.owasp.yaml"
+    invalid = metadata_corpus / "project-invalid/project.owasp.yaml"
+    invalid.write_text(valid.read_text() + "\n")
+
+    results = watcher.poll()
+
+    assert [result.path for result in results] == [str(invalid)]
+    assert results[0].is_valid
+    assert watcher.poll() == []
+
+
+def test_poll_debounce(metadata_corpus):
+    watcher = MetadataWatcher([metadata_corpus], debounce=60)
+    watcher.start()
+
+    path = metadata_corpus / "chapter-valid/chapter.owasp.yaml"
+    path.write_text(path.read_text() + "\n")
+
+    assert watcher.poll() == []
+    watcher.debounce = 0
+    assert [result.path for result in watcher.poll()] == [str(path)]
+
+
+def test_poll_new_and_deleted_files(metadata_corpus):
+    watcher = MetadataWatcher([metadata_corpus], debounce=0)
+    watcher.start()
+
+    (metadata_corpus / "chapter-valid/chapter.owasp.yaml").unlink()
+    new = metadata_corpus / "new/committee.owasp.yaml"
+    new.parent.mkdir()
+    new.write_text("")
+
+    results = watcher.poll()
+
+    assert [result.path for result in results] == [str(new)]
+    assert not results[0].is_valid
+
+
+def test_watch_stop_event(metadata_corpus):
+    stop_event = threading.Event()
+    stop_event.set()
+
+    results = list(MetadataWatcher([metadata_corpus]).watch(stop_event))
+
+    assert len(results) == CORPUS_FILES
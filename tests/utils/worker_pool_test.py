@@ -0,0 +1,59 @@
+"""Prefork worker pool tests."""
+
+import gc
+
+import pytest
+
+from owasp_schema.utils import schema_validators, worker_pool
+from owasp_schema.utils.bulk_validation import SCHEMA_NAMES, warm_validators
+from owasp_schema.utils.format_engines import FAST
+from owasp_schema.utils.worker_pool import prefork_pool
+
+WORKERS = 2
+
+
+def _worker_state():
+    return len(schema_validators._validators), gc.get_freeze_count()  # noqa: SLF001
+
+
+@pytest.fixture
+def fork_context():
+    if (context := worker_pool._fork_context()) is None:  # noqa: SLF001
+        pytest.skip("fork isn't available")
+    return context
+
+
+@pytest.mark.usefixtures("fork_context")
+def test_prefork_pool():
+    schema_validators._validators.clear()  # noqa: SLF001
+
+    with prefork_pool(WORKERS, warm_validators, (FAST,)) as executor:
+        validators, freeze_count = executor.submit(_worker_state).result()
+
+    # Validators compiled in the parent are inherited and frozen.
+    assert validators >= len(SCHEMA_NAMES)
+    assert freeze_count > 0
+    assert gc.get_freeze_count() == 0
+
+
+@pytest.mark.usefixtures("fork_context")
+def test_prefork_pool_nested():
+    gc.freeze()
+    try:
+        with prefork_pool(WORKERS) as executor:
+            executor.submit(_worker_state).result()
+        assert gc.get_freeze_count() > 0
+    finally:
+        gc.unfreeze()
+
+
+def test_spawn_pool(monkeypatch):
+    monkeypatch.setattr(worker_pool, "_fork_context", lambda: None)
+    schema_validators._validators.clear()  # noqa: SLF001
+
+    with prefork_pool(1, warm_validators, (FAST,)) as executor:
+        validators, _ = executor.submit(_worker_state).result()
+
+    # Spawned workers run the initializer instead of the parent.
+    assert validators >= len(SCHEMA_NAMES)
+    assert len(schema_validators._validators) == 0  # noqa: SLF001
@@ -0,0 +1,39 @@
+"""YAML locations tests."""
+
+import pytest
+import yaml
+
+from owasp_schema.utils.yaml_locations import Location, load_with_locations, locate
+
+DOCUMENT = """\
+name: Test
+leaders:
+  - github: leader
+    name: Leader
+"""
+
+
+def test_load_with_locations():
+    data, locations = load_with_locations(DOCUMENT)
+
+    assert data == yaml.safe_load(DOCUMENT)
+    assert locations[("name",)] == Location(0, 0, 0, 4)
+    assert locations[("leaders", 0)].line == 2  # noqa: PLR2004
+    assert locations[("leaders", 0, "name")] == Location(3, 4, 3, 8)
+
+
+def test_load_empty():
+    assert load_with_locations("") == (None, {})
+
+
+def test_load_invalid():
+    with pytest.raises(yaml.YAMLError):
+        load_with_locations("name: [")
+
+
+def test_locate_parent():
+    _, locations = load_with_locations(DOCUMENT)
+
+    assert locate(locations, ["leaders", 0, "email"]) == locations[("leaders", 0)]
+    assert locate(locations, []) == locations[()]
+    assert locate({}, ["name"]) is None